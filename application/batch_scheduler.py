@@ -0,0 +1,93 @@
+from domain.interfaces import ProcessingStatus, TranscriptionOptions, TimeRange
+from domain.entities import ProcessingResult, BatchItemResult, BatchReport, CancellationToken
+from application.subtitle_service import SubtitleService
+import pathlib
+import asyncio
+import logging
+import time
+from typing import Callable, Dict, List, Optional, Union
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+class BatchScheduler:
+    """Run several videos through one SubtitleService concurrently
+
+    Files share the service and its transcriber. Only a ParallelWhisperTranscriber
+    decodes files side by side; a WhisperTranscriber takes turns on one model,
+    so callers build the former when concurrency > 1 (see transcription_workers).
+    A failing file is reported and never aborts the rest of the batch.
+    """
+
+    def __init__(
+        self,
+        subtitle_service: SubtitleService,
+        concurrency: int = 3,
+        file_progress_callback: Optional[Callable[[pathlib.Path, ProcessingResult], None]] = None,
+        file_done_callback: Optional[Callable[[BatchItemResult], None]] = None
+    ):
+        self.subtitle_service = subtitle_service
+        self.concurrency = max(1, concurrency)
+        self.file_progress_callback = file_progress_callback or (lambda path, result: None)
+        self.file_done_callback = file_done_callback or (lambda item: None)
+
+    async def run(
+        self,
+        video_paths: List[pathlib.Path],
+        targets: List[str],
+        translation_method: Union[str, Dict[str, str]] = 'GoogleTrans',
+        output_dir: Optional[pathlib.Path] = None,
+        transcription_options: Optional[TranscriptionOptions] = None,
+        source_language: Optional[str] = None,
+        cancel_token: Optional[CancellationToken] = None,
+        time_range: Optional[TimeRange] = None
+    ) -> BatchReport:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        started = time.perf_counter()
+
+        logger.info(f"Starting batch of {len(video_paths)} files, {self.concurrency} at a time")
+
+        async def process(video_path: pathlib.Path) -> BatchItemResult:
+            async with semaphore:
+                file_started = time.perf_counter()
+                try:
+                    results = await self.subtitle_service.process_video_multi(
+                        video_path, targets, translation_method, output_dir,
+                        transcription_options=transcription_options,
+                        source_language=source_language,
+                        cancel_token=cancel_token,
+                        time_range=time_range,
+                        progress_callback=lambda result: self.file_progress_callback(video_path, result)
+                    )
+                    errors = [
+                        f"{language}: {result.message}"
+                        for language, result in results.items()
+                        if result.status != ProcessingStatus.COMPLETED
+                    ]
+                    item = BatchItemResult(
+                        video_path=video_path,
+                        results=results,
+                        elapsed=time.perf_counter() - file_started,
+                        error="; ".join(errors) or None
+                    )
+                except Exception as e:
+                    logger.error(f"Batch item {video_path} failed: {e}", exc_info=True)
+                    item = BatchItemResult(
+                        video_path=video_path,
+                        results={},
+                        elapsed=time.perf_counter() - file_started,
+                        error=str(e)
+                    )
+
+                self.file_done_callback(item)
+                return item
+
+        items = await asyncio.gather(*(process(path) for path in video_paths))
+
+        report = BatchReport(items=list(items), elapsed=time.perf_counter() - started)
+
+        logger.info(
+            f"Batch finished: {report.succeeded} succeeded, {report.failed} failed "
+            f"in {report.elapsed:.1f}s ({report.files_per_hour:.1f} files/hour)"
+        )
+        return report
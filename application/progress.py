@@ -0,0 +1,98 @@
+from domain.interfaces import ProcessingStatus
+from domain.entities import ProcessingResult, ProgressEvent
+import time
+from typing import Callable, Optional, Tuple
+
+# Share of the overall progress bar given to each stage
+STAGE_SPANS = {
+    ProcessingStatus.EXTRACTING: (0.0, 0.33),
+    ProcessingStatus.TRANSCRIBING: (0.33, 0.66),
+    ProcessingStatus.TRANSLATING: (0.66, 1.0),
+}
+
+def format_duration(seconds: float) -> str:
+    """Compact human duration, e.g. 45s, 3m12s, 1h05m"""
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m{seconds % 60:02d}s"
+    return f"{seconds // 3600}h{seconds % 3600 // 60:02d}m"
+
+class StageProgress:
+    """Turns raw counters for one stage into throttled progress events
+
+    Rate and ETA are measured from the first update, so they reflect real
+    throughput rather than a fixed schedule.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[ProcessingResult], None],
+        stage: ProcessingStatus,
+        message: str,
+        total: Optional[float],
+        unit: str,
+        span: Optional[Tuple[float, float]] = None,
+        min_interval: float = 0.5
+    ):
+        self.callback = callback
+        self.stage = stage
+        self.message = message
+        self.total = total if total and total > 0 else None
+        self.unit = unit
+        self.span = span or STAGE_SPANS.get(stage, (0.0, 1.0))
+        self.min_interval = min_interval
+        self.done = 0.0
+        self.started = time.monotonic()
+        self._last_emit = 0.0
+
+    def start(self):
+        """Report the stage as started (0 done)"""
+        self.started = time.monotonic()
+        self._emit(force=True)
+
+    def update(self, done: float):
+        """Set the absolute amount done; events are rate-limited except at completion"""
+        self.done = max(self.done, done)
+        finished = self.total is not None and self.done >= self.total
+        self._emit(force=finished)
+
+    def advance(self, amount: float):
+        self.update(self.done + amount)
+
+    def event(self) -> ProgressEvent:
+        elapsed = time.monotonic() - self.started
+        fraction = min(self.done / self.total, 1.0) if self.total else None
+        rate = self.done / elapsed if elapsed > 0 and self.done > 0 else None
+        eta = (self.total - self.done) / rate if rate and self.total else None
+        return ProgressEvent(
+            stage=self.stage,
+            fraction=fraction,
+            done=self.done,
+            total=self.total,
+            unit=self.unit,
+            rate=rate,
+            eta_seconds=max(eta, 0.0) if eta is not None else None
+        )
+
+    def _emit(self, force: bool = False):
+        now = time.monotonic()
+        if not force and now - self._last_emit < self.min_interval:
+            return
+        self._last_emit = now
+
+        event = self.event()
+        start, end = self.span
+        message = self.message
+        if event.fraction is not None:
+            message += f" {event.fraction:.0%}"
+        if event.eta_seconds is not None and event.fraction and event.fraction < 1:
+            message += f", about {format_duration(event.eta_seconds)} left"
+
+        self.callback(ProcessingResult(
+            status=self.stage,
+            message=message,
+            progress=start + (end - start) * (event.fraction or 0.0),
+            event=event
+        ))
@@ -1,36 +1,93 @@
-from domain.interfaces import VideoProcessor, Transcriber, Translator, ProcessingStatus
-from domain.entities import ProcessingResult
-from infrastructure.translator import GoogleTranslatorService, ArgosTranslatorService
+from domain.interfaces import (
+    VideoProcessor, Transcriber, Translator, ProcessingStatus, TranscriptionOptions, MediaInfo, TimeRange,
+    AUDIO_SAMPLE_RATE
+)
+from domain.entities import ProcessingResult, CancellationToken, SubtitleEntry
+from application.progress import StageProgress
+from infrastructure.translator_registry import TranslatorRegistry, AUTO_METHOD
+from infrastructure.translation_executor import TranslationExecutor
+from infrastructure.transcript_cache import TranscriptCache
+from infrastructure.checkpoints import CheckpointStore, JobCheckpoint
+from infrastructure.scratch_space import ScratchSpace, ScratchJob
+from infrastructure.srt_writer import write_srt, parse_timestamp, format_timestamp
 import pathlib
 import asyncio
+import contextvars
+from dataclasses import replace
 import logging
-from typing import Callable, Optional
+import time
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Translation is split into about this many slices so completions can be counted
+TRANSLATION_PROGRESS_STEPS = 20
+MIN_TRANSLATION_SLICE = 20
+# Pipelined translation sends segments in micro-batches of up to this many,
+# waiting at most this long for a batch to fill
+PIPELINE_BATCH_SIZE = 16
+PIPELINE_BATCH_WAIT_SECONDS = 0.5
+# Bytes per second of 16-bit mono audio at Whisper's sample rate
+WAV_BYTES_PER_SECOND = AUDIO_SAMPLE_RATE * 2
+
+# Scratch directory of the job running in the current task
+current_scratch: contextvars.ContextVar[Optional[ScratchJob]] = contextvars.ContextVar(
+    "current_scratch", default=None
+)
+# Progress callback of the job running in the current task (default: the service's own)
+current_progress: contextvars.ContextVar[Optional[Callable[[ProcessingResult], None]]] = contextvars.ContextVar(
+    "current_progress", default=None
+)
+
 class SubtitleService:
     def __init__(
         self,
         video_processor: VideoProcessor,
         transcriber: Transcriber,
         translator: Translator,
-        progress_callback: Optional[Callable[[ProcessingResult], None]] = None
+        progress_callback: Optional[Callable[[ProcessingResult], None]] = None,
+        stream_audio: bool = False,
+        pipelined: bool = False,
+        translation_workers: int = 4,
+        transcript_cache: Optional[TranscriptCache] = None,
+        checkpoints: Optional[CheckpointStore] = None,
+        scratch: Optional[ScratchSpace] = None,
+        translators: Optional[TranslatorRegistry] = None
     ):
         self.video_processor = video_processor
         self.transcriber = transcriber
-        self.translators = {
-            'GoogleTrans': GoogleTranslatorService(),
-            'Argos Translate': ArgosTranslatorService()
-        }
+        # Backends are shared process-wide and constructed when a job first selects them
+        self.translators = translators or TranslatorRegistry.shared()
         self.progress_callback = progress_callback or (lambda x: None)
+        # Pipe decoded PCM straight into the transcriber instead of a temp WAV
+        self.stream_audio = stream_audio
+        # Translate segments while transcription is still running
+        self.pipelined = pipelined
+        self.translation_workers = max(1, translation_workers)
+        # Reuse transcripts across runs (e.g. a second target language)
+        self.transcript_cache = transcript_cache
+        # Resume interrupted jobs from their last finished segment
+        self.checkpoints = checkpoints
+        # Per-job temp files, removed when the job ends (default: shared scratch space)
+        self.scratch = scratch
+        # Detected source language per video fingerprint (and range start)
+        self._source_languages: Dict[str, Optional[str]] = {}
 
     async def process_video(
         self, 
         video_path: pathlib.Path, 
         target_language: str, 
-        translation_method: str = 'GoogleTrans'
+        translation_method: str = 'GoogleTrans',
+        transcription_options: Optional[TranscriptionOptions] = None,
+        source_language: Optional[str] = None,
+        cancel_token: Optional[CancellationToken] = None,
+        time_range: Optional[TimeRange] = None,
+        progress_callback: Optional[Callable[[ProcessingResult], None]] = None
     ) -> ProcessingResult:
+        unwatch = self._watch_cancellation(cancel_token)
+        unroute = self._route_progress(progress_callback)
+        scratch = self._open_scratch()
         try:
             logger.debug(f"Starting video processing for {video_path}")
             
@@ -46,51 +103,69 @@ class SubtitleService:
                 logger.warning(f"Unsupported translation method: {translation_method}")
                 translation_method = 'GoogleTrans'  # Fallback to default
             
-            # Select translator
-            translator = self.translators[translation_method]
-            
-            # Extract audio
-            logger.debug("Extracting audio from video")
-            self.progress_callback(ProcessingResult(
-                status=ProcessingStatus.EXTRACTING,
-                message="Extracting audio...",
-                progress=0.0
-            ))
-            audio_path = await self.video_processor.extract_audio(video_path)
+            stage_timings = {}
             
-            logger.debug(f"Audio extracted to {audio_path}")
-            
-            # Transcribe
-            logger.debug("Starting audio transcription")
-            self.progress_callback(ProcessingResult(
-                status=ProcessingStatus.TRANSCRIBING,
-                message="Transcribing audio...",
-                progress=0.33
-            ))
-            subtitles = await self.transcriber.transcribe(audio_path)
+            source_language, transcription_options = await self._resolve_source_language(
+                video_path, source_language, transcription_options, stage_timings, time_range
+            )
             
-            logger.debug(f"Transcription completed. Found {len(subtitles)} subtitle entries")
+            # Select translator; Auto needs the source language to pick one
+            translation_method, translator = await self._select_translator(
+                translation_method, source_language, target_language
+            )
+            checkpoint = self._job_checkpoint(video_path, transcription_options, time_range)
+            translation_key = f"{translation_method}:{source_language}:{target_language}"
             
-            # Translate
-            logger.debug(f"Translating subtitles using {translation_method}")
-            self.progress_callback(ProcessingResult(
-                status=ProcessingStatus.TRANSLATING,
-                message="Translating subtitles...",
-                progress=0.66
-            ))
+            if self.pipelined:
+                cache_key = self._transcript_cache_key(video_path, transcription_options, time_range)
+                subtitles = self._load_cached_transcript(cache_key, stage_timings)
+                if subtitles is None:
+                    subtitles = self._load_checkpointed_transcript(checkpoint, stage_timings)
+                
+                if subtitles is not None:
+                    translated_subtitles = await self._translate_all(
+                        subtitles, translator, target_language, translation_method, stage_timings,
+                        source_language, checkpoint, translation_key
+                    )
+                else:
+                    audio, media = await self._prepare_audio(video_path, stage_timings, checkpoint, time_range)
+                    
+                    logger.debug(f"Running pipelined transcription/translation using {translation_method}")
+                    subtitles, translated_subtitles = await self._run_pipeline(
+                        audio, translator, target_language, stage_timings, transcription_options,
+                        source_language, media, checkpoint, translation_key, time_range
+                    )
+                    self._store_transcript(cache_key, subtitles, video_path, transcription_options, time_range)
+            else:
+                subtitles = await self._get_transcript(
+                    video_path, stage_timings, transcription_options, checkpoint, time_range
+                )
+                translated_subtitles = await self._translate_all(
+                    subtitles, translator, target_language, translation_method, stage_timings,
+                    source_language, checkpoint, translation_key
+                )
             
-            # Use the specified translation method
-            translated_subtitles = await translator.translate(subtitles, target_language)
+            if checkpoint:
+                checkpoint.complete()
             
             logger.debug(f"Translation completed. {len(translated_subtitles)} translated subtitles")
+            logger.info("Stage timings: " + ", ".join(
+                f"{stage}={seconds:.2f}s" for stage, seconds in stage_timings.items()
+            ))
             
             return ProcessingResult(
                 status=ProcessingStatus.COMPLETED,
                 message="Processing completed successfully!",
                 progress=1.0,
-                subtitles=translated_subtitles
+                subtitles=translated_subtitles,
+                stage_timings=stage_timings
             )
             
+        except asyncio.CancelledError:
+            if not (cancel_token and cancel_token.cancelled):
+                raise
+            return self._cancelled_result()
+            
         except Exception as e:
             logger.error(f"Video processing error: {e}", exc_info=True)
             return ProcessingResult(
@@ -98,3 +173,754 @@ class SubtitleService:
                 message=f"Error: {str(e)}",
                 progress=0.0
             )
+        
+        finally:
+            self._close_scratch(scratch)
+            unroute()
+            unwatch()
+
+    async def process_video_multi(
+        self,
+        video_path: pathlib.Path,
+        targets: List[str],
+        translation_method: Union[str, Dict[str, str]] = 'GoogleTrans',
+        output_dir: Optional[pathlib.Path] = None,
+        transcription_options: Optional[TranscriptionOptions] = None,
+        source_language: Optional[str] = None,
+        cancel_token: Optional[CancellationToken] = None,
+        time_range: Optional[TimeRange] = None,
+        progress_callback: Optional[Callable[[ProcessingResult], None]] = None
+    ) -> Dict[str, ProcessingResult]:
+        """Transcribe once, then translate into every target language concurrently
+
+        translation_method may be a single method or a per-language mapping, so
+        different languages can run on different backends at the same time. One
+        SRT per successful language is written to output_dir (default: next to
+        the video) as <stem>.<lang>.srt. Returns a result per language.
+        
+        With a time_range only that part is captioned; timestamps stay on the
+        full recording's timeline. A progress_callback receives this call's
+        progress in place of the service-wide one.
+        """
+        unwatch = self._watch_cancellation(cancel_token)
+        unroute = self._route_progress(progress_callback)
+        try:
+            return await self._process_video_multi(
+                video_path, targets, translation_method, output_dir, transcription_options, source_language,
+                time_range
+            )
+        except asyncio.CancelledError:
+            if not (cancel_token and cancel_token.cancelled):
+                raise
+            result = self._cancelled_result()
+            return {language: result for language in targets}
+        finally:
+            unroute()
+            unwatch()
+
+    async def _process_video_multi(
+        self,
+        video_path: pathlib.Path,
+        targets: List[str],
+        translation_method: Union[str, Dict[str, str]],
+        output_dir: Optional[pathlib.Path],
+        transcription_options: Optional[TranscriptionOptions],
+        source_language: Optional[str],
+        time_range: Optional[TimeRange]
+    ) -> Dict[str, ProcessingResult]:
+        try:
+            logger.debug(f"Starting multi-language processing for {video_path}: {targets}")
+            
+            # Validate input
+            if not video_path.exists():
+                raise FileNotFoundError(f"Video file not found: {video_path}")
+            
+            stage_timings = {}
+            source_language, transcription_options = await self._resolve_source_language(
+                video_path, source_language, transcription_options, stage_timings, time_range
+            )
+            checkpoint = self._job_checkpoint(video_path, transcription_options, time_range)
+            # Extracted audio is only needed until the transcript exists
+            scratch = self._open_scratch()
+            try:
+                subtitles = await self._get_transcript(
+                    video_path, stage_timings, transcription_options, checkpoint, time_range
+                )
+            finally:
+                self._close_scratch(scratch)
+        
+        except Exception as e:
+            logger.error(f"Video processing error: {e}", exc_info=True)
+            return {
+                language: ProcessingResult(
+                    status=ProcessingStatus.ERROR,
+                    message=f"Error: {str(e)}",
+                    progress=0.0
+                )
+                for language in targets
+            }
+        
+        # One counter across languages so the bar tracks all of them together
+        progress = StageProgress(
+            self._job_progress_callback(),
+            ProcessingStatus.TRANSLATING,
+            f"Translating subtitles into {len(targets)} languages...",
+            total=len(subtitles) * len(targets),
+            unit="subtitles"
+        )
+        progress.start()
+        
+        output_dir = output_dir or video_path.parent
+        
+        async def translate_to(language: str) -> ProcessingResult:
+            method = (
+                translation_method.get(language, 'GoogleTrans')
+                if isinstance(translation_method, dict) else translation_method
+            )
+            if method not in self.translators:
+                logger.warning(f"Unsupported translation method: {method}")
+                method = 'GoogleTrans'  # Fallback to default
+            
+            try:
+                method, translator = await self._select_translator(method, source_language, language)
+                start = time.perf_counter()
+                translated = await self._translate_tracked(
+                    translator, subtitles, language, source_language, progress,
+                    checkpoint, f"{method}:{source_language}:{language}"
+                )
+                timings = {**stage_timings, 'translation': time.perf_counter() - start}
+                self._record_throughput(method, subtitles, timings['translation'])
+                
+                srt_path = write_srt(translated, output_dir / f"{video_path.stem}.{language}.srt")
+                logger.debug(f"Wrote {len(translated)} {language} subtitles to {srt_path}")
+                
+                return ProcessingResult(
+                    status=ProcessingStatus.COMPLETED,
+                    message=f"Subtitles written to {srt_path}",
+                    progress=1.0,
+                    subtitles=translated,
+                    stage_timings=timings
+                )
+            except Exception as e:
+                # One failing language must not discard the others
+                logger.error(f"Translation to {language} failed: {e}", exc_info=True)
+                return ProcessingResult(
+                    status=ProcessingStatus.ERROR,
+                    message=f"Error: {str(e)}",
+                    progress=0.0
+                )
+        
+        results = await asyncio.gather(*(translate_to(language) for language in targets))
+        # Keep resume state until every language has made it
+        if checkpoint and all(result.status == ProcessingStatus.COMPLETED for result in results):
+            checkpoint.complete()
+        return dict(zip(targets, results))
+
+    @staticmethod
+    def _watch_cancellation(cancel_token: Optional[CancellationToken]) -> Callable[[], None]:
+        """Cancel the current task when the token fires, from any thread
+
+        Whatever is being awaited is interrupted: FFmpeg is killed by the
+        extractor's cleanup and queued transcription and translation work is
+        dropped. Returns a function that stops watching.
+        """
+        if cancel_token is None:
+            return lambda: None
+        loop = asyncio.get_running_loop()
+        task = asyncio.current_task()
+        return cancel_token.on_cancel(lambda: loop.call_soon_threadsafe(task.cancel))
+
+    @staticmethod
+    def _route_progress(progress_callback: Optional[Callable[[ProcessingResult], None]]) -> Callable[[], None]:
+        """Send this task's progress to progress_callback; returns a function that stops it
+
+        Jobs sharing the service each report through their own callback
+        without touching the shared progress_callback attribute.
+        """
+        if progress_callback is None:
+            return lambda: None
+        token = current_progress.set(progress_callback)
+        return lambda: current_progress.reset(token)
+
+    def _job_progress_callback(self) -> Callable[[ProcessingResult], None]:
+        return current_progress.get() or self.progress_callback
+
+    def _cancelled_result(self) -> ProcessingResult:
+        # The cancellation was requested and handled here; callers carry on normally
+        task = asyncio.current_task()
+        if hasattr(task, 'uncancel'):
+            task.uncancel()
+        logger.info("Processing cancelled")
+        message = "Processing cancelled"
+        if self.checkpoints:
+            message += "; finished work is saved and a re-run resumes from there"
+        return ProcessingResult(status=ProcessingStatus.CANCELLED, message=message, progress=0.0)
+
+    def _open_scratch(self) -> contextvars.Token:
+        """Give the current task its own scratch directory"""
+        return current_scratch.set((self.scratch or ScratchSpace.shared()).job())
+
+    @staticmethod
+    def _close_scratch(token: contextvars.Token):
+        current_scratch.get().close()
+        current_scratch.reset(token)
+
+    @staticmethod
+    def _scratch_audio_path(
+        video_path: pathlib.Path,
+        media: Optional[MediaInfo],
+        time_range: Optional[TimeRange] = None
+    ) -> Optional[pathlib.Path]:
+        """Where this job's extracted WAV goes; None leaves it to the video processor"""
+        scratch = current_scratch.get()
+        if scratch is None:
+            return None
+        expected_bytes = int(media.duration * WAV_BYTES_PER_SECOND) if media else None
+        return scratch.path_for(video_path, ".wav", expected_bytes, variant=str(time_range))
+
+    def _job_checkpoint(
+        self,
+        video_path: pathlib.Path,
+        options: Optional[TranscriptionOptions] = None,
+        time_range: Optional[TimeRange] = None
+    ) -> Optional[JobCheckpoint]:
+        if not self.checkpoints:
+            return None
+        return self.checkpoints.job(video_path, self._transcript_settings(options, time_range))
+
+    def _transcript_settings(
+        self,
+        options: Optional[TranscriptionOptions] = None,
+        time_range: Optional[TimeRange] = None
+    ) -> dict:
+        """Everything that shapes a transcript: transcriber settings and the captioned range"""
+        settings = self.transcriber.describe_settings(options)
+        if time_range:
+            settings = {**settings, "time_range": [time_range.start, time_range.end]}
+        return settings
+
+    async def _resolve_source_language(
+        self,
+        video_path: pathlib.Path,
+        source_language: Optional[str],
+        options: Optional[TranscriptionOptions],
+        stage_timings: dict,
+        time_range: Optional[TimeRange] = None
+    ):
+        """Settle the source language once per file and pin it for transcription
+
+        An explicit language wins; otherwise the transcriber detects it once from
+        the start of the captioned range and the result is remembered per video
+        and range start, so Whisper never re-detects and the translators use the
+        same language. Returns (language, options).
+        """
+        language = source_language or (options.language if options else None)
+        
+        if not language:
+            from_start = time_range is None or time_range.start == 0
+            key = TranscriptCache.fingerprint(video_path)
+            if not from_start:
+                key = f"{key}@{time_range.start}"
+            if key not in self._source_languages:
+                # The persistent cache holds the language of the recording's opening
+                cache = self.transcript_cache if from_start else None
+                language = cache.get_language(video_path) if cache else None
+                if language is None:
+                    start = time.perf_counter()
+                    language = await self.transcriber.detect_language(video_path, options, time_range=time_range)
+                    stage_timings['language_detection'] = time.perf_counter() - start
+                    logger.debug(f"Detected source language: {language}")
+                    if language and cache:
+                        cache.put_language(video_path, language)
+                self._source_languages[key] = language
+            language = self._source_languages[key]
+        
+        if language:
+            options = replace(options or TranscriptionOptions(), language=language)
+        return language, options
+
+    async def _get_transcript(
+        self,
+        video_path: pathlib.Path,
+        stage_timings: dict,
+        options: Optional[TranscriptionOptions] = None,
+        checkpoint: Optional[JobCheckpoint] = None,
+        time_range: Optional[TimeRange] = None
+    ):
+        """Return the transcript from cache, or extract and transcribe the video"""
+        cache_key = self._transcript_cache_key(video_path, options, time_range)
+        subtitles = self._load_cached_transcript(cache_key, stage_timings)
+        if subtitles is None:
+            subtitles = self._load_checkpointed_transcript(checkpoint, stage_timings)
+        if subtitles is not None:
+            return subtitles
+        
+        audio, media = await self._prepare_audio(video_path, stage_timings, checkpoint, time_range)
+        progress = self._transcription_progress(media, "Transcribing audio...")
+        
+        transcription_start = time.perf_counter()
+        if checkpoint:
+            subtitles = [
+                entry async for entry in
+                self._checkpointed_stream(audio, options, media, checkpoint, progress.update, time_range)
+            ]
+        else:
+            subtitles = await self.transcriber.transcribe(
+                audio, options, media=media, progress_callback=progress.update
+            )
+            if time_range and time_range.start:
+                subtitles = [self._shifted(entry, time_range.start) for entry in subtitles]
+        stage_timings['transcription'] = time.perf_counter() - transcription_start
+        
+        logger.debug(f"Transcription completed. Found {len(subtitles)} subtitle entries")
+        self._store_transcript(cache_key, subtitles, video_path, options, time_range)
+        return subtitles
+
+    def _load_cached_transcript(self, cache_key: Optional[str], stage_timings: dict):
+        """A cached transcript skips extraction and transcription entirely"""
+        subtitles = self.transcript_cache.get(cache_key) if cache_key else None
+        if subtitles is not None:
+            logger.debug(f"Transcript cache hit. Reusing {len(subtitles)} subtitle entries")
+            stage_timings.update(extraction=0.0, transcription=0.0)
+        return subtitles
+
+    def _load_checkpointed_transcript(self, checkpoint: Optional[JobCheckpoint], stage_timings: dict):
+        """A transcript finished by an interrupted run goes straight to translation"""
+        if not checkpoint:
+            return None
+        subtitles, _, complete = checkpoint.load_transcript()
+        if not complete:
+            return None
+        logger.info(f"Resuming after transcription with {len(subtitles)} checkpointed subtitle entries")
+        stage_timings.update(extraction=0.0, transcription=0.0)
+        return subtitles
+
+    async def _checkpointed_stream(
+        self,
+        audio,
+        options: Optional[TranscriptionOptions],
+        media: Optional[MediaInfo],
+        checkpoint: JobCheckpoint,
+        progress_callback: Callable[[float], None],
+        time_range: Optional[TimeRange] = None
+    ):
+        """Transcribe from the last finished window, logging every segment as it arrives
+
+        Segments of a window that never finished are dropped and decoded again.
+        """
+        done, resume_at, _ = checkpoint.load_transcript()
+        checkpoint.reset_transcript(done, resume_at)
+        if resume_at > 0:
+            logger.info(f"Resuming transcription at {resume_at:.1f}s after {len(done)} checkpointed segments")
+            audio = await self._skip_audio(audio, resume_at, checkpoint, media, time_range)
+            progress_callback(resume_at)
+        # Transcriber timestamps start at zero for the audio it was given
+        offset = resume_at + (time_range.start if time_range else 0.0)
+        
+        for entry in done:
+            yield entry
+        
+        position = resume_at
+        
+        def on_window(seconds: float):
+            nonlocal position
+            position = resume_at + seconds
+            checkpoint.mark_transcribed(position)
+            progress_callback(position)
+        
+        index = len(done)
+        async for entry in self.transcriber.transcribe_stream(audio, options, media, progress_callback=on_window):
+            index += 1
+            entry = self._shifted(entry, offset, index)
+            checkpoint.append_segment(entry)
+            yield entry
+        
+        checkpoint.mark_transcribed(position, complete=True)
+
+    async def _skip_audio(
+        self,
+        audio,
+        seconds: float,
+        checkpoint: JobCheckpoint,
+        media: Optional[MediaInfo] = None,
+        time_range: Optional[TimeRange] = None
+    ):
+        """Audio input starting the given number of seconds in"""
+        if isinstance(audio, pathlib.Path) and audio == checkpoint.audio_path:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, checkpoint.read_audio, seconds)
+        if isinstance(audio, pathlib.Path):
+            # The source itself, handed over without extraction; extract just the rest
+            start = seconds + (time_range.start if time_range else 0.0)
+            remaining = TimeRange(start, time_range.end if time_range else None)
+            return await self.video_processor.extract_audio(
+                audio, media=media, time_range=remaining,
+                output_path=self._scratch_audio_path(audio, media, remaining)
+            )
+        return self._skip_stream(audio, seconds)
+
+    async def _skip_stream(self, stream, seconds: float):
+        """Drop the first seconds of a PCM chunk stream"""
+        skip = int(seconds * AUDIO_SAMPLE_RATE)
+        async for chunk in stream:
+            if skip >= len(chunk):
+                skip -= len(chunk)
+                continue
+            yield chunk[skip:]
+            skip = 0
+
+    @staticmethod
+    def _shifted(entry, offset: float, index: Optional[int] = None):
+        """Entry moved offset seconds along the timeline, optionally renumbered"""
+        return replace(
+            entry,
+            index=entry.index if index is None else index,
+            start_time=format_timestamp(offset + parse_timestamp(entry.start_time)),
+            end_time=format_timestamp(offset + parse_timestamp(entry.end_time))
+        ) if offset else replace(entry, index=entry.index if index is None else index)
+
+    async def _shifted_stream(self, stream, offset: float):
+        async for entry in stream:
+            yield self._shifted(entry, offset)
+
+    def _transcription_progress(self, media: Optional[MediaInfo], message: str) -> StageProgress:
+        """Progress measured in seconds of media transcribed against the probed duration"""
+        logger.debug("Starting audio transcription")
+        progress = StageProgress(
+            self._job_progress_callback(),
+            ProcessingStatus.TRANSCRIBING,
+            message,
+            total=media.duration if media else None,
+            unit="s"
+        )
+        progress.start()
+        return progress
+
+    def _store_transcript(
+        self,
+        cache_key: Optional[str],
+        subtitles,
+        video_path: pathlib.Path,
+        options: Optional[TranscriptionOptions] = None,
+        time_range: Optional[TimeRange] = None
+    ):
+        if cache_key:
+            self.transcript_cache.put(
+                cache_key, subtitles, video_path, self._transcript_settings(options, time_range)
+            )
+
+    async def _prepare_audio(
+        self,
+        video_path: pathlib.Path,
+        stage_timings: dict,
+        checkpoint: Optional[JobCheckpoint] = None,
+        time_range: Optional[TimeRange] = None
+    ):
+        """Probe the video once, then extract audio to a file or open a PCM stream
+
+        Returns (audio, media); media is None when the video cannot be probed.
+        With a time_range, media.duration is the length of the range.
+        """
+        logger.debug("Extracting audio from video")
+        probe_start = time.perf_counter()
+        media = self._clip_media(await self._probe(video_path), time_range)
+        stage_timings['probe'] = time.perf_counter() - probe_start
+        
+        if checkpoint and checkpoint.has_audio() and not self.stream_audio:
+            logger.info(f"Reusing checkpointed audio {checkpoint.audio_path}")
+            stage_timings['extraction'] = 0.0
+            return checkpoint.audio_path, media
+        
+        # FFmpeg reports its position in the input, measured against the probed duration
+        progress = StageProgress(
+            self._job_progress_callback(),
+            ProcessingStatus.EXTRACTING,
+            "Extracting audio...",
+            total=media.duration if media else None,
+            unit="s"
+        )
+        progress.start()
+        
+        if self.stream_audio:
+            # Extraction overlaps transcription; timed until the stream is drained
+            logger.debug("Streaming audio directly into the transcriber")
+            return self._timed_stream(
+                self.video_processor.stream_audio(video_path, media=media, time_range=time_range),
+                stage_timings,
+                'extraction'
+            ), media
+        
+        extraction_start = time.perf_counter()
+        audio = await self.video_processor.extract_audio(
+            video_path, media=media, progress_callback=progress.update, time_range=time_range,
+            output_path=self._scratch_audio_path(video_path, media, time_range)
+        )
+        stage_timings['extraction'] = time.perf_counter() - extraction_start
+        # The source itself may come back when it needs no extraction; never move that
+        if checkpoint and audio != video_path:
+            audio = checkpoint.save_audio(audio)
+        logger.debug(f"Audio extracted to {audio}")
+        return audio, media
+
+    @staticmethod
+    def _clip_media(media: Optional[MediaInfo], time_range: Optional[TimeRange]) -> Optional[MediaInfo]:
+        """Media as seen through the time range, so progress and ETA cover only the clip"""
+        if media is None or time_range is None:
+            return media
+        if media.duration <= 0:
+            # Length unknown to ffprobe: only a closed range gives the clip a duration
+            end = time_range.end if time_range.end is not None else time_range.start
+            return replace(media, duration=end - time_range.start)
+        if time_range.start >= media.duration:
+            raise ValueError(
+                f"Time range starts at {time_range.start:.1f}s, after the end of the video ({media.duration:.1f}s)"
+            )
+        end = min(time_range.end, media.duration) if time_range.end is not None else media.duration
+        return replace(media, duration=end - time_range.start)
+
+    async def _probe(self, video_path: pathlib.Path) -> Optional[MediaInfo]:
+        """Media metadata shared by extraction, transcription and progress reporting"""
+        try:
+            media = await self.video_processor.probe(video_path)
+        except FileNotFoundError:
+            raise
+        except Exception as e:
+            # Metadata only improves extraction and ETA; carry on without it
+            logger.warning(f"Could not probe {video_path}: {e}")
+            return None
+        
+        if media:
+            logger.debug(f"Media: {media.duration:.1f}s, audio {media.audio_codec} "
+                         f"{media.sample_rate} Hz x{media.channels}")
+        return media
+
+    async def _translate_all(
+        self,
+        subtitles,
+        translator,
+        target_language: str,
+        translation_method: str,
+        stage_timings: dict,
+        source_language: Optional[str] = None,
+        checkpoint: Optional[JobCheckpoint] = None,
+        checkpoint_key: Optional[str] = None
+    ):
+        """Translate a complete transcript, counting subtitles as slices finish"""
+        logger.debug(f"Translating subtitles using {translation_method}")
+        progress = StageProgress(
+            self._job_progress_callback(),
+            ProcessingStatus.TRANSLATING,
+            "Translating subtitles...",
+            total=len(subtitles),
+            unit="subtitles"
+        )
+        progress.start()
+        
+        translation_start = time.perf_counter()
+        translated_subtitles = await self._translate_tracked(
+            translator, subtitles, target_language, source_language, progress, checkpoint, checkpoint_key
+        )
+        stage_timings['translation'] = time.perf_counter() - translation_start
+        self._record_throughput(translation_method, subtitles, stage_timings['translation'])
+        return translated_subtitles
+    
+    async def _select_translator(
+        self,
+        method: str,
+        source_language: Optional[str],
+        target_language: str
+    ) -> Tuple[str, Translator]:
+        """Backend name and instance for a job; Auto routes to the fastest backend for the pair"""
+        def select():
+            name = self.translators.route(source_language, target_language) if method == AUTO_METHOD else method
+            return name, self.translators[name]
+        
+        # Constructing a backend imports its libraries and may read installed packages
+        return await TranslationExecutor.shared().run(select)
+    
+    def _record_throughput(self, method: str, subtitles: List[SubtitleEntry], seconds: float):
+        """Feed measured speed back to the router"""
+        self.translators.record(method, sum(len(subtitle.text) for subtitle in subtitles), seconds)
+
+    async def _translate_tracked(
+        self,
+        translator,
+        subtitles,
+        target_language: str,
+        source_language: Optional[str],
+        progress: StageProgress,
+        checkpoint: Optional[JobCheckpoint] = None,
+        checkpoint_key: Optional[str] = None
+    ):
+        """Translate in slices, a few at a time, reporting each finished slice
+
+        With a checkpoint, finished slices are saved and already saved
+        subtitles are not translated again.
+        """
+        done = checkpoint.load_translations(checkpoint_key) if checkpoint else {}
+        pending = [entry for entry in subtitles if entry.index not in done]
+        if done:
+            logger.info(f"Resuming translation to {target_language}: "
+                        f"{len(subtitles) - len(pending)}/{len(subtitles)} subtitles already done")
+            progress.advance(len(subtitles) - len(pending))
+        
+        size = max(MIN_TRANSLATION_SLICE, -(-len(pending) // TRANSLATION_PROGRESS_STEPS))
+        slices = [pending[start:start + size] for start in range(0, len(pending), size)]
+        semaphore = asyncio.Semaphore(self.translation_workers)
+        
+        async def translate_slice(part):
+            async with semaphore:
+                translated = await translator.translate(part, target_language, source_language=source_language)
+            if checkpoint:
+                checkpoint.append_translations(checkpoint_key, translated)
+            progress.advance(len(part))
+            return translated
+        
+        results = await asyncio.gather(*(translate_slice(part) for part in slices))
+        if not done:
+            return [entry for part in results for entry in part]
+        
+        translated = {**done, **{entry.index: entry for part in results for entry in part}}
+        return [translated.get(entry.index, entry) for entry in subtitles]
+
+    def _transcript_cache_key(
+        self,
+        video_path: pathlib.Path,
+        options: Optional[TranscriptionOptions] = None,
+        time_range: Optional[TimeRange] = None
+    ) -> Optional[str]:
+        """Cache key for this video and the effective transcription settings"""
+        if not self.transcript_cache:
+            return None
+        return self.transcript_cache.make_key(video_path, self._transcript_settings(options, time_range))
+
+    async def _run_pipeline(
+        self,
+        audio,
+        translator,
+        target_language: str,
+        stage_timings: dict,
+        options: Optional[TranscriptionOptions] = None,
+        source_language: Optional[str] = None,
+        media: Optional[MediaInfo] = None,
+        checkpoint: Optional[JobCheckpoint] = None,
+        checkpoint_key: Optional[str] = None,
+        time_range: Optional[TimeRange] = None
+    ):
+        """Translate segments from a queue while the transcriber keeps decoding"""
+        clip_start = time_range.start if time_range else 0.0
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.translation_workers * PIPELINE_BATCH_SIZE)
+        done = checkpoint.load_translations(checkpoint_key) if checkpoint else {}
+        transcribed = []
+        translated = {}
+        translation_window = []
+        translation_progress: List[StageProgress] = []
+        
+        async def produce():
+            start = time.perf_counter()
+            # Translation keeps pace with transcription, so segment timestamps drive progress
+            progress = self._transcription_progress(media, "Transcribing and translating...")
+            if checkpoint:
+                stream = self._checkpointed_stream(
+                    audio, options, media, checkpoint, progress.update, time_range
+                )
+            else:
+                stream = self._shifted_stream(self.transcriber.transcribe_stream(audio, options, media), clip_start)
+            async for entry in stream:
+                transcribed.append(entry)
+                await queue.put(entry)
+                progress.update(parse_timestamp(entry.end_time) - clip_start)
+            stage_timings['transcription'] = time.perf_counter() - start
+            
+            # From here on only the translation backlog is left
+            remaining = StageProgress(
+                self._job_progress_callback(),
+                ProcessingStatus.TRANSLATING,
+                "Translating remaining subtitles...",
+                total=len(transcribed),
+                unit="subtitles"
+            )
+            remaining.done = len(translated)
+            remaining.start()
+            translation_progress.append(remaining)
+            
+            # One sentinel per worker
+            for _ in range(self.translation_workers):
+                await queue.put(None)
+        
+        async def next_batch():
+            """Up to PIPELINE_BATCH_SIZE queued segments, and whether this worker's sentinel came"""
+            loop = asyncio.get_running_loop()
+            batch = []
+            deadline = None
+            while len(batch) < PIPELINE_BATCH_SIZE:
+                if deadline is None:
+                    entry = await queue.get()
+                else:
+                    timeout = deadline - loop.time()
+                    try:
+                        entry = queue.get_nowait() if timeout <= 0 else await asyncio.wait_for(queue.get(), timeout)
+                    except (asyncio.QueueEmpty, asyncio.TimeoutError):
+                        break
+                if entry is None:
+                    return batch, True
+                batch.append(entry)
+                deadline = deadline or loop.time() + PIPELINE_BATCH_WAIT_SECONDS
+            return batch, False
+        
+        async def consume():
+            finished = False
+            while not finished:
+                batch, finished = await next_batch()
+                
+                for entry in batch:
+                    if entry.index in done:
+                        translated[entry.index] = done[entry.index]
+                pending = [entry for entry in batch if entry.index not in done]
+                if pending:
+                    # One call per batch lets the translator batch requests and cache lookups
+                    start = time.perf_counter()
+                    results = await translator.translate(pending, target_language, source_language=source_language)
+                    translation_window.append((start, time.perf_counter()))
+                    if results and len(results) == len(pending):
+                        for result, entry in zip(results, pending):
+                            translated[entry.index] = result
+                        if checkpoint:
+                            checkpoint.append_translations(checkpoint_key, results)
+                    else:
+                        # Keep the originals, but not in the checkpoint: a resumed job retries them
+                        logger.warning(f"Translator returned {len(results or [])} results for {len(pending)} "
+                                       f"subtitles; keeping them untranslated")
+                        for entry in pending:
+                            translated[entry.index] = entry
+                if translation_progress:
+                    translation_progress[0].update(len(translated))
+        
+        tasks = [asyncio.create_task(produce())]
+        tasks += [asyncio.create_task(consume()) for _ in range(self.translation_workers)]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        
+        # Wall-clock span from the first translation call to the last
+        if translation_window:
+            stage_timings['translation'] = (
+                max(end for _, end in translation_window) -
+                min(start for start, _ in translation_window)
+            )
+        else:
+            stage_timings['translation'] = 0.0
+        
+        # Restore transcript order regardless of which worker finished first
+        return transcribed, [translated[index] for index in sorted(translated)]
+
+    async def _timed_stream(self, stream, stage_timings: dict, stage: str):
+        """Pass a chunk stream through, recording how long it took to drain"""
+        start = time.perf_counter()
+        async for chunk in stream:
+            yield chunk
+        stage_timings[stage] = time.perf_counter() - start
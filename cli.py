@@ -0,0 +1,281 @@
+"""Headless batch captioning: python -m cli VIDEO [VIDEO ...] -l es -l fr
+
+Drives SubtitleService directly without PyQt6 and prints one JSON object per
+line on stdout (progress, per-language results, and a final summary).
+"""
+import argparse
+import asyncio
+import glob
+import json
+import logging
+import pathlib
+import signal
+import sys
+import time
+from typing import List
+from domain.interfaces import ProcessingStatus, TimeRange
+
+logger = logging.getLogger(__name__)
+
+# Files picked up from a directory input, as offered by the GUI file dialogs
+VIDEO_EXTENSIONS = (".mp4", ".avi", ".mov", ".mkv")
+
+def emit(event: str, **fields):
+    """Write one JSON line to stdout"""
+    print(json.dumps({"event": event, "time": round(time.time(), 3), **fields}, ensure_ascii=False), flush=True)
+
+def expand_inputs(patterns: List[str]) -> List[pathlib.Path]:
+    """Expand files, directories and glob patterns, keeping order and dropping duplicates
+
+    A directory contributes the video files directly inside it.
+    """
+    paths = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True)) if glob.has_magic(pattern) else [pattern]
+        for match in matches:
+            path = pathlib.Path(match)
+            if path.is_dir():
+                found = sorted(child for child in path.iterdir() if child.suffix.lower() in VIDEO_EXTENSIONS)
+            else:
+                found = [path]
+            for video in found:
+                if video not in paths:
+                    paths.append(video)
+    return paths
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m cli",
+        description="Generate translated subtitles for video files without the GUI"
+    )
+    parser.add_argument("inputs", nargs="+", help="Video files, directories or glob patterns (quote globs)")
+    parser.add_argument(
+        "-l", "--target", dest="targets", action="append", required=True,
+        help="Target language code; repeat or comma-separate for several (e.g. -l es,fr)"
+    )
+    parser.add_argument(
+        "-m", "--method", default="GoogleTrans", choices=["GoogleTrans", "Argos Translate", "Auto"],
+        help="Translation method"
+    )
+    parser.add_argument(
+        "-s", "--source", dest="source_language",
+        help="Spoken language code of the videos; detected once per file when omitted"
+    )
+    parser.add_argument("-j", "--concurrency", type=int, default=1, help="Videos processed at once")
+    parser.add_argument("-o", "--output-dir", type=pathlib.Path, help="SRT output directory (default: next to each video)")
+    parser.add_argument("--model", default="base", help="Whisper model name")
+    parser.add_argument(
+        "--preset", default="default",
+        help="Decode preset: fast, fast-int8, balanced, default or accurate (overrides --model size)"
+    )
+    parser.add_argument("--beam-size", type=int, help="Beam search width (overrides the preset)")
+    parser.add_argument("--int8", action="store_true", help="Use an int8-quantized model on CPU")
+    parser.add_argument("--workers", type=int, default=1, help="Transcription worker processes (on CPU, at least --concurrency)")
+    parser.add_argument("--stream", action="store_true", help="Stream PCM from FFmpeg instead of a temp WAV")
+    parser.add_argument("--extractions", type=int, default=2, help="FFmpeg audio extractions to run at once")
+    parser.add_argument(
+        "--extraction-timeout", type=float,
+        help="Abort an audio extraction after this many seconds (default: no limit)"
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Disable the transcript cache")
+    parser.add_argument("--start", type=parse_clock, help="Caption from this position (seconds or [HH:]MM:SS)")
+    parser.add_argument("--end", type=parse_clock, help="Caption up to this position (seconds or [HH:]MM:SS)")
+    parser.add_argument("--scratch-dir", type=pathlib.Path, help="Directory for temporary audio files")
+    parser.add_argument("--scratch-quota-gb", type=float, default=4.0, help="Disk limit for temporary audio files")
+    parser.add_argument("--ram-scratch", action="store_true", help="Keep small temporary files in /dev/shm")
+    parser.add_argument("--no-resume", action="store_true", help="Do not checkpoint or resume interrupted jobs")
+    parser.add_argument(
+        "--refresh-argos-index", action="store_true",
+        help="Download the Argos package index now instead of when it expires"
+    )
+    parser.add_argument(
+        "--translation-threads", type=int, default=8,
+        help="Blocking translation calls (HTTP requests, Argos batches) run at once"
+    )
+    parser.add_argument(
+        "--debug-loop", action="store_true",
+        help="asyncio debug mode; report calls that block the event loop"
+    )
+    parser.add_argument("-v", "--verbose", action="store_true", help="Debug logging on stderr")
+    args = parser.parse_args(argv)
+    args.targets = [code.strip() for value in args.targets for code in value.split(",") if code.strip()]
+    return args
+
+def parse_clock(value: str) -> float:
+    """Seconds from plain seconds ("90") or a clock ("1:30", "01:01:30.5")"""
+    try:
+        seconds = 0.0
+        for part in value.split(":"):
+            seconds = seconds * 60 + float(part)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid time '{value}', use seconds or [HH:]MM:SS")
+    return seconds
+
+def build_service(args: argparse.Namespace):
+    """Wire SubtitleService with headless infrastructure (no Qt imports)"""
+    from application.subtitle_service import SubtitleService
+    from infrastructure.video_processor import MoviePyVideoProcessor
+    from infrastructure.transcript_cache import TranscriptCache
+    from infrastructure.checkpoints import CheckpointStore
+    from infrastructure.scratch_space import ScratchSpace
+    from infrastructure.translation_executor import TranslationExecutor
+
+    TranslationExecutor.configure(args.translation_threads)
+    from infrastructure.parallel_transcriber import ParallelWhisperTranscriber, transcription_workers
+    workers = transcription_workers(args.workers, args.concurrency)
+    if workers > 1:
+        transcriber = ParallelWhisperTranscriber(model_name=args.model, workers=workers)
+    else:
+        from infrastructure.transcriber import WhisperTranscriber
+        transcriber = WhisperTranscriber(model_name=args.model)
+
+    scratch = ScratchSpace(
+        args.scratch_dir,
+        quota_bytes=int(args.scratch_quota_gb * 1024 ** 3),
+        use_ram=args.ram_scratch
+    )
+    return SubtitleService(
+        video_processor=MoviePyVideoProcessor(
+            max_concurrent_extractions=args.extractions,
+            timeout=args.extraction_timeout
+        ),
+        transcriber=transcriber,
+        translator=None,
+        stream_audio=args.stream,
+        transcript_cache=None if args.no_cache else TranscriptCache(),
+        checkpoints=None if args.no_resume else CheckpointStore(scratch.checkpoint_root),
+        scratch=scratch
+    )
+
+def build_transcription_options(args: argparse.Namespace):
+    """Resolve --preset plus explicit overrides into TranscriptionOptions"""
+    from dataclasses import replace
+    from infrastructure.transcriber import DECODE_PRESETS
+
+    if args.preset not in DECODE_PRESETS:
+        raise ValueError(f"Unknown preset '{args.preset}', choose from {', '.join(DECODE_PRESETS)}")
+
+    options = DECODE_PRESETS[args.preset]
+    if args.beam_size is not None:
+        options = replace(options, beam_size=args.beam_size)
+    if args.int8:
+        options = replace(options, quantize_int8=True)
+    return options
+
+async def run(args: argparse.Namespace) -> int:
+    from application.batch_scheduler import BatchScheduler
+    from domain.entities import CancellationToken
+    from infrastructure.startup_profile import StartupProfile
+
+    startup = StartupProfile()
+
+    videos = expand_inputs(args.inputs)
+    if not videos:
+        emit("error", message="No input files matched")
+        return 2
+
+    try:
+        options = build_transcription_options(args)
+        time_range = TimeRange(args.start or 0.0, args.end) if args.start or args.end else None
+    except ValueError as e:
+        emit("error", message=str(e))
+        return 2
+
+    def on_progress(video, result):
+        event = result.event
+        emit(
+            "progress",
+            file=str(video),
+            status=result.status.value,
+            progress=round(result.progress, 4),
+            message=result.message,
+            done=event.done if event else None,
+            total=event.total if event else None,
+            unit=event.unit if event else None,
+            rate=round(event.rate, 3) if event and event.rate else None,
+            eta=round(event.eta_seconds, 1) if event and event.eta_seconds is not None else None
+        )
+
+    def on_done(item):
+        for language, result in item.results.items():
+            if result.status == ProcessingStatus.COMPLETED:
+                emit(
+                    "completed",
+                    file=str(item.video_path),
+                    language=language,
+                    message=result.message,
+                    subtitles=len(result.subtitles),
+                    timings=result.stage_timings
+                )
+            elif result.status == ProcessingStatus.CANCELLED:
+                emit("cancelled", file=str(item.video_path), language=language, message=result.message)
+            else:
+                emit("error", file=str(item.video_path), language=language, message=result.message)
+        if not item.results:
+            emit("error", file=str(item.video_path), message=item.error)
+
+    service = build_service(args)
+    startup.mark("services")
+    if args.refresh_argos_index:
+        # Explicit network step; otherwise the cached index is used until it expires
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                None, lambda: service.translators['Argos Translate'].refresh_package_index(force=True)
+            )
+            startup.mark("argos index refresh")
+        except Exception as e:
+            emit("error", message=f"Argos package index refresh failed: {e}")
+            return 1
+    startup.log()
+
+    scheduler = BatchScheduler(
+        service,
+        concurrency=args.concurrency,
+        file_progress_callback=on_progress,
+        file_done_callback=on_done
+    )
+    # Ctrl-C stops FFmpeg and pending work but keeps checkpoints for the next run
+    cancel_token = CancellationToken()
+    loop = asyncio.get_running_loop()
+    try:
+        loop.add_signal_handler(signal.SIGINT, cancel_token.cancel)
+    except (NotImplementedError, RuntimeError):
+        # Windows event loops have no signal handlers; Ctrl-C still aborts the run
+        pass
+
+    report = await scheduler.run(
+        videos, args.targets, args.method, args.output_dir,
+        transcription_options=options, source_language=args.source_language,
+        cancel_token=cancel_token, time_range=time_range
+    )
+
+    emit(
+        "summary",
+        files=len(report.items),
+        languages=len(args.targets),
+        succeeded=report.succeeded,
+        failed=report.failed,
+        elapsed=round(report.elapsed, 3),
+        files_per_hour=round(report.files_per_hour, 2)
+    )
+    if cancel_token.cancelled:
+        return 130
+    return 1 if report.failed else 0
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+
+    # Keep stdout for JSON lines; logs go to stderr
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.WARNING,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        stream=sys.stderr
+    )
+    from infrastructure.loop_monitor import monitored
+
+    if args.debug_loop:
+        return asyncio.run(monitored(run(args)), debug=True)
+    return asyncio.run(monitored(run(args)))
+
+if __name__ == "__main__":
+    sys.exit(main())
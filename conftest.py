@@ -1,11 +1,14 @@
 import pytest
+from pathlib import Path
 from unittest.mock import Mock
-from domain.interfaces import VideoProcessor, Transcriber, Translator
+from domain.interfaces import VideoProcessor, Transcriber, Translator, SubtitleEntry, MediaInfo
+from infrastructure.translator_registry import TranslatorRegistry
 
 @pytest.fixture
 def mock_video_processor():
     processor = Mock(spec=VideoProcessor)
     processor.extract_audio.return_value = Path("test_audio.wav")
+    processor.probe.return_value = MediaInfo(duration=60.0, audio_codec="aac", audio_stream_index=1)
     return processor
 
 @pytest.fixture
@@ -14,6 +17,7 @@ def mock_transcriber():
     transcriber.transcribe.return_value = [
         SubtitleEntry(1, "00:00:01,000", "00:00:02,000", "Test subtitle")
     ]
+    transcriber.detect_language.return_value = "en"
     return transcriber
 
 @pytest.fixture
@@ -23,3 +27,8 @@ def mock_translator():
         SubtitleEntry(1, "00:00:01,000", "00:00:02,000", "Test translation")
     ]
     return translator
+
+@pytest.fixture
+def translator_registry():
+    # A private registry, so backends replaced by a test never reach the shared one
+    return TranslatorRegistry.default()
@@ -1,11 +1,96 @@
 from dataclasses import dataclass
-from typing import List, Optional
+import pathlib
+import threading
+from typing import Callable, Dict, List, Optional
 from domain.interfaces import *
 
+class CancellationToken:
+    """Thread-safe cancel request shared between a UI or signal handler and a job"""
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._callbacks: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self):
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks = list(self._callbacks)
+        for callback in callbacks:
+            callback()
+
+    def on_cancel(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """Run callback on cancel (now, if already cancelled); returns an unsubscribe function"""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return lambda: self._remove(callback)
+        callback()
+        return lambda: None
+
+    def _remove(self, callback: Callable[[], None]):
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+@dataclass
+class ProgressEvent:
+    """Measured progress within one stage"""
+    stage: ProcessingStatus
+    # Fraction of this stage completed, None if the total is unknown
+    fraction: Optional[float]
+    done: float
+    total: Optional[float]
+    # Unit of done/total, e.g. "s" of media or "subtitles"
+    unit: str
+    # done units per second of wall-clock time
+    rate: Optional[float] = None
+    eta_seconds: Optional[float] = None
+
 @dataclass
 class ProcessingResult:
     status: ProcessingStatus
     message: str
     progress: float
     subtitles: Optional[List[SubtitleEntry]] = None
+    # Wall-clock seconds spent per stage, e.g. {'transcription': 12.4}
+    stage_timings: Optional[Dict[str, float]] = None
+    event: Optional[ProgressEvent] = None
+
+
+@dataclass
+class BatchItemResult:
+    video_path: pathlib.Path
+    # Per target language outcome; empty if the file failed before translation
+    results: Dict[str, ProcessingResult]
+    elapsed: float
+    error: Optional[str] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None and all(
+            result.status == ProcessingStatus.COMPLETED for result in self.results.values()
+        )
+
+@dataclass
+class BatchReport:
+    items: List[BatchItemResult]
+    elapsed: float
+
+    @property
+    def succeeded(self) -> int:
+        return sum(1 for item in self.items if item.succeeded)
+
+    @property
+    def failed(self) -> int:
+        return len(self.items) - self.succeeded
 
+    @property
+    def files_per_hour(self) -> float:
+        return len(self.items) * 3600 / self.elapsed if self.elapsed > 0 else 0.0
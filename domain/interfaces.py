@@ -1,9 +1,16 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, AsyncIterator, Any, Callable, Union
 from enum import Enum
 import pathlib
 
+# Whisper expects 16 kHz mono audio
+AUDIO_SAMPLE_RATE = 16000
+
+# Audio handed to a transcriber: a file on disk, an in-memory float32 buffer,
+# or an async stream of float32 chunks
+AudioInput = Union[pathlib.Path, Any, AsyncIterator[Any]]
+
 class ProcessingStatus(Enum):
     IDLE = "idle"
     EXTRACTING = "extracting_audio"
@@ -11,6 +18,7 @@ class ProcessingStatus(Enum):
     TRANSLATING = "translating"
     COMPLETED = "completed"
     ERROR = "error"
+    CANCELLED = "cancelled"
 
 @dataclass
 class SubtitleEntry:
@@ -19,24 +27,142 @@ class SubtitleEntry:
     end_time: str
     text: str
 
+@dataclass
+class TranscriptionOptions:
+    """Per-job model and decode settings; None keeps the transcriber's default"""
+    model_size: Optional[str] = None
+    beam_size: Optional[int] = None
+    best_of: Optional[int] = None
+    # A single temperature disables the fallback schedule
+    temperature: Optional[float] = None
+    condition_on_previous_text: Optional[bool] = None
+    fp16: Optional[bool] = None
+    # Dynamic int8 quantization of linear layers (CPU only)
+    quantize_int8: bool = False
+    language: Optional[str] = None
+
+@dataclass
+class MediaInfo:
+    """Container and stream metadata, probed once per video"""
+    duration: float
+    audio_codec: Optional[str] = None
+    sample_rate: Optional[int] = None
+    channels: Optional[int] = None
+    # Absolute stream indices, usable with ffmpeg -map 0:<index>
+    audio_stream_index: Optional[int] = None
+    video_stream_index: Optional[int] = None
+    container: Optional[str] = None
+
+    @property
+    def has_audio(self) -> bool:
+        return self.audio_stream_index is not None
+
+@dataclass
+class TimeRange:
+    """Part of a recording to caption, in seconds; end None means to the end"""
+    start: float = 0.0
+    end: Optional[float] = None
+
+    def __post_init__(self):
+        if self.start < 0:
+            raise ValueError(f"Time range start must not be negative: {self.start}")
+        if self.end is not None and self.end <= self.start:
+            raise ValueError(f"Time range end {self.end} must be after start {self.start}")
+
+    @property
+    def duration(self) -> Optional[float]:
+        return self.end - self.start if self.end is not None else None
+
 class VideoProcessor(ABC):
+    async def probe(self, video_path: pathlib.Path) -> Optional[MediaInfo]:
+        """Media metadata for the video, or None if this processor cannot probe"""
+        return None
+
+    @abstractmethod
+    async def extract_audio(
+        self,
+        video_path: pathlib.Path,
+        media: Optional[MediaInfo] = None,
+        progress_callback: Optional[Callable[[float], None]] = None,
+        time_range: Optional[TimeRange] = None,
+        output_path: Optional[pathlib.Path] = None
+    ) -> pathlib.Path:
+        """Extract audio to a file; progress_callback receives seconds of media processed
+
+        Writes to output_path when given, else to a new temporary file. The
+        result may be video_path itself when the transcriber can decode it
+        directly; any other returned file belongs to the caller.
+        """
+        pass
+
     @abstractmethod
-    async def extract_audio(self, video_path: pathlib.Path) -> pathlib.Path:
-        """Extract audio from video file and return path to audio file"""
+    def stream_audio(
+        self,
+        video_path: pathlib.Path,
+        chunk_seconds: float = 30.0,
+        media: Optional[MediaInfo] = None,
+        time_range: Optional[TimeRange] = None
+    ) -> AsyncIterator[Any]:
+        """Decode audio from video file as a stream of 16 kHz mono float32 chunks"""
         pass
 
 class Transcriber(ABC):
     @abstractmethod
-    async def transcribe(self, audio_path: pathlib.Path) -> List[SubtitleEntry]:
-        """Transcribe audio file to text with timestamps"""
+    async def transcribe(
+        self,
+        audio: AudioInput,
+        options: Optional[TranscriptionOptions] = None,
+        media: Optional[MediaInfo] = None,
+        progress_callback: Optional[Callable[[float], None]] = None
+    ) -> List[SubtitleEntry]:
+        """Transcribe audio to text with timestamps; progress_callback receives seconds transcribed"""
         pass
 
+    async def transcribe_stream(
+        self,
+        audio: AudioInput,
+        options: Optional[TranscriptionOptions] = None,
+        media: Optional[MediaInfo] = None,
+        progress_callback: Optional[Callable[[float], None]] = None
+    ) -> AsyncIterator[SubtitleEntry]:
+        """Yield subtitle entries as they are decoded (default: one full transcription)
+
+        progress_callback receives seconds transcribed, only after every entry up
+        to that point has been yielded; the default reports nothing.
+        """
+        for entry in await self.transcribe(audio, options, media=media):
+            yield entry
+
+    def describe_settings(self, options: Optional[TranscriptionOptions] = None) -> dict:
+        """Model and decode settings that affect the transcript (used for caching)"""
+        return {"transcriber": type(self).__name__}
+
+    async def detect_language(
+        self,
+        audio: AudioInput,
+        options: Optional[TranscriptionOptions] = None,
+        time_range: Optional[TimeRange] = None
+    ) -> Optional[str]:
+        """Spoken language code of the audio (from the start of time_range), or None
+        if it cannot be detected
+        """
+        return None
+
 class Translator(ABC):
     @abstractmethod
-    async def translate(self, subtitles: List[SubtitleEntry], target_language: str) -> List[SubtitleEntry]:
-        """Translate subtitle entries to target language"""
+    async def translate(
+        self,
+        subtitles: List[SubtitleEntry],
+        target_language: str,
+        source_language: Optional[str] = None
+    ) -> List[SubtitleEntry]:
+        """Translate subtitle entries to target language (source None means auto-detect)"""
         pass
 
+    def supports(self, source_language: Optional[str], target_language: str) -> bool:
+        """Whether this backend can translate the pair right now; must not block on the network"""
+        return True
+
 class UserPreferences(ABC):
     @abstractmethod
     def save_preferences(self, preferences: dict) -> None:
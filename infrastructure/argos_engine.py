@@ -0,0 +1,132 @@
+import logging
+import re
+from collections import deque
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Subtitles are short, so punctuation is a good enough sentence boundary
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?;。！？])\s+')
+
+def split_sentences(text: str) -> List[str]:
+    """Sentences of one subtitle, in order; empty text has none"""
+    return [part.strip() for part in SENTENCE_BOUNDARY.split(text.strip()) if part.strip()]
+
+class ArgosBatchEngine:
+    """Batched translation for one installed Argos package, straight through CTranslate2
+
+    The pair's model and SentencePiece tokenizer are loaded once; each call
+    sends the sentences of all given texts as a single translate_batch
+    request, which CTranslate2 sorts by length and runs in large batches.
+    """
+
+    def __init__(
+        self,
+        package_path: Path,
+        target_prefix: str = "",
+        max_batch_size: int = 32,
+        beam_size: int = 4,
+        inter_threads: int = 1,
+        intra_threads: int = 0,
+        device: str = "cpu"
+    ):
+        import ctranslate2
+        import sentencepiece
+
+        self.translator = ctranslate2.Translator(
+            str(package_path / "model"),
+            device=device,
+            inter_threads=inter_threads,
+            intra_threads=intra_threads
+        )
+        self.tokenizer = sentencepiece.SentencePieceProcessor(
+            model_file=str(package_path / "sentencepiece.model")
+        )
+        # Multilingual packages select the output language with a prefix token
+        self.target_prefix = target_prefix
+        self.max_batch_size = max_batch_size
+        self.beam_size = beam_size
+
+    @classmethod
+    def for_package(cls, package, **kwargs) -> "ArgosBatchEngine":
+        """Engine for an installed argostranslate.package.Package"""
+        return cls(Path(package.package_path), getattr(package, "target_prefix", "") or "", **kwargs)
+
+    def translate(self, texts: List[str]) -> List[str]:
+        """Translate texts in one batched call; blocking, run it off the event loop"""
+        sentences: List[str] = []
+        owners: List[int] = []
+        for index, text in enumerate(texts):
+            for sentence in split_sentences(text):
+                sentences.append(sentence)
+                owners.append(index)
+
+        if not sentences:
+            return list(texts)
+
+        tokens = self.tokenizer.encode(sentences, out_type=str)
+        results = self.translator.translate_batch(
+            tokens,
+            target_prefix=[[self.target_prefix]] * len(tokens) if self.target_prefix else None,
+            max_batch_size=self.max_batch_size,
+            beam_size=self.beam_size
+        )
+
+        pieces: List[List[str]] = [[] for _ in texts]
+        for owner, result in zip(owners, results):
+            hypothesis = result.hypotheses[0]
+            if self.target_prefix and hypothesis[:1] == [self.target_prefix]:
+                hypothesis = hypothesis[1:]
+            pieces[owner].append(self.tokenizer.decode(hypothesis))
+
+        logger.debug(f"Translated {len(sentences)} sentences from {len(texts)} texts in one batch")
+        return [" ".join(parts) if parts else text for parts, text in zip(pieces, texts)]
+
+class PairRoutes:
+    """Language-pair routing table over installed Argos packages
+
+    Built once from the package list; routes are shortest chains of packages
+    (e.g. ar->en->fr when there is no direct ar->fr model) and are memoized.
+    """
+
+    def __init__(self, packages):
+        self._edges: Dict[str, Dict[str, object]] = {}
+        for package in packages:
+            # First installed package wins for a duplicated pair
+            self._edges.setdefault(package.from_code, {}).setdefault(package.to_code, package)
+        self._routes: Dict[Tuple[str, str], Optional[List]] = {}
+
+    def pairs(self) -> List[Tuple[str, str]]:
+        """Directly installed pairs"""
+        return [(source, target) for source, targets in self._edges.items() for target in targets]
+
+    def route(self, from_code: str, to_code: str) -> Optional[List]:
+        """Packages to chain for from_code->to_code, or None if unreachable"""
+        key = (from_code, to_code)
+        if key not in self._routes:
+            self._routes[key] = self._shortest_path(from_code, to_code)
+        return self._routes[key]
+
+    def _shortest_path(self, from_code: str, to_code: str) -> Optional[List]:
+        if from_code == to_code:
+            return []
+        # Breadth-first, so the first arrival uses the fewest hops
+        previous: Dict[str, Tuple[str, object]] = {}
+        queue = deque([from_code])
+        seen = {from_code}
+        while queue:
+            code = queue.popleft()
+            for target, package in self._edges.get(code, {}).items():
+                if target in seen:
+                    continue
+                seen.add(target)
+                previous[target] = (code, package)
+                if target == to_code:
+                    path = []
+                    while target != from_code:
+                        target, package = previous[target]
+                        path.append(package)
+                    return path[::-1]
+                queue.append(target)
+        return None
@@ -0,0 +1,73 @@
+import logging
+from typing import List, Tuple
+import numpy as np
+from domain.interfaces import AUDIO_SAMPLE_RATE
+
+logger = logging.getLogger(__name__)
+
+# How far from each ideal boundary a cut may move to find a pause
+SEARCH_SECONDS = 10.0
+
+def frame_energy(samples: np.ndarray, frame_samples: int) -> np.ndarray:
+    """RMS energy of consecutive non-overlapping frames"""
+    frame_count = len(samples) // frame_samples
+    if frame_count == 0:
+        return np.zeros(0, dtype=np.float32)
+    frames = samples[:frame_count * frame_samples].reshape(frame_count, frame_samples)
+    return np.sqrt(np.mean(np.square(frames, dtype=np.float32), axis=1))
+
+def find_split_points(
+    samples: np.ndarray,
+    sample_rate: int = AUDIO_SAMPLE_RATE,
+    target_chunk_seconds: float = 60.0,
+    search_seconds: float = SEARCH_SECONDS,
+    min_silence_seconds: float = 0.3,
+    frame_ms: int = 30
+) -> List[int]:
+    """Choose cut points near every target_chunk_seconds, moved to the quietest nearby pause
+
+    Around each ideal boundary the energy is smoothed over min_silence_seconds
+    and the cut is placed in the middle of the quietest stretch within
+    +/- search_seconds, so words are not split across chunks.
+    """
+    frame_samples = max(1, int(sample_rate * frame_ms / 1000))
+    energy = frame_energy(samples, frame_samples)
+    if len(energy) == 0:
+        return []
+
+    # Moving average over the minimum pause length
+    silence_frames = max(1, int(min_silence_seconds * 1000 / frame_ms))
+    smoothed = np.convolve(energy, np.ones(silence_frames) / silence_frames, mode='same')
+
+    frames_per_chunk = max(1, int(target_chunk_seconds * 1000 / frame_ms))
+    search_frames = int(search_seconds * 1000 / frame_ms)
+
+    split_frames = []
+    previous = 0
+    ideal = frames_per_chunk
+    while ideal < len(energy) - frames_per_chunk // 4:
+        low = max(previous + 1, ideal - search_frames)
+        high = min(len(energy), ideal + search_frames + 1)
+        best = low + int(np.argmin(smoothed[low:high]))
+        split_frames.append(best)
+        previous = best
+        ideal = best + frames_per_chunk
+
+    return [frame * frame_samples for frame in split_frames]
+
+def split_on_silence(
+    samples: np.ndarray,
+    sample_rate: int = AUDIO_SAMPLE_RATE,
+    target_chunk_seconds: float = 60.0,
+    **kwargs
+) -> List[Tuple[int, np.ndarray]]:
+    """Split audio into (start_sample, chunk) pairs at silence boundaries"""
+    points = find_split_points(samples, sample_rate, target_chunk_seconds, **kwargs)
+    bounds = [0] + points + [len(samples)]
+    chunks = [
+        (start, samples[start:end])
+        for start, end in zip(bounds, bounds[1:])
+        if end > start
+    ]
+    logger.debug(f"Split {len(samples) / sample_rate:.1f}s of audio into {len(chunks)} chunks")
+    return chunks
@@ -0,0 +1,195 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+import time
+import wave
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from domain.interfaces import SubtitleEntry, AUDIO_SAMPLE_RATE
+from infrastructure.scratch_space import DEFAULT_SCRATCH_DIR
+from infrastructure.transcript_cache import TranscriptCache
+
+logger = logging.getLogger(__name__)
+
+# Checkpoints of jobs that were abandoned, failed for good or re-run with other
+# settings are swept after this long, and the oldest beyond the size cap
+STALE_CHECKPOINT_SECONDS = 7 * 24 * 3600
+MAX_CHECKPOINT_BYTES = 8 * 1024 ** 3
+
+class JobCheckpoint:
+    """Per-job resume state: extracted audio, transcript and translated segments
+
+    Files are append-only JSON lines, so a crash loses at most the line being
+    written; a torn last line is ignored on load.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.audio_path = directory / "audio.wav"
+        self.transcript_path = directory / "transcript.jsonl"
+
+    def has_audio(self) -> bool:
+        return self.audio_path.exists()
+
+    def save_audio(self, extracted: Path) -> Path:
+        """Move freshly extracted audio into the checkpoint and return its new path"""
+        temp_path = self.audio_path.with_suffix(".tmp")
+        shutil.move(str(extracted), temp_path)
+        os.replace(temp_path, self.audio_path)
+        return self.audio_path
+
+    def read_audio(self, start_seconds: float = 0.0) -> np.ndarray:
+        """Checkpointed 16 kHz mono PCM from start_seconds on, as float32"""
+        with wave.open(str(self.audio_path), 'rb') as wav:
+            if wav.getframerate() != AUDIO_SAMPLE_RATE or wav.getnchannels() != 1 or wav.getsampwidth() != 2:
+                raise ValueError(f"Unexpected checkpoint audio format in {self.audio_path}")
+            wav.setpos(min(int(start_seconds * AUDIO_SAMPLE_RATE), wav.getnframes()))
+            data = wav.readframes(wav.getnframes() - wav.tell())
+        return np.frombuffer(data, dtype=np.int16).astype(np.float32) / 32768.0
+
+    def load_transcript(self) -> Tuple[List[SubtitleEntry], float, bool]:
+        """Segments up to the last fully transcribed position, that position in
+        seconds, and whether transcription had finished
+        """
+        entries: List[SubtitleEntry] = []
+        committed: List[SubtitleEntry] = []
+        until = 0.0
+        complete = False
+        for record in self._read_lines(self.transcript_path):
+            if "until" in record:
+                # Everything before a marker belongs to a completed window
+                until = record["until"]
+                complete = record.get("complete", False)
+                committed = list(entries)
+            else:
+                entries.append(SubtitleEntry(**record))
+        return committed, until, complete
+
+    def append_segment(self, entry: SubtitleEntry):
+        self._append(self.transcript_path, [asdict(entry)])
+
+    def mark_transcribed(self, until_seconds: float, complete: bool = False):
+        self._append(self.transcript_path, [{"until": until_seconds, "complete": complete}])
+
+    def reset_transcript(self, entries: List[SubtitleEntry], until_seconds: float):
+        """Rewrite the transcript log without segments from an unfinished window"""
+        temp_path = self.transcript_path.with_suffix(".tmp")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            for entry in entries:
+                f.write(json.dumps(asdict(entry), ensure_ascii=False) + "\n")
+            f.write(json.dumps({"until": until_seconds, "complete": False}) + "\n")
+        os.replace(temp_path, self.transcript_path)
+
+    def _translation_path(self, key: str) -> Path:
+        return self.directory / f"translation_{hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]}.jsonl"
+
+    def load_translations(self, key: str) -> Dict[int, SubtitleEntry]:
+        """Translated segments already completed for key, by subtitle index"""
+        return {
+            record["index"]: SubtitleEntry(**record)
+            for record in self._read_lines(self._translation_path(key))
+        }
+
+    def append_translations(self, key: str, entries: List[SubtitleEntry]):
+        self._append(self._translation_path(key), [asdict(entry) for entry in entries])
+
+    def complete(self):
+        """Job finished; resume state is no longer needed"""
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    @staticmethod
+    def _append(path: Path, records: List[dict]):
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write("".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records))
+            f.flush()
+            os.fsync(f.fileno())
+
+    @staticmethod
+    def _read_lines(path: Path) -> List[dict]:
+        records = []
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        # Torn write from a crash; nothing after it is trustworthy
+                        break
+        except FileNotFoundError:
+            pass
+        return records
+
+class CheckpointStore:
+    """Resume state for interrupted jobs, keyed by video fingerprint and transcriber settings
+
+    Checkpoints hold full-length audio, so stale ones are swept on startup.
+    """
+
+    def __init__(
+        self,
+        root: Optional[Path] = None,
+        max_age_seconds: float = STALE_CHECKPOINT_SECONDS,
+        max_total_bytes: int = MAX_CHECKPOINT_BYTES
+    ):
+        self.root = root or DEFAULT_SCRATCH_DIR / "checkpoints"
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.sweep(max_age_seconds, max_total_bytes)
+
+    def job(self, video_path: Path, settings: dict) -> JobCheckpoint:
+        payload = json.dumps(
+            {"video": TranscriptCache.fingerprint(video_path), "settings": settings},
+            sort_keys=True
+        )
+        key = hashlib.sha256(payload.encode('utf-8')).hexdigest()[:32]
+        return JobCheckpoint(self.root / key)
+
+    def sweep(self, max_age_seconds: float, max_total_bytes: int) -> int:
+        """Remove checkpoints untouched for max_age_seconds, then the least recently
+        used until the rest fit in max_total_bytes
+        """
+        jobs = []
+        for directory in self.root.iterdir():
+            if directory.is_dir():
+                jobs.append((directory, *self._usage(directory)))
+        # Most recently used first
+        jobs.sort(key=lambda job: job[1], reverse=True)
+
+        removed = 0
+        now = time.time()
+        total = 0
+        for directory, last_used, size in jobs:
+            if now - last_used > max_age_seconds or total + size > max_total_bytes:
+                shutil.rmtree(directory, ignore_errors=True)
+                removed += 1
+            else:
+                total += size
+        if removed:
+            logger.info(f"Removed {removed} stale job checkpoints from {self.root}")
+        return removed
+
+    @staticmethod
+    def _usage(directory: Path) -> Tuple[float, int]:
+        """Last modification time and total size of a checkpoint's files"""
+        last_used = directory.stat().st_mtime
+        size = 0
+        for path in directory.iterdir():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            last_used = max(last_used, stat.st_mtime)
+            size += stat.st_size
+        return last_used, size
+
+    def clear(self) -> int:
+        removed = 0
+        for directory in self.root.iterdir():
+            if directory.is_dir():
+                shutil.rmtree(directory, ignore_errors=True)
+                removed += 1
+        return removed
@@ -0,0 +1,83 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from typing import Awaitable, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# A callback holding the loop longer than this is reported
+BLOCKING_THRESHOLD_SECONDS = 0.1
+
+class LoopBlockingMonitor:
+    """Reports event-loop stalls together with the stack of the blocking call
+
+    A watchdog thread pings the loop; when a ping is not answered within the
+    threshold, the loop thread's current stack is logged, which points at the
+    synchronous call that should have gone to an executor.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, threshold: float = BLOCKING_THRESHOLD_SECONDS):
+        self.loop = loop
+        self.threshold = threshold
+        self.stalls = 0
+        self._loop_thread_id: Optional[int] = None
+        self._pong = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "LoopBlockingMonitor":
+        """Start watching; call from the loop's own thread"""
+        self._loop_thread_id = threading.get_ident()
+        self._thread = threading.Thread(target=self._watch, name="loop-monitor", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _watch(self):
+        while not self._stop.wait(self.threshold / 2):
+            self._pong.clear()
+            sent = time.monotonic()
+            try:
+                self.loop.call_soon_threadsafe(self._pong.set)
+            except RuntimeError:
+                return  # Loop closed
+            # stop() joins from the loop thread, so a missed ping then is not a stall
+            if self._pong.wait(self.threshold) or self._stop.is_set():
+                continue
+
+            self.stalls += 1
+            frame = sys._current_frames().get(self._loop_thread_id)
+            stack = "".join(traceback.format_stack(frame)) if frame else "(stack unavailable)\n"
+            logger.warning(f"Event loop blocked for over {self.threshold * 1000:.0f} ms, in:\n{stack}")
+            while not self._pong.wait(self.threshold) and not self._stop.is_set():
+                pass
+            logger.warning(f"Event loop was blocked for {time.monotonic() - sent:.2f}s")
+
+async def monitored(awaitable: Awaitable[T], threshold: float = BLOCKING_THRESHOLD_SECONDS) -> T:
+    """Await awaitable, reporting blocking calls when asyncio debug mode is on
+
+    Debug mode comes from asyncio.run(debug=True), PYTHONASYNCIODEBUG=1 or
+    python -X dev; otherwise this adds nothing.
+    """
+    loop = asyncio.get_running_loop()
+    if not loop.get_debug():
+        return await awaitable
+
+    # asyncio's own slow-callback warnings use the same threshold
+    loop.slow_callback_duration = threshold
+    monitor = LoopBlockingMonitor(loop, threshold).start()
+    try:
+        return await awaitable
+    finally:
+        monitor.stop()
+        if monitor.stalls:
+            logger.warning(f"Event loop was blocked {monitor.stalls} times")
@@ -0,0 +1,57 @@
+import asyncio
+import json
+import logging
+import pathlib
+from typing import Optional
+from domain.interfaces import MediaInfo
+
+logger = logging.getLogger(__name__)
+
+def parse_ffprobe(data: dict) -> MediaInfo:
+    """Build MediaInfo from ffprobe -show_format -show_streams JSON"""
+    streams = data.get("streams", [])
+    audio = next((s for s in streams if s.get("codec_type") == "audio"), None)
+    # Cover art shows up as a video stream; it is not a picture track
+    video = next(
+        (s for s in streams
+         if s.get("codec_type") == "video" and not s.get("disposition", {}).get("attached_pic")),
+        None
+    )
+    container = data.get("format", {})
+
+    duration = container.get("duration") or (audio or {}).get("duration") or 0
+    return MediaInfo(
+        duration=float(duration),
+        audio_codec=audio.get("codec_name") if audio else None,
+        sample_rate=int(audio["sample_rate"]) if audio and audio.get("sample_rate") else None,
+        channels=audio.get("channels") if audio else None,
+        audio_stream_index=audio.get("index") if audio else None,
+        video_stream_index=video.get("index") if video else None,
+        container=container.get("format_name")
+    )
+
+async def probe_media(ffprobe_path: str, media_path: pathlib.Path, timeout: Optional[float] = 30.0) -> MediaInfo:
+    """Read container and stream metadata with a single ffprobe call"""
+    process = await asyncio.create_subprocess_exec(
+        ffprobe_path,
+        '-v', 'error',
+        '-print_format', 'json',
+        '-show_format',
+        '-show_streams',
+        str(media_path),
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+    finally:
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+
+    if process.returncode != 0:
+        raise RuntimeError(f"ffprobe failed for {media_path}: {stderr.decode(errors='replace').strip()}")
+
+    media = parse_ffprobe(json.loads(stdout))
+    logger.debug(f"Probed {media_path}: {media}")
+    return media
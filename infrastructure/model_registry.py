@@ -0,0 +1,141 @@
+import gc
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+class _ModelSlot:
+    """Bookkeeping for one registered model"""
+
+    def __init__(self):
+        self.model: Any = None
+        self.load_lock = threading.Lock()
+        # Serializes inference; Whisper installs per-call hooks on the shared model
+        self.use_lock = threading.Lock()
+        self.in_use = 0
+        self.last_used = time.monotonic()
+        self.load_seconds = 0.0
+
+class ModelRegistry:
+    """Lazily loaded models shared across jobs, unloaded after an idle timeout"""
+
+    _shared: Optional["ModelRegistry"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, idle_timeout: float = 600.0, check_interval: float = 30.0):
+        self.idle_timeout = idle_timeout
+        self.check_interval = check_interval
+        self._slots: Dict[str, _ModelSlot] = {}
+        self._lock = threading.Lock()
+        self._reaper: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    @classmethod
+    def shared(cls) -> "ModelRegistry":
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def _slot(self, key: str) -> _ModelSlot:
+        with self._lock:
+            slot = self._slots.get(key)
+            if slot is None:
+                slot = self._slots[key] = _ModelSlot()
+            return slot
+
+    def get(self, key: str, loader: Callable[[], Any]) -> Any:
+        """Return the model for key, loading it on first use (blocking)"""
+        slot = self._slot(key)
+        with slot.load_lock:
+            if slot.model is None:
+                logger.debug(f"Loading model {key}")
+                start = time.perf_counter()
+                slot.model = loader()
+                slot.load_seconds = time.perf_counter() - start
+                logger.info(f"Loaded model {key} in {slot.load_seconds:.1f}s")
+                self._start_reaper()
+            slot.last_used = time.monotonic()
+            return slot.model
+
+    @contextmanager
+    def use(self, key: str, loader: Callable[[], Any], exclusive: bool = True):
+        """Borrow a model; it is never unloaded while borrowed
+
+        With exclusive=True concurrent jobs take turns on the single instance
+        instead of each loading their own copy.
+        """
+        slot = self._slot(key)
+        with self._lock:
+            slot.in_use += 1
+        try:
+            model = self.get(key, loader)
+            if exclusive:
+                with slot.use_lock:
+                    yield model
+            else:
+                yield model
+        finally:
+            with self._lock:
+                slot.in_use -= 1
+                slot.last_used = time.monotonic()
+
+    def unload(self, key: str) -> bool:
+        """Drop a model that is not in use, releasing its memory"""
+        with self._lock:
+            slot = self._slots.get(key)
+            if slot is None or slot.model is None or slot.in_use:
+                return False
+            slot.model = None
+
+        gc.collect()
+        try:
+            import torch
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+        except ImportError:
+            pass
+
+        logger.info(f"Unloaded idle model {key}")
+        return True
+
+    def unload_idle(self) -> int:
+        now = time.monotonic()
+        with self._lock:
+            idle = [
+                key for key, slot in self._slots.items()
+                if slot.model is not None and not slot.in_use
+                and now - slot.last_used >= self.idle_timeout
+            ]
+        return sum(1 for key in idle if self.unload(key))
+
+    def loaded(self) -> Dict[str, dict]:
+        with self._lock:
+            return {
+                key: {"in_use": slot.in_use, "load_seconds": slot.load_seconds}
+                for key, slot in self._slots.items()
+                if slot.model is not None
+            }
+
+    def _start_reaper(self):
+        if self.idle_timeout <= 0 or (self._reaper and self._reaper.is_alive()):
+            return
+        self._reaper = threading.Thread(target=self._reap, name="model-reaper", daemon=True)
+        self._reaper.start()
+
+    def _reap(self):
+        while not self._stop.wait(self.check_interval):
+            try:
+                self.unload_idle()
+            except Exception as e:
+                logger.warning(f"Idle model unload failed: {e}")
+
+    def shutdown(self):
+        self._stop.set()
+        with self._lock:
+            keys = list(self._slots)
+        for key in keys:
+            self.unload(key)
@@ -0,0 +1,228 @@
+import asyncio
+import logging
+import os
+import pathlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Optional, Tuple
+import numpy as np
+import torch
+import whisper
+from domain.interfaces import (
+    Transcriber, SubtitleEntry, AudioInput, TranscriptionOptions, MediaInfo, TimeRange, AUDIO_SAMPLE_RATE
+)
+from infrastructure.audio_segmentation import split_on_silence
+from infrastructure.toolchain import find_ffmpeg
+from infrastructure.transcriber import (
+    WhisperTranscriber, LANGUAGE_DETECTION_SECONDS, load_whisper_model, load_audio_head,
+    decode_kwargs, detect_language_with, detection_window
+)
+
+logger = logging.getLogger(__name__)
+
+# Models loaded in this worker process, keyed by (model name, int8)
+_worker_models = {}
+
+def _worker_model(model_name: str, quantize_int8: bool):
+    key = (model_name, quantize_int8)
+    if key not in _worker_models:
+        _worker_models[key] = load_whisper_model(model_name, quantize_int8)
+    return _worker_models[key]
+
+def _init_worker(model_name: str, threads_per_worker: int):
+    """Preload the default Whisper model once when a worker process starts"""
+    # Avoid oversubscribing cores: workers * threads should not exceed the CPU count
+    torch.set_num_threads(threads_per_worker)
+    _worker_model(model_name, False)
+
+def _transcribe_chunk(
+    samples: np.ndarray,
+    model_name: str,
+    quantize_int8: bool,
+    kwargs: dict
+) -> List[Tuple[float, float, str]]:
+    """Transcribe one chunk in a worker, returning (start, end, text) relative to the chunk"""
+    result = _worker_model(model_name, quantize_int8).transcribe(samples, **kwargs)
+    return [
+        (segment["start"], segment["end"], segment["text"].strip())
+        for segment in result.get("segments", [])
+        if segment["text"].strip()
+    ]
+
+def _detect_chunk_language(samples: np.ndarray, model_name: str, quantize_int8: bool) -> str:
+    """Detect the spoken language in a worker from the first 30 s of samples"""
+    return detect_language_with(_worker_model(model_name, quantize_int8), samples)
+
+def transcription_workers(requested: int, concurrent_files: int) -> int:
+    """Worker processes for a run of concurrent_files videos at once
+
+    On CPU every concurrent file gets its own process, since a single shared
+    model would decode the files one window at a time. One GPU model serves
+    them all, so there only the requested count applies.
+    """
+    if torch.cuda.is_available():
+        return requested
+    return max(requested, concurrent_files)
+
+class ParallelWhisperTranscriber(Transcriber):
+    """Whisper transcription split at silences and spread over CPU processes"""
+
+    def __init__(
+        self,
+        model_name: str = "base",
+        workers: Optional[int] = None,
+        chunk_seconds: float = 60.0
+    ):
+        self.model_name = model_name
+        self.workers = workers or max(1, (os.cpu_count() or 2) // 2)
+        self.chunk_seconds = chunk_seconds
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        # Created on first use so constructing the transcriber stays cheap
+        if self._pool is None:
+            threads_per_worker = max(1, (os.cpu_count() or 1) // self.workers)
+            logger.debug(f"Starting {self.workers} transcription workers "
+                         f"({threads_per_worker} threads each, model {self.model_name})")
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(self.model_name, threads_per_worker)
+            )
+        return self._pool
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    def _model_for(self, options: Optional[TranscriptionOptions]):
+        options = options or TranscriptionOptions()
+        return options.model_size or self.model_name, options.quantize_int8
+
+    def describe_settings(self, options: Optional[TranscriptionOptions] = None) -> dict:
+        model_name, quantize_int8 = self._model_for(options)
+        return {
+            "transcriber": "whisper-parallel",
+            "model": model_name,
+            "int8": quantize_int8,
+            "decode": decode_kwargs(options),
+            "chunk_seconds": self.chunk_seconds
+        }
+
+    async def detect_language(
+        self,
+        audio: AudioInput,
+        options: Optional[TranscriptionOptions] = None,
+        time_range: Optional[TimeRange] = None
+    ) -> Optional[str]:
+        """Detect the spoken language from the first 30 s of a media file or buffer,
+        counted from the start of time_range
+        """
+        start, seconds = detection_window(time_range)
+        try:
+            if isinstance(audio, pathlib.Path):
+                loop = asyncio.get_running_loop()
+                samples = await loop.run_in_executor(None, load_audio_head, audio, seconds, start)
+            elif isinstance(audio, np.ndarray):
+                first = int(start * AUDIO_SAMPLE_RATE)
+                samples = audio[first:first + int(seconds * AUDIO_SAMPLE_RATE)]
+            else:
+                return None
+            return await self._detect_samples(samples, options) if len(samples) else None
+        
+        except Exception as e:
+            logger.warning(f"Language detection failed: {e}")
+            return None
+
+    async def _detect_samples(self, samples: np.ndarray, options: Optional[TranscriptionOptions]) -> str:
+        model_name, quantize_int8 = self._model_for(options)
+        head = samples[:LANGUAGE_DETECTION_SECONDS * AUDIO_SAMPLE_RATE].astype(np.float32, copy=False)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_pool(), _detect_chunk_language, head, model_name, quantize_int8
+        )
+
+    async def transcribe(
+        self,
+        audio: AudioInput,
+        options: Optional[TranscriptionOptions] = None,
+        media: Optional[MediaInfo] = None,
+        progress_callback: Optional[Callable[[float], None]] = None
+    ) -> List[SubtitleEntry]:
+        try:
+            subtitles = [
+                entry async for entry in self.transcribe_stream(audio, options, media, progress_callback)
+            ]
+            logger.debug(f"Transcription completed. Generated {len(subtitles)} subtitle entries")
+            return subtitles
+        
+        except Exception as e:
+            logger.error(f"Transcription error: {e}", exc_info=True)
+            raise
+
+    async def transcribe_stream(
+        self,
+        audio: AudioInput,
+        options: Optional[TranscriptionOptions] = None,
+        media: Optional[MediaInfo] = None,
+        progress_callback: Optional[Callable[[float], None]] = None
+    ):
+        """Transcribe all chunks in parallel, yielding entries in timeline order"""
+        samples = await self._load_samples(audio)
+        if len(samples) == 0:
+            raise ValueError("Invalid audio input: no audio samples")
+
+        chunks = split_on_silence(samples, AUDIO_SAMPLE_RATE, self.chunk_seconds)
+        logger.debug(f"Transcribing {len(chunks)} chunks on {self.workers} workers")
+
+        model_name, quantize_int8 = self._model_for(options)
+        kwargs = decode_kwargs(options)
+        
+        # Detect once up front instead of once in every chunk
+        if "language" not in kwargs:
+            kwargs["language"] = await self._detect_samples(samples, options)
+            logger.debug(f"Detected language '{kwargs['language']}'")
+        
+        loop = asyncio.get_running_loop()
+        pool = self._get_pool()
+        futures = [
+            loop.run_in_executor(pool, _transcribe_chunk, chunk, model_name, quantize_int8, kwargs)
+            for _, chunk in chunks
+        ]
+
+        # Stitch segments back onto the global timeline as earlier chunks finish
+        index = 0
+        try:
+            for (start_sample, chunk), future in zip(chunks, futures):
+                offset = start_sample / AUDIO_SAMPLE_RATE
+                for start, end, text in await future:
+                    index += 1
+                    yield SubtitleEntry(
+                        index=index,
+                        start_time=WhisperTranscriber._format_timestamp(offset + start),
+                        end_time=WhisperTranscriber._format_timestamp(offset + end),
+                        text=text
+                    )
+                if progress_callback:
+                    progress_callback((start_sample + len(chunk)) / AUDIO_SAMPLE_RATE)
+        finally:
+            for future in futures:
+                future.cancel()
+
+    async def _load_samples(self, audio: AudioInput) -> np.ndarray:
+        """Decode a path, buffer or chunk stream into one float32 array"""
+        if isinstance(audio, pathlib.Path):
+            if not audio.exists():
+                raise FileNotFoundError(f"Audio file not found: {audio}")
+            # whisper.load_audio runs "ffmpeg" from PATH
+            find_ffmpeg()
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, whisper.load_audio, str(audio), AUDIO_SAMPLE_RATE)
+
+        if isinstance(audio, np.ndarray):
+            return audio.astype(np.float32, copy=False)
+
+        chunks = [chunk async for chunk in audio]
+        if not chunks:
+            return np.zeros(0, dtype=np.float32)
+        return np.concatenate(chunks).astype(np.float32, copy=False)
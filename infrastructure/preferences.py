@@ -2,8 +2,11 @@ import json
 from pathlib import Path
 from domain.interfaces import UserPreferences
 
+# Shared location for preferences and on-disk caches
+DEFAULT_CONFIG_DIR = Path.home() / ".subtitle_generator"
+
 class JsonUserPreferences(UserPreferences):
-    def __init__(self, config_path: Path = Path.home() / ".subtitle_generator"):
+    def __init__(self, config_path: Path = DEFAULT_CONFIG_DIR):
         self.config_path = config_path
         self.config_file = self.config_path / "preferences.json"
         self.config_path.mkdir(parents=True, exist_ok=True)
@@ -14,6 +17,7 @@ class JsonUserPreferences(UserPreferences):
             "default_language": "en",
             "output_directory": str(Path.home() / "Downloads"),
             "batch_size": 3,
+            "transcription_workers": 1,
             "notifications_enabled": True
         }
 
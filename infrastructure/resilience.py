@@ -0,0 +1,168 @@
+import asyncio
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass, asdict
+from typing import Awaitable, Callable, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+class CircuitOpenError(RuntimeError):
+    """The backend failed repeatedly and is not being called for now"""
+
+class TokenBucket:
+    """Token-bucket rate limiter shared by every job (and event loop) using a backend
+
+    Callers reserve a token up front and sleep off any debt, so bursts are
+    smoothed to the sustained rate instead of being rejected.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Take tokens and return the seconds to wait before using them"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= tokens
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    async def acquire(self, tokens: float = 1.0):
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+@dataclass
+class RetryPolicy:
+    """Exponential backoff with full jitter"""
+    attempts: int = 4
+    base_delay: float = 0.5
+    max_delay: float = 8.0
+
+    def delay(self, attempt: int) -> float:
+        """Seconds to wait after failed attempt number attempt (0-based)"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+class CircuitBreaker:
+    """Stops calls to a failing backend, letting one probe through after reset_timeout"""
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def available(self) -> bool:
+        """Closed, or open long enough that the next call may probe (half-open)"""
+        with self._lock:
+            return self._opened_at is None or time.monotonic() - self._opened_at >= self.reset_timeout
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at >= self.reset_timeout:
+                # Half-open: this call probes; the next one waits for another timeout
+                self._opened_at = time.monotonic()
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self) -> bool:
+        """Count a failure; returns True if it opened the circuit"""
+        with self._lock:
+            self._failures += 1
+            was_open = self._opened_at is not None
+            if was_open or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            return not was_open and self._opened_at is not None
+
+@dataclass
+class TranslationMetrics:
+    """Counters for one remote backend, kept for the life of the process"""
+    requests: int = 0
+    retries: int = 0
+    retried_segments: int = 0
+    failed_segments: int = 0
+    fallback_segments: int = 0
+    circuit_opened: int = 0
+
+    def snapshot(self) -> dict:
+        return asdict(self)
+
+class RemoteCallGuard:
+    """Rate limiting, timeouts, retries and circuit breaking around a remote backend's calls"""
+
+    def __init__(
+        self,
+        name: str,
+        requests_per_second: Optional[float] = None,
+        retry: Optional[RetryPolicy] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        timeout: Optional[float] = 10.0
+    ):
+        self.name = name
+        self.limiter = TokenBucket(requests_per_second) if requests_per_second else None
+        self.retry = retry or RetryPolicy()
+        self.breaker = breaker or CircuitBreaker()
+        self.timeout = timeout
+        self.metrics = TranslationMetrics()
+
+    @property
+    def healthy(self) -> bool:
+        # Half-open counts as healthy, otherwise routers never send the probe that closes the circuit
+        return self.breaker.available()
+
+    async def call(self, request: Callable[[], Awaitable[T]], segments: int = 1) -> T:
+        """Run request until it succeeds, retries run out or the circuit opens
+
+        segments is how many subtitle pieces the request carries, for metrics.
+        Raises CircuitOpenError or the last request error.
+        """
+        error: Optional[Exception] = None
+        for attempt in range(max(1, self.retry.attempts)):
+            if not self.breaker.allow():
+                raise CircuitOpenError(f"{self.name} is failing; circuit open") from error
+            if self.limiter:
+                await self.limiter.acquire()
+
+            self.metrics.requests += 1
+            try:
+                result = await asyncio.wait_for(request(), self.timeout)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                error = e
+                if self.breaker.record_failure():
+                    self.metrics.circuit_opened += 1
+                    logger.warning(f"{self.name} circuit opened after repeated failures: {e!r}")
+                if attempt + 1 < self.retry.attempts:
+                    self.metrics.retries += 1
+                    self.metrics.retried_segments += segments
+                    delay = self.retry.delay(attempt)
+                    logger.debug(f"{self.name} request failed ({e!r}), retry {attempt + 1} in {delay:.2f}s")
+                    await asyncio.sleep(delay)
+                continue
+
+            self.breaker.record_success()
+            return result
+
+        raise error
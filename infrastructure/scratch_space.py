@@ -0,0 +1,215 @@
+import atexit
+import hashlib
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Optional, Set
+from infrastructure.transcript_cache import TranscriptCache
+
+logger = logging.getLogger(__name__)
+
+# Default disk scratch root; checkpoint audio lives under it too
+DEFAULT_SCRATCH_DIR = Path(tempfile.gettempdir()) / "subtitle_generator"
+# RAM-backed tmpfs on Linux; small files there never touch the disk
+RAM_SCRATCH_DIR = Path("/dev/shm")
+# Job directories of dead processes are swept; without a pid check, after this long
+STALE_JOB_SECONDS = 24 * 3600
+OWNER_FILE = "owner.json"
+
+class ScratchQuotaExceeded(RuntimeError):
+    """Writing the file would exceed the scratch quota or the free disk space"""
+
+class ScratchJob:
+    """One job's private scratch directory; everything in it is removed on close
+
+    Directories are created on first use, so jobs that write nothing cost nothing.
+    """
+
+    def __init__(self, space: "ScratchSpace"):
+        self.space = space
+        self.directory: Optional[Path] = None
+        self.ram_directory: Optional[Path] = None
+        self.closed = False
+
+    def path_for(self, source: Path, suffix: str, expected_bytes: Optional[int] = None, variant: str = "") -> Path:
+        """Path for a file derived from source, named by its content fingerprint
+
+        Files of the expected size that fit the RAM limit go to /dev/shm when
+        enabled. Raises ScratchQuotaExceeded if the file cannot fit.
+        """
+        digest = hashlib.sha256(f"{TranscriptCache.fingerprint(source)}:{variant}".encode('utf-8'))
+        name = f"{digest.hexdigest()[:20]}{suffix}"
+
+        if expected_bytes is not None and self.space.fits_in_ram(expected_bytes):
+            if self.ram_directory is None:
+                self.ram_directory = self.space.make_job_dir(self.space.ram_root)
+            return self.ram_directory / name
+
+        self.space.reserve(expected_bytes or 0)
+        if self.directory is None:
+            self.directory = self.space.make_job_dir(self.space.root)
+        return self.directory / name
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        for directory in (self.directory, self.ram_directory):
+            if directory is not None:
+                shutil.rmtree(directory, ignore_errors=True)
+        self.space.forget(self)
+
+    def __enter__(self) -> "ScratchJob":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+class ScratchSpace:
+    """Per-job scratch directories under one root with a disk quota
+
+    Directories are tagged with the owning process, so a later run sweeps
+    what a crashed one left behind; normal exits clean up via atexit.
+    """
+
+    _shared: Optional["ScratchSpace"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        root: Optional[Path] = None,
+        quota_bytes: int = 4 * 1024 ** 3,
+        use_ram: bool = False,
+        ram_max_bytes: int = 256 * 1024 ** 2,
+        ram_root: Path = RAM_SCRATCH_DIR
+    ):
+        self.root = root or DEFAULT_SCRATCH_DIR
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.quota_bytes = quota_bytes
+        # Only when a RAM filesystem exists (Linux); elsewhere everything goes to disk
+        self.ram_root = ram_root / "subtitle_generator"
+        self.use_ram = use_ram and ram_root.is_dir()
+        self.ram_max_bytes = ram_max_bytes
+        self._jobs: Set[ScratchJob] = set()
+        self._lock = threading.Lock()
+
+        self.sweep_stale()
+        atexit.register(self.close_all)
+
+    @classmethod
+    def shared(cls) -> "ScratchSpace":
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def job(self) -> ScratchJob:
+        job = ScratchJob(self)
+        with self._lock:
+            self._jobs.add(job)
+        return job
+
+    @property
+    def checkpoint_root(self) -> Path:
+        """Where resume state goes, so checkpoint audio counts against the quota
+        and is moved into place by a rename instead of a copy
+        """
+        return self.root / "checkpoints"
+
+    def make_job_dir(self, parent: Path) -> Path:
+        directory = parent / f"job-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        directory.mkdir(parents=True)
+        with open(directory / OWNER_FILE, 'w', encoding='utf-8') as f:
+            json.dump({"pid": os.getpid(), "created": time.time()}, f)
+        return directory
+
+    def forget(self, job: ScratchJob):
+        with self._lock:
+            self._jobs.discard(job)
+
+    def fits_in_ram(self, expected_bytes: int) -> bool:
+        if not self.use_ram or expected_bytes > self.ram_max_bytes:
+            return False
+        try:
+            # Leave headroom; tmpfs pages compete with everything else for memory
+            return shutil.disk_usage(self.ram_root.parent).free > expected_bytes * 2
+        except OSError:
+            return False
+
+    def usage(self) -> int:
+        """Bytes currently held under the disk scratch root"""
+        total = 0
+        for directory, _, files in os.walk(self.root):
+            for name in files:
+                try:
+                    total += os.path.getsize(os.path.join(directory, name))
+                except OSError:
+                    pass
+        return total
+
+    def reserve(self, expected_bytes: int):
+        """Fail early instead of filling the partition halfway through an extraction"""
+        used = self.usage()
+        if used + expected_bytes > self.quota_bytes:
+            raise ScratchQuotaExceeded(
+                f"Scratch quota exceeded: {used + expected_bytes} of {self.quota_bytes} bytes in {self.root}"
+            )
+        free = shutil.disk_usage(self.root).free
+        if expected_bytes > free:
+            raise ScratchQuotaExceeded(f"Not enough free space in {self.root}: need {expected_bytes}, have {free}")
+
+    def close_all(self):
+        with self._lock:
+            jobs = list(self._jobs)
+        for job in jobs:
+            job.close()
+
+    def sweep_stale(self) -> int:
+        """Remove job directories whose process is gone"""
+        removed = 0
+        for parent in {self.root, self.ram_root}:
+            if not parent.is_dir():
+                continue
+            for directory in parent.glob("job-*"):
+                if self._is_stale(directory):
+                    shutil.rmtree(directory, ignore_errors=True)
+                    removed += 1
+        if removed:
+            logger.info(f"Removed {removed} scratch directories left by earlier runs")
+        return removed
+
+    @staticmethod
+    def _is_stale(directory: Path) -> bool:
+        try:
+            with open(directory / OWNER_FILE, 'r', encoding='utf-8') as f:
+                owner = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            owner = {}
+
+        pid = owner.get("pid")
+        if pid == os.getpid():
+            return False
+        if pid and sys.platform != "win32":
+            try:
+                os.kill(pid, 0)
+            except ProcessLookupError:
+                return True
+            except PermissionError:
+                # Alive, owned by another user
+                return False
+            else:
+                return False
+
+        # No usable pid check: fall back to age
+        try:
+            created = owner.get("created") or directory.stat().st_mtime
+        except OSError:
+            return False
+        return time.time() - created > STALE_JOB_SECONDS
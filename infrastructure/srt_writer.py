@@ -0,0 +1,33 @@
+from pathlib import Path
+from typing import List, Union
+from domain.interfaces import SubtitleEntry
+
+def format_srt(subtitles: List[SubtitleEntry]) -> str:
+    """Render subtitle entries as SRT text, renumbered from 1"""
+    blocks = []
+    for i, subtitle in enumerate(subtitles, 1):
+        blocks.append(f"{i}\n{subtitle.start_time} --> {subtitle.end_time}\n{subtitle.text}\n")
+    return "\n".join(blocks) + ("\n" if blocks else "")
+
+def write_srt(subtitles: List[SubtitleEntry], output_path: Union[str, Path]) -> Path:
+    """Write subtitle entries to an SRT file and return its path"""
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(format_srt(subtitles))
+    return output_path
+
+def parse_timestamp(timestamp: str) -> float:
+    """Seconds from an SRT timestamp (HH:MM:SS,mmm)"""
+    clock, _, millis = timestamp.partition(',')
+    hours, minutes, seconds = (int(part) for part in clock.split(':'))
+    return hours * 3600 + minutes * 60 + seconds + int(millis or 0) / 1000
+
+def format_timestamp(seconds: float) -> str:
+    """SRT timestamp (HH:MM:SS,mmm) for a position in seconds"""
+    # Round once so float error (1.001 * 1000 = 1000.9999...) cannot drop a millisecond
+    total_ms = round(seconds * 1000)
+    hours, total_ms = divmod(total_ms, 3_600_000)
+    minutes, total_ms = divmod(total_ms, 60_000)
+    secs, msecs = divmod(total_ms, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d},{msecs:03d}"
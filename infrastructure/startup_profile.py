@@ -0,0 +1,43 @@
+import logging
+import time
+from typing import List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Launch time beyond which the report is logged as a warning
+STARTUP_BUDGET_SECONDS = 3.0
+
+class StartupProfile:
+    """Wall time of each launch phase, reported against a budget
+
+    Call mark() as each phase finishes; a phase runs from the previous mark
+    (or construction) to this one.
+    """
+
+    def __init__(self, budget_seconds: float = STARTUP_BUDGET_SECONDS):
+        self.budget_seconds = budget_seconds
+        self.started = self._last = time.perf_counter()
+        self.phases: List[Tuple[str, float]] = []
+
+    def mark(self, phase: str):
+        now = time.perf_counter()
+        self.phases.append((phase, now - self._last))
+        self._last = now
+
+    @property
+    def total(self) -> float:
+        return self._last - self.started
+
+    def report(self) -> str:
+        total = self.total or 1e-9
+        parts = ", ".join(
+            f"{phase}={seconds:.2f}s ({seconds / total:.0%})"
+            for phase, seconds in sorted(self.phases, key=lambda item: -item[1])
+        )
+        return f"Startup took {self.total:.2f}s of a {self.budget_seconds:.1f}s budget: {parts}"
+
+    def log(self):
+        if self.total > self.budget_seconds:
+            logger.warning(self.report())
+        else:
+            logger.info(self.report())
@@ -96,11 +96,8 @@ class TerminalDebugger:
     def export_subtitles_to_srt(subtitles, output_path):
         """Export subtitles to SRT format"""
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                for i, subtitle in enumerate(subtitles, 1):
-                    f.write(f"{i}\n")
-                    f.write(f"{subtitle.start_time} --> {subtitle.end_time}\n")
-                    f.write(f"{subtitle.text}\n\n")
+            from infrastructure.srt_writer import write_srt
+            write_srt(subtitles, output_path)
             return True
         except Exception as e:
             logging.error(f"Failed to export SRT: {e}")
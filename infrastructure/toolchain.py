@@ -0,0 +1,160 @@
+import json
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import threading
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, List, Optional
+from infrastructure.preferences import DEFAULT_CONFIG_DIR
+
+logger = logging.getLogger(__name__)
+
+# Common Windows install locations; PATH and environment overrides are checked first
+WINDOWS_TOOL_DIRS = [
+    r"C:\Program Files\FFmpeg\bin",
+    r"C:\Program Files (x86)\FFmpeg\bin",
+    r"C:\ffmpeg\bin",
+    r"C:\Program Files\Gyan\FFmpeg\bin",
+    r"C:\Program Files\VideoLAN\VLC",
+    os.path.expanduser(r"~\ffmpeg\bin"),
+    r"D:\ffmpeg\bin",
+    r"E:\ffmpeg\bin",
+]
+
+@dataclass
+class ToolInfo:
+    path: str
+    version: str
+    # Binary mtime when it was validated; a change forces re-validation
+    mtime_ns: int
+
+class Toolchain:
+    """Locates ffmpeg/ffprobe on first use and remembers them across launches
+
+    Each candidate is validated with -version once; the winner is stored in
+    the config dir keyed on the binary's mtime, so later runs only stat it.
+    """
+
+    _shared: Optional["Toolchain"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, cache_path: Optional[Path] = None):
+        self.cache_path = cache_path or DEFAULT_CONFIG_DIR / "toolchain.json"
+        self._tools: Dict[str, Optional[ToolInfo]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> "Toolchain":
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def find(self, tool: str) -> Optional[ToolInfo]:
+        """Resolve a tool once per process; None if it is not installed"""
+        with self._lock:
+            if tool not in self._tools:
+                self._tools[tool] = self._resolve(tool)
+            return self._tools[tool]
+
+    def path(self, tool: str) -> Optional[str]:
+        info = self.find(tool)
+        return info.path if info else None
+
+    def forget(self):
+        """Drop resolved tools so the next lookup searches again"""
+        with self._lock:
+            self._tools.clear()
+        self.cache_path.unlink(missing_ok=True)
+
+    def _resolve(self, tool: str) -> Optional[ToolInfo]:
+        cached = self._load_cache().get(tool)
+        if cached and self._mtime_ns(cached.get("path")) == cached.get("mtime_ns"):
+            logger.debug(f"Using cached {tool} at {cached['path']}")
+            return ToolInfo(**cached)
+
+        for candidate in self._candidates(tool):
+            info = self._validate(candidate)
+            if info:
+                logger.debug(f"Found {tool} {info.version} at {info.path}")
+                self._store_cache(tool, info)
+                return info
+
+        logger.warning(f"{tool} executable not found. Audio processing may fail.")
+        return None
+
+    @staticmethod
+    def _candidates(tool: str) -> List[str]:
+        """Possible locations, most explicit first, without duplicates"""
+        executable = f"{tool}.exe" if sys.platform == "win32" else tool
+        candidates = [
+            os.environ.get(f"{tool.upper()}_BINARY"),
+            shutil.which(tool)
+        ]
+        if sys.platform == "win32":
+            candidates += [os.path.join(directory, executable) for directory in WINDOWS_TOOL_DIRS]
+
+        seen = []
+        for candidate in candidates:
+            if candidate and candidate not in seen and os.path.isfile(candidate):
+                seen.append(candidate)
+        return seen
+
+    def _validate(self, path: str) -> Optional[ToolInfo]:
+        """Run the binary once to confirm it works and read its version"""
+        try:
+            result = subprocess.run([path, "-version"], capture_output=True, text=True, timeout=10)
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.warning(f"Error checking {path}: {e}")
+            return None
+
+        if result.returncode != 0:
+            return None
+
+        # e.g. "ffmpeg version 6.1.1 Copyright ..."
+        words = result.stdout.split()
+        version = words[2] if len(words) > 2 and words[1] == "version" else "unknown"
+        return ToolInfo(path=path, version=version, mtime_ns=self._mtime_ns(path))
+
+    @staticmethod
+    def _mtime_ns(path: Optional[str]) -> Optional[int]:
+        try:
+            return os.stat(path).st_mtime_ns if path else None
+        except OSError:
+            return None
+
+    def _load_cache(self) -> dict:
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def _store_cache(self, tool: str, info: ToolInfo):
+        try:
+            data = self._load_cache()
+            data[tool] = asdict(info)
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.cache_path.with_suffix(".tmp")
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+            os.replace(temp_path, self.cache_path)
+        except OSError as e:
+            logger.warning(f"Could not cache {tool} location: {e}")
+
+def find_ffmpeg() -> Optional[str]:
+    """Path to a working ffmpeg, made visible to libraries that spawn it by name"""
+    path = Toolchain.shared().path("ffmpeg")
+    if path:
+        # MoviePy/imageio read FFMPEG_BINARY; Whisper's load_audio runs "ffmpeg" from PATH
+        os.environ.setdefault("FFMPEG_BINARY", path)
+        directory = os.path.dirname(path)
+        if directory not in os.environ.get("PATH", "").split(os.pathsep):
+            os.environ["PATH"] = directory + os.pathsep + os.environ.get("PATH", "")
+    return path
+
+def find_ffprobe() -> Optional[str]:
+    return Toolchain.shared().path("ffprobe")
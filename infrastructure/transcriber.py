@@ -1,95 +1,213 @@
 import whisper
-from domain.interfaces import Transcriber, SubtitleEntry
+import torch
+import numpy as np
+from dataclasses import replace
+from typing import Callable, Optional, Tuple
+from domain.interfaces import (
+    Transcriber, SubtitleEntry, AudioInput, TranscriptionOptions, MediaInfo, TimeRange, AUDIO_SAMPLE_RATE
+)
+from infrastructure.model_registry import ModelRegistry
+from infrastructure.audio_segmentation import SEARCH_SECONDS, find_split_points, split_on_silence
+from infrastructure.toolchain import find_ffmpeg
+from infrastructure.srt_writer import format_timestamp
 import pathlib
+import asyncio
 import logging
 import os
 import subprocess
-import sys
-import wave
-import contextlib
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-def find_ffmpeg():
-    """Find FFmpeg executable path"""
-    # Common FFmpeg installation paths
-    possible_paths = [
-        # Standard installation paths
-        r"C:\Program Files\FFmpeg\bin\ffmpeg.exe",
-        r"C:\Program Files (x86)\FFmpeg\bin\ffmpeg.exe",
-        r"C:\ffmpeg\bin\ffmpeg.exe",
-        
-        # Winget installation path
-        r"C:\Program Files\Gyan\FFmpeg\bin\ffmpeg.exe",
+# Named decode presets, from fastest to most accurate
+DECODE_PRESETS = {
+    "fast": TranscriptionOptions(model_size="tiny", temperature=0.0, condition_on_previous_text=False),
+    "fast-int8": TranscriptionOptions(
+        model_size="tiny", temperature=0.0, condition_on_previous_text=False, quantize_int8=True
+    ),
+    "balanced": TranscriptionOptions(model_size="base", temperature=0.0, condition_on_previous_text=False),
+    "default": TranscriptionOptions(),
+    "accurate": TranscriptionOptions(model_size="small", beam_size=5, best_of=5),
+}
+
+def load_whisper_model(model_name: str, quantize_int8: bool = False):
+    """Load a Whisper model, optionally int8-quantized for CPU inference"""
+    try:
+        logger.debug(f"Loading Whisper model {model_name}{' (int8)' if quantize_int8 else ''}")
+        if not quantize_int8:
+            return whisper.load_model(model_name)
         
-        # Path environment variable
-        *[os.path.join(path, "ffmpeg.exe") for path in os.environ.get("PATH", "").split(os.pathsep)]
+        # Dynamic quantization only runs on CPU
+        model = _plain_linears(whisper.load_model(model_name, device="cpu"))
+        return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    except Exception as e:
+        logger.error(f"Failed to load Whisper model: {e}", exc_info=True)
+        raise
+
+def _plain_linears(module: torch.nn.Module) -> torch.nn.Module:
+    """Swap Whisper's Linear subclass for torch.nn.Linear, sharing the weights
+
+    quantize_dynamic matches module types exactly and its quantized Linear only
+    converts plain nn.Linear, so Whisper's layers would otherwise stay fp32.
+    """
+    for name, child in module.named_children():
+        if isinstance(child, torch.nn.Linear) and type(child) is not torch.nn.Linear:
+            plain = torch.nn.Linear(child.in_features, child.out_features, bias=child.bias is not None)
+            plain.weight = child.weight
+            plain.bias = child.bias
+            setattr(module, name, plain)
+        else:
+            _plain_linears(child)
+    return module
+
+def decode_kwargs(options: Optional[TranscriptionOptions]) -> dict:
+    """Translate job options into whisper.transcribe keyword arguments"""
+    options = options or TranscriptionOptions()
+    kwargs = {
+        "beam_size": options.beam_size,
+        "best_of": options.best_of,
+        "temperature": options.temperature,
+        "condition_on_previous_text": options.condition_on_previous_text,
+        "language": options.language,
+        # FP16 only helps on GPU; on CPU Whisper would warn and fall back anyway
+        "fp16": options.fp16 if options.fp16 is not None else (
+            torch.cuda.is_available() and not options.quantize_int8
+        ),
+    }
+    return {key: value for key, value in kwargs.items() if value is not None}
+
+# Whisper detects language from the first 30 s of audio
+LANGUAGE_DETECTION_SECONDS = 30
+
+def detect_language_with(model, samples: np.ndarray) -> str:
+    """Most likely language of the first 30 s of samples using a loaded model"""
+    mel = whisper.log_mel_spectrogram(
+        whisper.pad_or_trim(samples), model.dims.n_mels
+    ).to(model.device)
+    _, probs = model.detect_language(mel)
+    return max(probs, key=probs.get)
+
+def detection_window(time_range: Optional[TimeRange] = None) -> Tuple[float, float]:
+    """Start and length in seconds of the audio language detection listens to"""
+    if time_range is None:
+        return 0.0, LANGUAGE_DETECTION_SECONDS
+    seconds = LANGUAGE_DETECTION_SECONDS
+    if time_range.duration is not None:
+        seconds = min(seconds, time_range.duration)
+    return time_range.start, seconds
+
+def load_audio_head(
+    path: pathlib.Path,
+    seconds: float = LANGUAGE_DETECTION_SECONDS,
+    start: float = 0.0
+) -> np.ndarray:
+    """Decode only seconds of any media file from start on to 16 kHz mono float32"""
+    # -ss before -i seeks in the input instead of decoding up to start
+    cmd = [
+        find_ffmpeg() or "ffmpeg", "-nostdin", "-v", "error",
+        "-ss", str(start), "-t", str(seconds), "-i", str(path),
+        "-f", "s16le", "-ac", "1", "-ar", str(AUDIO_SAMPLE_RATE), "-"
     ]
-    
-    for path in possible_paths:
-        if os.path.exists(path):
-            logger.debug(f"Found FFmpeg at: {path}")
-            return path
-    
-    logger.warning("FFmpeg executable not found. Audio processing may fail.")
-    return None
-
-# Global FFmpeg path
-FFMPEG_PATH = find_ffmpeg()
+    result = subprocess.run(cmd, capture_output=True, check=True)
+    return np.frombuffer(result.stdout, np.int16).astype(np.float32) / 32768.0
 
 class WhisperTranscriber(Transcriber):
-    def __init__(self):
+    def __init__(
+        self,
+        model_name: str = "base",
+        window_seconds: float = 300.0,
+        registry: Optional[ModelRegistry] = None
+    ):
+        self.model_name = model_name
+        # Audio is decoded in windows cut at pauses near every window_seconds, so
+        # segments can be emitted (and progress reported) before the file ends
+        self.window_seconds = window_seconds
+        # Model is loaded on first transcription and shared with other jobs
+        self.registry = registry or ModelRegistry.shared()
+
+    def _model_for(self, options: Optional[TranscriptionOptions]):
+        """Model name and int8 flag for a job, falling back to the transcriber default"""
+        options = options or TranscriptionOptions()
+        return options.model_size or self.model_name, options.quantize_int8
+
+    @staticmethod
+    def _model_key(model_name: str, quantize_int8: bool) -> str:
+        return f"whisper:{model_name}{':int8' if quantize_int8 else ''}"
+
+    def _transcribe_window(self, window: np.ndarray, options: Optional[TranscriptionOptions]) -> dict:
+        """Run Whisper on one window using the shared model (called in a worker thread)"""
+        model_name, quantize_int8 = self._model_for(options)
+        key = self._model_key(model_name, quantize_int8)
+        
+        with self.registry.use(key, lambda: load_whisper_model(model_name, quantize_int8)) as model:
+            return model.transcribe(window, **decode_kwargs(options))
+
+    def _detect_window(self, samples: np.ndarray, options: Optional[TranscriptionOptions]) -> str:
+        """Run language detection on the shared model (called in a worker thread)"""
+        model_name, quantize_int8 = self._model_for(options)
+        key = self._model_key(model_name, quantize_int8)
+        
+        with self.registry.use(key, lambda: load_whisper_model(model_name, quantize_int8)) as model:
+            return detect_language_with(model, samples)
+
+    async def detect_language(
+        self,
+        audio: AudioInput,
+        options: Optional[TranscriptionOptions] = None,
+        time_range: Optional[TimeRange] = None
+    ) -> Optional[str]:
+        """Detect the spoken language from the first 30 s of a media file or buffer,
+        counted from the start of time_range
+        """
+        loop = asyncio.get_running_loop()
+        start, seconds = detection_window(time_range)
         try:
-            logger.debug("Loading Whisper model")
-            # Verify FFmpeg is available
-            if not FFMPEG_PATH:
-                logger.warning("FFmpeg not found. Audio processing may be limited.")
+            if isinstance(audio, pathlib.Path):
+                samples = await loop.run_in_executor(None, load_audio_head, audio, seconds, start)
+            elif isinstance(audio, np.ndarray):
+                first = int(start * AUDIO_SAMPLE_RATE)
+                samples = audio[first:first + int(seconds * AUDIO_SAMPLE_RATE)].astype(np.float32, copy=False)
+            else:
+                # A stream can only be read once; transcribe_stream detects from its first window
+                return None
             
-            # Load Whisper model
-            self.model = whisper.load_model("base")
-            logger.debug("Whisper model loaded successfully")
+            if len(samples) == 0:
+                return None
+            
+            language = await loop.run_in_executor(None, self._detect_window, samples, options)
+            logger.debug(f"Detected language '{language}' for {audio if isinstance(audio, pathlib.Path) else 'buffer'}")
+            return language
+        
         except Exception as e:
-            logger.error(f"Failed to load Whisper model: {e}", exc_info=True)
-            raise
+            logger.warning(f"Language detection failed: {e}")
+            return None
 
-    async def transcribe(self, audio_path: pathlib.Path) -> list[SubtitleEntry]:
+    def describe_settings(self, options: Optional[TranscriptionOptions] = None) -> dict:
+        model_name, quantize_int8 = self._model_for(options)
+        return {
+            "transcriber": "whisper",
+            "model": model_name,
+            "int8": quantize_int8,
+            "decode": decode_kwargs(options),
+            "window_seconds": self.window_seconds,
+            "window_cuts": "silence"
+        }
+
+    async def transcribe(
+        self,
+        audio: AudioInput,
+        options: Optional[TranscriptionOptions] = None,
+        media: Optional[MediaInfo] = None,
+        progress_callback: Optional[Callable[[float], None]] = None
+    ) -> list[SubtitleEntry]:
         try:
-            # Validate input audio file
-            if not audio_path.exists():
-                raise FileNotFoundError(f"Audio file not found: {audio_path}")
-            
-            # Log audio file details
-            logger.debug(f"Transcribing audio file: {audio_path}")
-            logger.debug(f"Audio file size: {os.path.getsize(audio_path)} bytes")
-            
-            # Validate audio file
-            audio_duration = self._get_audio_duration(audio_path)
-            if audio_duration <= 0:
-                raise ValueError(f"Invalid audio file: {audio_path}")
+            # Same windows as the streaming path, so both give the same transcript
+            subtitles = [
+                entry async for entry in self.transcribe_stream(audio, options, media, progress_callback)
+            ]
             
-            # Transcribe audio
-            logger.debug("Starting transcription")
-            result = self.model.transcribe(str(audio_path))
-            
-            # Validate transcription result
-            if not result or 'segments' not in result:
-                raise ValueError("No transcription segments found")
-            
-            # Convert segments to subtitle entries
-            subtitles = []
-            for i, segment in enumerate(result["segments"]):
-                # Skip empty segments
-                if not segment["text"].strip():
-                    continue
-                
-                entry = SubtitleEntry(
-                    index=i + 1,
-                    start_time=self._format_timestamp(segment["start"]),
-                    end_time=self._format_timestamp(segment["end"]),
-                    text=segment["text"].strip()
-                )
-                subtitles.append(entry)
+            if not subtitles:
+                logger.warning("Transcription produced no subtitle entries")
             
             # Log transcription results
             logger.debug(f"Transcription completed. Generated {len(subtitles)} subtitle entries")
@@ -100,50 +218,149 @@ class WhisperTranscriber(Transcriber):
             logger.error(f"Transcription error: {e}", exc_info=True)
             raise
 
-    def _get_audio_duration(self, audio_path: pathlib.Path) -> float:
-        """Get audio duration using multiple methods"""
+    async def transcribe_stream(
+        self,
+        audio: AudioInput,
+        options: Optional[TranscriptionOptions] = None,
+        media: Optional[MediaInfo] = None,
+        progress_callback: Optional[Callable[[float], None]] = None
+    ):
+        """Yield subtitle entries window by window while audio is still being decoded"""
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        
+        # Read ahead so FFmpeg keeps decoding while Whisper runs on the previous window
+        windows: asyncio.Queue = asyncio.Queue(maxsize=2)
+        reader = asyncio.create_task(self._read_windows(audio, windows))
+        
+        index = 0
+        offset = 0.0
+        decoded_any = False
         try:
-            # Method 1: Use wave module for WAV files
-            if audio_path.suffix.lower() == '.wav':
-                with contextlib.closing(wave.open(str(audio_path), 'rb')) as wf:
-                    frames = wf.getnframes()
-                    rate = wf.getframerate()
-                    duration = frames / float(rate)
-                    return duration
-            
-            # Method 2: Use FFmpeg if available
-            if FFMPEG_PATH:
-                cmd = [
-                    FFMPEG_PATH, 
-                    '-i', str(audio_path), 
-                    '-show_entries', 'format=duration', 
-                    '-v', 'quiet', 
-                    '-of', 'csv=p=0'
-                ]
+            while True:
+                window = await windows.get()
+                if window is None:
+                    break
+                decoded_any = True
                 
-                result = subprocess.run(cmd, capture_output=True, text=True)
+                # Transcribe in a worker thread so the event loop stays responsive
+                logger.debug(f"Transcribing window at {offset:.1f}s ({len(window) / AUDIO_SAMPLE_RATE:.1f}s)")
+                result = await loop.run_in_executor(None, self._transcribe_window, window, options)
                 
-                try:
-                    duration = float(result.stdout.strip())
-                    return duration
-                except ValueError:
-                    logger.warning(f"Could not determine audio duration using FFmpeg: {result.stdout}")
+                # Validate transcription result
+                if not result or 'segments' not in result:
+                    raise ValueError("No transcription segments found")
+                
+                # Detect once per file: later windows reuse the first window's language
+                if not (options and options.language) and result.get("language"):
+                    options = replace(options or TranscriptionOptions(), language=result["language"])
+                
+                # Convert segments to subtitle entries on the global timeline
+                for segment in result["segments"]:
+                    # Skip empty segments
+                    if not segment["text"].strip():
+                        continue
+                    
+                    index += 1
+                    yield SubtitleEntry(
+                        index=index,
+                        start_time=self._format_timestamp(offset + segment["start"]),
+                        end_time=self._format_timestamp(offset + segment["end"]),
+                        text=segment["text"].strip()
+                    )
+                
+                offset += len(window) / AUDIO_SAMPLE_RATE
+                if progress_callback:
+                    progress_callback(offset)
+                
+                # Probed duration gives a real ETA instead of guessing from file size
+                if media and media.duration > 0:
+                    done = min(offset / media.duration, 1.0)
+                    elapsed = loop.time() - started
+                    logger.debug(f"Transcribed {offset:.0f}/{media.duration:.0f}s ({done:.0%}), "
+                                 f"ETA {elapsed / done * (1 - done):.0f}s")
             
-            # Method 3: Fallback to file size check
-            file_size = os.path.getsize(audio_path)
-            if file_size > 0:
-                logger.warning("Using file size as a proxy for audio duration")
-                return file_size / 1024  # Very rough estimate
+            # Surface reader errors (FFmpeg failure, missing file)
+            await reader
             
-            return 0
+            if not decoded_any:
+                raise ValueError("Invalid audio input: no audio samples")
         
-        except Exception as e:
-            logger.error(f"Audio duration check error: {e}", exc_info=True)
-            return 0
-
-    def _format_timestamp(self, seconds: float) -> str:
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        msecs = int((seconds * 1000) % 1000)
-        return f"{hours:02d}:{minutes:02d}:{secs:02d},{msecs:03d}"
+        finally:
+            if not reader.done():
+                reader.cancel()
+                try:
+                    await reader
+                except asyncio.CancelledError:
+                    pass
+
+    async def _read_windows(self, audio: AudioInput, windows: asyncio.Queue):
+        """Split a path, buffer or chunk stream into windows cut at pauses"""
+        try:
+            if isinstance(audio, pathlib.Path):
+                # FFmpeg decodes the whole file; keep it off the event loop
+                loop = asyncio.get_running_loop()
+                samples = await loop.run_in_executor(None, self._load_audio_file, audio)
+            elif isinstance(audio, np.ndarray):
+                samples = audio.astype(np.float32, copy=False)
+            else:
+                samples = None
+            
+            if samples is not None:
+                for _, window in split_on_silence(samples, AUDIO_SAMPLE_RATE, self.window_seconds):
+                    await windows.put(window)
+            else:
+                await self._read_stream_windows(audio, windows)
+        
+        except asyncio.CancelledError:
+            # Consumer went away, nobody is waiting for the sentinel
+            raise
+        except Exception:
+            # Unblock the consumer; the error is re-raised when it awaits this task
+            await windows.put(None)
+            raise
+        
+        await windows.put(None)
+
+    async def _read_stream_windows(self, audio, windows: asyncio.Queue):
+        """Cut streamed chunks into the same windows split_on_silence gives for the whole input"""
+        # A cut is final once enough audio follows it that the whole-input split
+        # would make the same one (it needs 1.25 windows left, plus the pause search)
+        window_seconds = self.window_seconds
+        lookahead = int((window_seconds * 1.25 + SEARCH_SECONDS + 1.0) * AUDIO_SAMPLE_RATE)
+        pending = []
+        pending_samples = 0
+        async for chunk in audio:
+            pending.append(chunk)
+            pending_samples += len(chunk)
+            while pending_samples >= lookahead:
+                buffer = np.concatenate(pending).astype(np.float32, copy=False)
+                cut = find_split_points(buffer, AUDIO_SAMPLE_RATE, window_seconds)[0]
+                await windows.put(buffer[:cut])
+                pending = [buffer[cut:]]
+                pending_samples = len(pending[0])
+        
+        if pending_samples:
+            buffer = np.concatenate(pending).astype(np.float32, copy=False)
+            for _, window in split_on_silence(buffer, AUDIO_SAMPLE_RATE, window_seconds):
+                await windows.put(window)
+
+    def _load_audio_file(self, audio_path: pathlib.Path) -> np.ndarray:
+        """Validate an audio file and decode it to 16 kHz mono float32"""
+        # Validate input audio file
+        if not audio_path.exists():
+            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+        
+        # Log audio file details
+        logger.debug(f"Transcribing audio file: {audio_path}")
+        logger.debug(f"Audio file size: {os.path.getsize(audio_path)} bytes")
+        
+        # whisper.load_audio runs "ffmpeg" from PATH; make sure the located binary is on it
+        find_ffmpeg()
+        
+        # Decoding validates the file; an empty result is rejected by the caller
+        return whisper.load_audio(str(audio_path), sr=AUDIO_SAMPLE_RATE)
+
+    @staticmethod
+    def _format_timestamp(seconds: float) -> str:
+        return format_timestamp(seconds)
@@ -0,0 +1,211 @@
+import argparse
+import hashlib
+import json
+import logging
+import os
+import sys
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import List, Optional
+from domain.interfaces import SubtitleEntry
+from infrastructure.preferences import DEFAULT_CONFIG_DIR
+
+logger = logging.getLogger(__name__)
+
+# Bytes hashed from each end of the video for the fingerprint
+FINGERPRINT_BLOCK_SIZE = 1024 * 1024
+
+class TranscriptCache:
+    """On-disk transcript cache keyed by video fingerprint and transcriber settings"""
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.cache_dir = cache_dir or DEFAULT_CONFIG_DIR / "transcripts"
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def fingerprint(video_path: Path) -> str:
+        """Cheap content fingerprint: size, mtime and hashes of the first and last blocks"""
+        stat = video_path.stat()
+        digest = hashlib.sha256()
+        digest.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode())
+
+        with open(video_path, 'rb') as f:
+            digest.update(f.read(FINGERPRINT_BLOCK_SIZE))
+            if stat.st_size > FINGERPRINT_BLOCK_SIZE:
+                f.seek(max(stat.st_size - FINGERPRINT_BLOCK_SIZE, FINGERPRINT_BLOCK_SIZE))
+                digest.update(f.read(FINGERPRINT_BLOCK_SIZE))
+
+        return digest.hexdigest()
+
+    def make_key(self, video_path: Path, settings: dict) -> str:
+        payload = json.dumps(
+            {"video": self.fingerprint(video_path), "settings": settings},
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[List[SubtitleEntry]]:
+        path = self._entry_path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Discarding unreadable transcript cache entry {path}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+        # Touch for age-based pruning
+        os.utime(path)
+        return [SubtitleEntry(**entry) for entry in data["subtitles"]]
+
+    def put(
+        self,
+        key: str,
+        subtitles: List[SubtitleEntry],
+        video_path: Path,
+        settings: dict
+    ) -> None:
+        data = {
+            "video": str(video_path),
+            # Lets prune tell which detected-language files are still in use
+            "fingerprint": self.fingerprint(video_path),
+            "settings": settings,
+            "created": time.time(),
+            "subtitles": [asdict(entry) for entry in subtitles]
+        }
+
+        # Write atomically so a crash never leaves a truncated entry
+        path = self._entry_path(key)
+        temp_path = path.with_suffix(".tmp")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(temp_path, path)
+        logger.debug(f"Cached transcript for {video_path} ({len(subtitles)} entries)")
+
+    def _language_path(self, video_path: Path) -> Path:
+        return self.cache_dir / f"{self.fingerprint(video_path)}.lang"
+
+    def get_language(self, video_path: Path) -> Optional[str]:
+        """Previously detected spoken language of this video"""
+        try:
+            return self._language_path(video_path).read_text(encoding='utf-8').strip() or None
+        except OSError:
+            return None
+
+    def put_language(self, video_path: Path, language: str) -> None:
+        self._language_path(video_path).write_text(language, encoding='utf-8')
+
+    def entries(self) -> List[dict]:
+        """Summaries of all cached transcripts, most recently used first"""
+        summaries = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                stat = path.stat()
+            except (OSError, json.JSONDecodeError):
+                continue
+
+            summaries.append({
+                "key": path.stem,
+                "video": data.get("video"),
+                "fingerprint": data.get("fingerprint"),
+                "settings": data.get("settings"),
+                "subtitles": len(data.get("subtitles", [])),
+                "bytes": stat.st_size,
+                "last_used": stat.st_mtime
+            })
+
+        return sorted(summaries, key=lambda entry: entry["last_used"], reverse=True)
+
+    def prune(self, max_age_days: Optional[float] = None, max_total_bytes: Optional[int] = None) -> int:
+        """Remove stale entries, then the least recently used until under the size cap"""
+        removed = 0
+        now = time.time()
+        kept = []
+
+        for entry in self.entries():
+            if max_age_days is not None and now - entry["last_used"] > max_age_days * 86400:
+                self._entry_path(entry["key"]).unlink(missing_ok=True)
+                removed += 1
+            else:
+                kept.append(entry)
+
+        if max_total_bytes is not None:
+            total = sum(entry["bytes"] for entry in kept)
+            # Entries are sorted most recently used first
+            while kept and total > max_total_bytes:
+                entry = kept.pop()
+                self._entry_path(entry["key"]).unlink(missing_ok=True)
+                total -= entry["bytes"]
+                removed += 1
+
+        # Detected languages only live as long as a transcript of their video
+        fingerprints = {entry["fingerprint"] for entry in kept}
+        for path in self.cache_dir.glob("*.lang"):
+            if path.stem not in fingerprints:
+                path.unlink(missing_ok=True)
+
+        return removed
+
+    def clear(self) -> int:
+        return self.prune(max_age_days=-1)
+
+def main(argv=None) -> int:
+    """Inspect and prune the transcript cache from the command line"""
+    parser = argparse.ArgumentParser(
+        prog="python -m infrastructure.transcript_cache",
+        description="Inspect and prune cached Whisper transcripts"
+    )
+    parser.add_argument("--cache-dir", type=Path, default=None, help="Cache directory to operate on")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("list", help="List cached transcripts")
+
+    show = commands.add_parser("show", help="Print one cached transcript as SRT-like text")
+    show.add_argument("key")
+
+    prune = commands.add_parser("prune", help="Remove old entries or enforce a size cap")
+    prune.add_argument("--older-than", type=float, metavar="DAYS", help="Remove entries unused for DAYS")
+    prune.add_argument("--max-size", type=float, metavar="MB", help="Keep total cache size under MB")
+
+    commands.add_parser("clear", help="Remove every cached transcript")
+
+    args = parser.parse_args(argv)
+    cache = TranscriptCache(args.cache_dir)
+
+    if args.command == "list":
+        entries = cache.entries()
+        for entry in entries:
+            settings = entry["settings"] or {}
+            print(f"{entry['key'][:16]}  {entry['subtitles']:>5} subs  {entry['bytes'] / 1024:>8.1f} KiB  "
+                  f"{settings.get('model', '-'):<8} {entry['video']}")
+        total = sum(entry["bytes"] for entry in entries)
+        print(f"{len(entries)} transcripts, {total / (1024 * 1024):.1f} MiB in {cache.cache_dir}")
+
+    elif args.command == "show":
+        matches = [entry for entry in cache.entries() if entry["key"].startswith(args.key)]
+        if len(matches) != 1:
+            print(f"No unique transcript matches '{args.key}'", file=sys.stderr)
+            return 1
+        for subtitle in cache.get(matches[0]["key"]) or []:
+            print(f"{subtitle.index}\n{subtitle.start_time} --> {subtitle.end_time}\n{subtitle.text}\n")
+
+    elif args.command == "prune":
+        max_bytes = int(args.max_size * 1024 * 1024) if args.max_size is not None else None
+        removed = cache.prune(max_age_days=args.older_than, max_total_bytes=max_bytes)
+        print(f"Removed {removed} transcripts")
+
+    elif args.command == "clear":
+        print(f"Removed {cache.clear()} transcripts")
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
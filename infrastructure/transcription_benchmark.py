@@ -0,0 +1,119 @@
+"""Compare Whisper decode presets on one clip: load time, speed and accuracy
+
+    python -m infrastructure.transcription_benchmark clip.wav --reference clip.txt \
+        --presets fast,fast-int8,balanced,accurate
+"""
+import argparse
+import asyncio
+import json
+import logging
+import re
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+from domain.interfaces import AUDIO_SAMPLE_RATE
+
+logger = logging.getLogger(__name__)
+
+def normalize_words(text: str) -> List[str]:
+    """Lowercase and strip punctuation so WER counts only word differences"""
+    return re.sub(r"[^\w\s']", " ", text.lower()).split()
+
+def word_error_rate(reference: str, hypothesis: str) -> float:
+    """Word-level Levenshtein distance divided by the reference length"""
+    ref = normalize_words(reference)
+    hyp = normalize_words(hypothesis)
+    if not ref:
+        return 0.0 if not hyp else 1.0
+
+    previous = list(range(len(hyp) + 1))
+    for i, ref_word in enumerate(ref, 1):
+        current = [i] + [0] * len(hyp)
+        for j, hyp_word in enumerate(hyp, 1):
+            current[j] = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ref_word != hyp_word)
+            )
+        previous = current
+
+    return previous[-1] / len(ref)
+
+def benchmark_preset(samples, preset: str, reference: Optional[str] = None) -> dict:
+    """Transcribe samples with one preset, timing model load and decoding separately"""
+    from infrastructure.transcriber import DECODE_PRESETS, WhisperTranscriber, load_whisper_model
+    from infrastructure.model_registry import ModelRegistry
+
+    options = DECODE_PRESETS[preset]
+    # A private registry so every preset pays its own load cost
+    registry = ModelRegistry(idle_timeout=0)
+    transcriber = WhisperTranscriber(registry=registry)
+    model_name, quantize_int8 = transcriber._model_for(options)
+
+    start = time.perf_counter()
+    registry.get(
+        transcriber._model_key(model_name, quantize_int8),
+        lambda: load_whisper_model(model_name, quantize_int8)
+    )
+    load_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    subtitles = asyncio.run(transcriber.transcribe(samples, options))
+    elapsed = time.perf_counter() - start
+    registry.shutdown()
+
+    duration = len(samples) / AUDIO_SAMPLE_RATE
+    hypothesis = " ".join(entry.text for entry in subtitles)
+    return {
+        "preset": preset,
+        "model": model_name,
+        "int8": quantize_int8,
+        "load_seconds": round(load_seconds, 2),
+        "transcribe_seconds": round(elapsed, 2),
+        "real_time_factor": round(elapsed / duration, 3) if duration else None,
+        "wer": round(word_error_rate(reference, hypothesis), 4) if reference is not None else None,
+        "segments": len(subtitles)
+    }
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m infrastructure.transcription_benchmark",
+        description="Measure speed and word error rate of Whisper decode presets"
+    )
+    parser.add_argument("clip", type=Path, help="Audio or video clip to transcribe")
+    parser.add_argument("--reference", type=Path, help="Plain-text reference transcript for WER")
+    parser.add_argument("--presets", default="fast,balanced,default,accurate", help="Comma-separated preset names")
+    parser.add_argument("--json", type=Path, help="Also write results to this JSON file")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, stream=sys.stderr)
+
+    import whisper
+    from infrastructure.transcriber import DECODE_PRESETS
+
+    presets = [name.strip() for name in args.presets.split(",") if name.strip()]
+    unknown = [name for name in presets if name not in DECODE_PRESETS]
+    if unknown:
+        print(f"Unknown presets: {', '.join(unknown)} (choose from {', '.join(DECODE_PRESETS)})", file=sys.stderr)
+        return 2
+
+    reference = args.reference.read_text(encoding='utf-8') if args.reference else None
+    samples = whisper.load_audio(str(args.clip), AUDIO_SAMPLE_RATE)
+
+    results = []
+    print(f"{'preset':<10} {'model':<8} {'load s':>7} {'decode s':>9} {'RTF':>6} {'WER':>7}")
+    for preset in presets:
+        result = benchmark_preset(samples, preset, reference)
+        results.append(result)
+        wer = f"{result['wer']:.2%}" if result['wer'] is not None else "-"
+        print(f"{preset:<10} {result['model']:<8} {result['load_seconds']:>7.2f} "
+              f"{result['transcribe_seconds']:>9.2f} {result['real_time_factor']:>6.3f} {wer:>7}")
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2), encoding='utf-8')
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
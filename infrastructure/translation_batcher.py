@@ -0,0 +1,89 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Separates the texts of a batch inside one request string; translators keep line breaks
+BATCH_DELIMITER = "\n"
+
+class TranslationBatcher:
+    """Pack many short texts into size-bounded requests and run them concurrently"""
+
+    def __init__(
+        self,
+        translate_batch: Callable[[List[str]], Awaitable[List[Optional[str]]]],
+        max_batch_chars: int = 4500,
+        max_batch_items: int = 100,
+        max_concurrency: int = 4
+    ):
+        self.translate_batch = translate_batch
+        self.max_batch_chars = max_batch_chars
+        self.max_batch_items = max_batch_items
+        self.max_concurrency = max(1, max_concurrency)
+
+    @staticmethod
+    def pack(texts: List[str], max_batch_chars: int, max_batch_items: int) -> List[List[int]]:
+        """Group text indices into batches that stay within the size budget"""
+        batches = []
+        current = []
+        current_chars = 0
+
+        for index, text in enumerate(texts):
+            # An oversized text still gets a batch of its own
+            if current and (
+                current_chars + len(text) > max_batch_chars or
+                len(current) >= max_batch_items
+            ):
+                batches.append(current)
+                current = []
+                current_chars = 0
+
+            current.append(index)
+            current_chars += len(text)
+
+        if current:
+            batches.append(current)
+
+        return batches
+
+    @staticmethod
+    def join(texts: List[str]) -> str:
+        """One request string for a batch; line breaks inside a text become spaces"""
+        return BATCH_DELIMITER.join(" ".join(text.splitlines()) for text in texts)
+
+    @staticmethod
+    def split(translated: str, expected: int) -> Optional[List[str]]:
+        """Texts of a translated batch string, or None if the count does not match"""
+        parts = [part.strip() for part in translated.strip().split(BATCH_DELIMITER)]
+        return parts if len(parts) == expected else None
+
+    async def translate(self, texts: List[str]) -> List[Optional[str]]:
+        """Translate all texts, returning results in the original order
+
+        Results are passed through as translate_batch returns them, including
+        any None it uses to mark a failed text.
+        """
+        results = list(texts)
+        batches = self.pack(texts, self.max_batch_chars, self.max_batch_items)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        logger.debug(f"Translating {len(texts)} texts in {len(batches)} batches "
+                     f"(concurrency {self.max_concurrency})")
+
+        async def run_batch(indices: List[int]):
+            async with semaphore:
+                batch_texts = [texts[i] for i in indices]
+                translated = await self.translate_batch(batch_texts)
+
+            # A short or malformed response keeps the originals for that batch
+            if len(translated) != len(indices):
+                logger.warning(f"Batch returned {len(translated)} results for {len(indices)} texts; "
+                               f"keeping original text")
+                return
+
+            for index, text in zip(indices, translated):
+                results[index] = text
+
+        await asyncio.gather(*(run_batch(indices) for indices in batches))
+        return results
@@ -0,0 +1,186 @@
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import unicodedata
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional
+from domain.interfaces import SubtitleEntry
+from infrastructure.preferences import DEFAULT_CONFIG_DIR
+from infrastructure.translation_executor import TranslationExecutor
+
+logger = logging.getLogger(__name__)
+
+class TranslationCache:
+    """Persistent, content-addressed translation cache with LRU eviction"""
+
+    _shared: Optional["TranslationCache"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, db_path: Optional[Path] = None, max_entries: int = 200_000):
+        self.db_path = db_path or DEFAULT_CONFIG_DIR / "translation_cache.sqlite3"
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        # Translators run in executor threads, so the connection is shared under a lock
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS translations ("
+            "key TEXT PRIMARY KEY, "
+            "translation TEXT NOT NULL, "
+            "last_used INTEGER NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_translations_last_used ON translations (last_used)"
+        )
+        self._conn.commit()
+
+        # Logical clock for recency; wall-clock time is too coarse on some platforms
+        self._clock = self._conn.execute(
+            "SELECT COALESCE(MAX(last_used), 0) FROM translations"
+        ).fetchone()[0]
+
+    def _tick(self) -> int:
+        self._clock += 1
+        return self._clock
+
+    @classmethod
+    def shared(cls) -> "TranslationCache":
+        """Process-wide cache stored under the preferences directory"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Normalize unicode form and whitespace so trivial variants share an entry"""
+        return ' '.join(unicodedata.normalize('NFC', text).split())
+
+    @classmethod
+    def make_key(cls, text: str, source_language: str, target_language: str, backend: str) -> str:
+        payload = json.dumps(
+            [backend, source_language, target_language, cls.normalize(text)],
+            ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get_many(self, keys: List[str]) -> Dict[str, str]:
+        """Look up several keys at once, refreshing their recency"""
+        if not keys:
+            return {}
+
+        unique_keys = list(dict.fromkeys(keys))
+        found = {}
+        with self._lock:
+            # Stay well below SQLite's bound-parameter limit
+            for start in range(0, len(unique_keys), 500):
+                batch = unique_keys[start:start + 500]
+                placeholders = ','.join('?' * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, translation FROM translations WHERE key IN ({placeholders})",
+                    batch
+                ).fetchall()
+                found.update(rows)
+
+            if found:
+                now = self._tick()
+                self._conn.executemany(
+                    "UPDATE translations SET last_used = ? WHERE key = ?",
+                    [(now, key) for key in found]
+                )
+                self._conn.commit()
+
+            self.hits += sum(1 for key in keys if key in found)
+            self.misses += sum(1 for key in keys if key not in found)
+
+        return found
+
+    def put_many(self, items: Dict[str, str]) -> None:
+        """Store translations and evict the least recently used overflow"""
+        if not items:
+            return
+
+        with self._lock:
+            now = self._tick()
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO translations (key, translation, last_used) VALUES (?, ?, ?)",
+                [(key, translation, now) for key, translation in items.items()]
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        count = self._conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM translations WHERE key IN ("
+                "SELECT key FROM translations ORDER BY last_used ASC LIMIT ?)",
+                (overflow,)
+            )
+            logger.debug(f"Evicted {overflow} least recently used translations")
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            size = self._conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+        return {"hits": self.hits, "misses": self.misses, "entries": size}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM translations")
+            self._conn.commit()
+
+    async def translate_entries(
+        self,
+        subtitles: List[SubtitleEntry],
+        source_language: str,
+        target_language: str,
+        backend: str,
+        translate: Callable[[List[SubtitleEntry]], Awaitable[List[SubtitleEntry]]]
+    ) -> List[SubtitleEntry]:
+        """Serve cached entries and send each distinct uncached text to the backend once
+
+        Backends fall back to the original text on failure, so results identical
+        to their input are not stored. SQLite reads and commits run on the
+        translation pool, never on the event loop.
+        """
+        keys = [
+            self.make_key(subtitle.text, source_language, target_language, backend)
+            for subtitle in subtitles
+        ]
+        executor = TranslationExecutor.shared()
+        cached = await executor.run(self.get_many, keys)
+
+        # Deduplicate misses so recurring lines cost a single backend call
+        pending = {}
+        for subtitle, key in zip(subtitles, keys):
+            if key not in cached and key not in pending:
+                pending[key] = subtitle
+
+        translated = dict(cached)
+        if pending:
+            results = await translate(list(pending.values()))
+            fresh = {}
+            for (key, original), result in zip(pending.items(), results):
+                translated[key] = result.text
+                if result.text != original.text:
+                    fresh[key] = result.text
+            await executor.run(self.put_many, fresh)
+
+        logger.debug(f"Translation cache ({backend}): {len(cached)} hits, {len(pending)} backend texts")
+
+        return [
+            SubtitleEntry(
+                index=subtitle.index,
+                start_time=subtitle.start_time,
+                end_time=subtitle.end_time,
+                text=translated.get(key, subtitle.text)
+            )
+            for subtitle, key in zip(subtitles, keys)
+        ]
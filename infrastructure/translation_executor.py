@@ -0,0 +1,53 @@
+import asyncio
+import functools
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Blocking translator calls (HTTP requests, Argos batches) allowed at once
+DEFAULT_TRANSLATION_THREADS = 8
+
+class TranslationExecutor:
+    """Dedicated, bounded thread pool for blocking translator calls
+
+    Keeps translation I/O out of the event loop without competing with audio
+    loading and model calls for the loop's default executor.
+    """
+
+    _shared: Optional["TranslationExecutor"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, max_workers: int = DEFAULT_TRANSLATION_THREADS):
+        self.max_workers = max(1, max_workers)
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="translate")
+
+    @classmethod
+    def shared(cls) -> "TranslationExecutor":
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @classmethod
+    def configure(cls, max_workers: int) -> "TranslationExecutor":
+        """Resize the shared pool; calls already running finish on the old one"""
+        with cls._shared_lock:
+            previous = cls._shared
+            if previous is not None and previous.max_workers == max(1, max_workers):
+                return previous
+            cls._shared = cls(max_workers)
+        if previous is not None:
+            previous.shutdown(wait=False)
+        logger.debug(f"Translation executor sized to {cls._shared.max_workers} threads")
+        return cls._shared
+
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking call on the pool and await its result"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, functools.partial(fn, *args, **kwargs))
+
+    def shutdown(self, wait: bool = True):
+        self._pool.shutdown(wait=wait)
@@ -1,21 +1,22 @@
 # d:/Ai-Video-Captions/infrastructure/translation_service.py
+import asyncio
 import logging
 from typing import List, Optional
-
-# Translation libraries
-from googletrans import Translator as GoogleTranslator
-import argostranslate.translate
+from domain.entities import SubtitleEntry
+from infrastructure.translator_registry import TranslatorRegistry
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 class TranslationService:
-    def __init__(self):
-        # Initialize translation libraries
-        self.googletrans_translator = GoogleTranslator()
-        
-        # Initialize Argos translation
-        argostranslate.translate.load_installed_languages()
+    """Synchronous, dict-based front-end over the shared translator backends
+    
+    Not for use inside a running event loop; call the backends directly there.
+    """
+    
+    def __init__(self, registry: Optional[TranslatorRegistry] = None):
+        # Backends are shared with SubtitleService and MultiTranslator, and built on first use
+        self.registry = registry or TranslatorRegistry.shared()
 
     def get_available_translation_methods(self) -> List[str]:
         """
@@ -49,18 +50,23 @@ class TranslationService:
             if method not in self.get_available_translation_methods():
                 raise ValueError(f"Unsupported translation method: {method}")
             
-            # Translate each subtitle
-            translated_subtitles = []
-            for subtitle in subtitles:
-                translated_text = self._translate_text(
-                    subtitle['text'], 
-                    target_language, 
-                    method
+            # Translate all subtitles in one backend call
+            entries = [
+                SubtitleEntry(
+                    index=position,
+                    start_time=str(subtitle.get('start_time', '')),
+                    end_time=str(subtitle.get('end_time', '')),
+                    text=subtitle['text']
                 )
-                
+                for position, subtitle in enumerate(subtitles, 1)
+            ]
+            translated = asyncio.run(self.registry[method].translate(entries, target_language))
+            
+            translated_subtitles = []
+            for subtitle, entry in zip(subtitles, translated):
                 # Create new subtitle entry with translated text
                 translated_subtitle = subtitle.copy()
-                translated_subtitle['text'] = translated_text
+                translated_subtitle['text'] = entry.text
                 translated_subtitles.append(translated_subtitle)
             
             return translated_subtitles
@@ -87,40 +93,8 @@ class TranslationService:
             Translated text
         """
         try:
-            if method == 'GoogleTrans':
-                # Use GoogleTrans
-                translation = self.googletrans_translator.translate(
-                    text, 
-                    dest=target_language
-                )
-                return translation.text
-            
-            elif method == 'Argos':
-                # Use Argos translation
-                # First, get the installed language
-                installed_languages = argostranslate.translate.get_installed_languages()
-                
-                # Find source and target languages
-                source_lang = installed_languages[0]  # Default to first installed language
-                target_lang = next(
-                    (lang for lang in installed_languages if lang.code == target_language), 
-                    None
-                )
-                
-                if not target_lang:
-                    raise ValueError(f"Target language {target_language} not installed")
-                
-                # Perform translation
-                translation = argostranslate.translate.translate(
-                    text, 
-                    source_lang, 
-                    target_lang
-                )
-                return translation
-            
-            else:
-                raise ValueError(f"Unsupported translation method: {method}")
+            return self.translate_subtitles([{'text': text}], target_language, method)[0]['text']
         
         except Exception as e:
             logger.error(f"Text translation error: {e}", exc_info=True)
-            return text  # Fallback to original text
\ No newline at end of file
+            return text  # Fallback to original text
@@ -1,14 +1,29 @@
-from googletrans import Translator as GoogleTranslator
+from googletrans import Translator as GoogleTranslator, LANGUAGES as GOOGLE_LANGUAGES
 from domain.interfaces import Translator, SubtitleEntry
 from typing import List, Optional
 import logging
 from typing import List, Optional, Callable
 from domain.entities import SubtitleEntry
+from infrastructure.translation_batcher import TranslationBatcher
+from infrastructure.translation_cache import TranslationCache
+from infrastructure.model_registry import ModelRegistry
+from infrastructure.argos_engine import ArgosBatchEngine, PairRoutes
+from infrastructure.translator_registry import TranslatorRegistry
+from infrastructure.resilience import CircuitBreaker, CircuitOpenError, RemoteCallGuard, RetryPolicy
+from infrastructure.translation_executor import TranslationExecutor
+import argostranslate.package
+import argostranslate.settings
 import argostranslate.translate
 import asyncio
+import os
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+# Age at which the Argos package index is downloaded again
+PACKAGE_INDEX_TTL = 7 * 24 * 3600
+
 class ChunkedTranslator:
     """Advanced translator with chunking and multiple translation methods"""
     
@@ -33,72 +48,260 @@ class ChunkedTranslator:
         
         return chunks
 
-class GoogleTranslatorService:
-    """Google Translate service with chunked translation"""
+class GoogleTranslatorService(Translator):
+    """Google Translate service with chunked, batched translation"""
     
-    def __init__(self, chunk_size: int = 500, timeout: int = 10):
-        self.translator = GoogleTranslator()
+    def __init__(
+        self,
+        chunk_size: int = 500,
+        timeout: int = 10,
+        max_batch_chars: int = 4500,
+        max_concurrency: int = 4,
+        cache: Optional[TranslationCache] = None,
+        requests_per_second: Optional[float] = None,
+        retry: Optional[RetryPolicy] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        fallback: Optional[Callable[[], Optional[Translator]]] = None,
+        client=None
+    ):
+        self.translator = client or self._make_client(timeout)
+        self.cache = cache or TranslationCache.shared()
         self.chunk_size = chunk_size
         self.timeout = timeout
+        self.max_batch_chars = max_batch_chars
+        self.max_concurrency = max_concurrency
+        # Throttling, retries and circuit breaking for the remote service
+        self.guard = RemoteCallGuard('Google Translate', requests_per_second, retry, breaker, timeout)
+        self.metrics = self.guard.metrics
+        # Backend for segments Google could not translate (built on first failure)
+        self.fallback = fallback
+        # Google requests get their own threads: a request abandoned on timeout keeps its
+        # thread until the HTTP call returns, and must not starve the shared translation pool
+        self.executor = TranslationExecutor(max_workers=max_concurrency)
+    
+    @staticmethod
+    def _make_client(timeout: float):
+        """googletrans client whose HTTP requests give up after timeout seconds"""
+        try:
+            return GoogleTranslator(timeout=timeout)
+        except TypeError:
+            # googletrans releases without a timeout option
+            logger.warning("googletrans does not support request timeouts; hung requests hold a thread")
+            return GoogleTranslator()
     
     async def translate(
         self, 
         subtitles: List[SubtitleEntry], 
-        target_language: str
+        target_language: str,
+        source_language: Optional[str] = None
+    ) -> List[SubtitleEntry]:
+        """Translate subtitles, consulting the translation cache first"""
+        source = self._source_code(source_language)
+        # Normalized texts of subtitles with a chunk that failed for good; filled by _translate_uncached
+        failed_texts = set()
+        retries_before = self.metrics.retries
+        translated = await self.cache.translate_entries(
+            subtitles, source, target_language, 'google',
+            lambda pending: self._translate_uncached(pending, target_language, source, failed_texts)
+        )
+        
+        if failed_texts:
+            # Failover runs outside the cache step so fallback output is never stored as Google's
+            translated = await self._fail_over(subtitles, translated, failed_texts, target_language, source_language)
+        if self.metrics.retries > retries_before or failed_texts:
+            logger.info(f"Google translation metrics: {self.metrics.snapshot()}")
+        return translated
+    
+    async def _fail_over(
+        self,
+        subtitles: List[SubtitleEntry],
+        translated: List[SubtitleEntry],
+        failed_texts: set,
+        target_language: str,
+        source_language: Optional[str]
+    ) -> List[SubtitleEntry]:
+        """Send subtitles Google could not fully translate to the fallback backend"""
+        positions = [
+            position for position, subtitle in enumerate(subtitles)
+            if TranslationCache.normalize(subtitle.text) in failed_texts
+        ]
+        
+        try:
+            fallback = self.fallback() if self.fallback else None
+            if fallback is not None:
+                replacements = await fallback.translate(
+                    [subtitles[position] for position in positions], target_language, source_language=source_language
+                )
+                translated = list(translated)
+                for position, replacement in zip(positions, replacements):
+                    translated[position] = replacement
+                self.metrics.fallback_segments += len(positions)
+                logger.warning(f"Google Translate unavailable; {len(positions)} subtitles translated by fallback")
+                return translated
+        except Exception as e:
+            logger.error(f"Fallback translation failed: {e}", exc_info=True)
+        
+        self.metrics.failed_segments += len(positions)
+        logger.warning(f"{len(positions)} subtitles left untranslated")
+        return translated
+    
+    def supports(self, source_language: Optional[str], target_language: str) -> bool:
+        # While the circuit is open the router sends new jobs elsewhere
+        return self.guard.healthy and self._google_code(target_language) in GOOGLE_LANGUAGES
+    
+    @staticmethod
+    def _google_code(language: str) -> str:
+        # Whisper reports plain 'zh'; googletrans needs the script variant
+        return {'zh': 'zh-cn'}.get(language, language)
+    
+    @staticmethod
+    def _source_code(source_language: Optional[str]) -> str:
+        """Google code for a known source language; 'auto' lets the service detect it"""
+        if not source_language:
+            return 'auto'
+        code = GoogleTranslatorService._google_code(source_language)
+        if code not in GOOGLE_LANGUAGES:
+            logger.warning(f"Source language {source_language} unknown to Google Translate, auto-detecting")
+            return 'auto'
+        return code
+    
+    async def _translate_uncached(
+        self, 
+        subtitles: List[SubtitleEntry], 
+        target_language: str,
+        source_language: str = 'auto',
+        failed_texts: Optional[set] = None
     ) -> List[SubtitleEntry]:
-        """Translate subtitles with chunking and timeout handling"""
+        """Translate subtitles by packing their chunks into batched requests
+        
+        A subtitle with any failed chunk keeps its original text, so the cache
+        does not store it, and its normalized text is added to failed_texts.
+        """
+        # Flatten every subtitle into chunks, remembering which entry owns each one
+        chunks = []
+        owners = []
+        for position, subtitle in enumerate(subtitles):
+            for chunk in await ChunkedTranslator.chunk_text(subtitle.text, self.chunk_size):
+                chunks.append(chunk)
+                owners.append(position)
+        
+        batcher = TranslationBatcher(
+            lambda batch: self._translate_batch(batch, target_language, source_language),
+            max_batch_chars=self.max_batch_chars,
+            max_concurrency=self.max_concurrency
+        )
+        translated_chunks = await batcher.translate(chunks)
+        
+        # Combine translated chunks back onto their subtitles
+        pieces = [[] for _ in subtitles]
+        failed = [False] * len(subtitles)
+        for owner, translated_chunk in zip(owners, translated_chunks):
+            if translated_chunk is None:
+                failed[owner] = True
+            else:
+                pieces[owner].append(translated_chunk)
+        
         translated_subtitles = []
+        for subtitle, subtitle_pieces, subtitle_failed in zip(subtitles, pieces, failed):
+            if subtitle_failed and failed_texts is not None:
+                failed_texts.add(TranslationCache.normalize(subtitle.text))
+            translated_subtitles.append(SubtitleEntry(
+                index=subtitle.index,
+                start_time=subtitle.start_time,
+                end_time=subtitle.end_time,
+                text=' '.join(subtitle_pieces) if subtitle_pieces and not subtitle_failed else subtitle.text
+            ))
         
-        for subtitle in subtitles:
+        return translated_subtitles
+    
+    async def _translate_batch(
+        self,
+        texts: List[str],
+        target_language: str,
+        source_language: str = 'auto'
+    ) -> List[Optional[str]]:
+        """Translate a list of chunks in a single request, None for chunks that failed
+        
+        Timeouts and errors are retried with backoff. If the response does not
+        split back into one line per chunk, each chunk is sent on its own.
+        """
+        try:
+            translated = await self.guard.call(
+                lambda: self._translate_chunks(texts, target_language, source_language),
+                segments=len(texts)
+            )
+        except Exception as e:
+            self._log_failure(e, len(texts))
+            return [None] * len(texts)
+        if translated is not None:
+            return translated
+        
+        logger.debug(f"Batch response did not split into {len(texts)} chunks; translating one by one")
+        results = []
+        for text in texts:
             try:
-                # Chunk the text
-                text_chunks = await ChunkedTranslator.chunk_text(subtitle.text, self.chunk_size)
-                
-                # Translate chunks
-                translated_chunks = []
-                for chunk in text_chunks:
-                    try:
-                        # Use asyncio.wait_for to handle timeout
-                        translated_chunk = await asyncio.wait_for(
-                            self._translate_chunk(chunk, target_language), 
-                            timeout=self.timeout
-                        )
-                        translated_chunks.append(translated_chunk)
-                    except asyncio.TimeoutError:
-                        logger.warning(f"Translation timeout for chunk: {chunk}")
-                        translated_chunks.append(chunk)  # Fallback to original text
-                
-                # Combine translated chunks
-                translated_text = ' '.join(translated_chunks)
-                
-                # Create new subtitle with translated text
-                translated_subtitle = SubtitleEntry(
-                    index=subtitle.index,
-                    start_time=subtitle.start_time,
-                    end_time=subtitle.end_time,
-                    text=translated_text
+                single = await self.guard.call(
+                    lambda: self._translate_chunks([text], target_language, source_language)
                 )
-                translated_subtitles.append(translated_subtitle)
-            
+                results.append(single[0])
             except Exception as e:
-                logger.error(f"Translation error: {e}")
-                # Fallback: keep original subtitle
-                translated_subtitles.append(subtitle)
+                self._log_failure(e, 1)
+                results.append(None)
+        return results
+    
+    @staticmethod
+    def _log_failure(error: Exception, chunks: int):
+        if isinstance(error, CircuitOpenError):
+            logger.warning(f"Skipping batch of {chunks} chunks: {error}")
+        elif isinstance(error, asyncio.TimeoutError):
+            logger.warning(f"Translation timeout for batch of {chunks} chunks")
+        else:
+            logger.error(f"Translation error: {error}")
+    
+    async def _translate_chunks(
+        self,
+        texts: List[str],
+        target_language: str,
+        source_language: str = 'auto'
+    ) -> Optional[List[str]]:
+        """Translate several chunks in one HTTP request, one line per chunk
         
-        return translated_subtitles
+        googletrans sends a request per item of a list input, so the batch is
+        joined into a single string instead. Returns None if the response does
+        not split back into as many chunks.
+        """
+        # googletrans is synchronous; its keep-alive HTTP client is shared by the pool threads
+        translation = await self.executor.run(
+            self.translator.translate, TranslationBatcher.join(texts), dest=target_language, src=source_language
+        )
+        if len(texts) == 1:
+            return [translation.text.strip()]
+        return TranslationBatcher.split(translation.text, len(texts))
     
     async def _translate_chunk(self, text: str, target_language: str) -> str:
         """Translate a single text chunk"""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None, 
-            lambda: self.translator.translate(text, dest=target_language).text
-        )
+        return (await self._translate_chunks([text], target_language))[0]
 
-class ArgosTranslatorService:
+class ArgosTranslatorService(Translator):
     """Advanced Argos Translate service with comprehensive language support"""
     
-    def __init__(self):
+    def __init__(
+        self,
+        cache: Optional[TranslationCache] = None,
+        registry: Optional[ModelRegistry] = None,
+        max_batch_size: int = 32,
+        index_ttl: float = PACKAGE_INDEX_TTL,
+        auto_install: bool = True
+    ):
+        self.cache = cache or TranslationCache.shared()
+        # Loaded CTranslate2 engines, one per language pair, unloaded when idle
+        self.registry = registry or ModelRegistry.shared()
+        self.max_batch_size = max_batch_size
+        # The package index is only re-downloaded once it is older than this
+        self.index_ttl = index_ttl
+        # Download missing packages on demand (needs network), otherwise use only installed ones
+        self.auto_install = auto_install
+        
         # Language code mapping
         self.language_map = {
             'en': 'en',  # English
@@ -110,132 +313,180 @@ class ArgosTranslatorService:
             'ar': 'ar',  # Arabic
         }
         
-        # Initialize translation packages
-        self._initialize_packages()
+        # Packages are checked on first translation, not at construction
+        self._packages_ready = False
+        self._packages_lock = threading.Lock()
+        self._routes: Optional[PairRoutes] = None
+    
+    def _ensure_packages(self):
+        """Build the routing table from installed packages once; never touches the network"""
+        with self._packages_lock:
+            if not self._packages_ready:
+                self._routes = PairRoutes(argostranslate.package.get_installed_packages())
+                logger.debug(f"Argos pairs installed: {self._routes.pairs()}")
+                self._packages_ready = True
     
-    def _initialize_packages(self):
-        """Download and install necessary translation packages"""
+    def supports(self, source_language: Optional[str], target_language: str) -> bool:
+        """Pairs routable through installed packages; downloads do not count"""
+        from_code = source_language or 'en'
+        if target_language not in self.language_map:
+            return False
+        if from_code == target_language:
+            return True
+        self._ensure_packages()
+        return bool(self._find_route(from_code, target_language))
+    
+    def package_index_age(self) -> Optional[float]:
+        """Seconds since the local package index was downloaded, None if never"""
         try:
-            # Update package index
-            argostranslate.package.update_package_index()
-            
-            # List of language combinations to download
-            language_pairs = [
-                ('en', 'es'), ('en', 'fr'), ('en', 'de'),
-                ('en', 'it'), ('en', 'pt'), ('en', 'ar')
-            ]
-            
-            for from_code, to_code in language_pairs:
-                try:
-                    self._download_package(from_code, to_code)
-                except Exception as e:
-                    logger.warning(f"Failed to download package {from_code}->{to_code}: {e}")
-        
-        except Exception as e:
-            logger.error(f"Package initialization error: {e}")
+            return time.time() - os.path.getmtime(argostranslate.settings.local_package_index)
+        except (AttributeError, OSError):
+            return None
     
-    def _download_package(self, from_code: str, to_code: str):
-        """Download translation package if not already installed"""
-        available_packages = argostranslate.package.get_available_packages()
-        installed_packages = argostranslate.package.get_installed_packages()
+    def refresh_package_index(self, force: bool = False) -> bool:
+        """Download the package index unless the local copy is younger than the TTL
         
-        # Check if package is already installed
-        if any(pkg.from_code == from_code and pkg.to_code == to_code for pkg in installed_packages):
-            return
+        Blocking network I/O. Returns whether a download happened.
+        """
+        age = self.package_index_age()
+        if not force and age is not None and age < self.index_ttl:
+            logger.debug(f"Argos package index is {age / 3600:.1f}h old, not refreshing")
+            return False
+        argostranslate.package.update_package_index()
+        logger.info("Argos package index refreshed")
+        return True
+    
+    def _install_route(self, from_code: str, to_code: str) -> Optional[List]:
+        """Download the packages for a pair nothing installed can route (blocking)"""
+        try:
+            self.refresh_package_index()
+            installed = argostranslate.package.get_installed_packages()
+            installed_pairs = {(pkg.from_code, pkg.to_code) for pkg in installed}
+            # Route over installed and downloadable packages, preferring fewest hops
+            route = PairRoutes(installed + argostranslate.package.get_available_packages()).route(from_code, to_code)
+            if not route:
+                return None
+            
+            for package in route:
+                if (package.from_code, package.to_code) not in installed_pairs:
+                    package.install()  # Downloads as needed
+                    logger.info(f"Installed translation package: {package.from_code}->{package.to_code}")
         
-        # Find package to download
-        package = next(
-            (pkg for pkg in available_packages 
-             if pkg.from_code == from_code and pkg.to_code == to_code), 
-            None
-        )
+        except Exception as e:
+            logger.warning(f"Could not install Argos packages for {from_code}->{to_code}: {e}")
+            return None
         
-        if package:
-            package.download()
-            package.install()
-            logger.info(f"Installed translation package: {from_code}->{to_code}")
+        with self._packages_lock:
+            self._routes = PairRoutes(argostranslate.package.get_installed_packages())
+        return self._routes.route(from_code, to_code)
     
-    async def translate(self, subtitles: List[SubtitleEntry], target_language: str) -> List[SubtitleEntry]:
+    async def translate(
+        self,
+        subtitles: List[SubtitleEntry],
+        target_language: str,
+        source_language: Optional[str] = None
+    ) -> List[SubtitleEntry]:
         """Translate subtitles using Argos Translate"""
         try:
+            # Reading installed packages touches the disk; keep it off the loop
+            executor = TranslationExecutor.shared()
+            if not self._packages_ready:
+                await executor.run(self._ensure_packages)
+            
             # Validate target language
             if target_language not in self.language_map:
                 logger.warning(f"Unsupported language: {target_language}. Falling back to English.")
                 target_language = 'en'
             
-            # Convert to Argos language code
-            from_code = 'en'
+            # Convert to Argos language code; English remains the default source
+            from_code = source_language or 'en'
             to_code = self.language_map.get(target_language, 'es')
             
-            # Find translation package
-            translation_package = self._find_translation_package(from_code, to_code)
+            if from_code == to_code:
+                return subtitles
+            
+            # Shortest chain of installed packages, pivoting when there is no direct model
+            route = self._find_route(from_code, to_code)
+            if not route and self.auto_install:
+                # Only now is the network needed: index refresh and package download
+                route = await executor.run(self._install_route, from_code, to_code)
             
-            if not translation_package:
+            if not route:
                 logger.error(f"No translation package found for {from_code}->{to_code}")
                 return subtitles
             
-            # Translate subtitles
-            translated_subtitles = []
-            for subtitle in subtitles:
-                try:
-                    # Translate text using the found translation package
-                    translated_text = argostranslate.translate.translate(
-                        subtitle.text, 
-                        from_code, 
-                        to_code
-                    )
-                    
-                    translated_subtitle = SubtitleEntry(
-                        index=subtitle.index,
-                        start_time=subtitle.start_time,
-                        end_time=subtitle.end_time,
-                        text=translated_text
-                    )
-                    translated_subtitles.append(translated_subtitle)
-                
-                except Exception as chunk_error:
-                    logger.warning(f"Translation error for subtitle: {chunk_error}")
-                    translated_subtitles.append(subtitle)
-            
-            return translated_subtitles
+            # Translate subtitles not already in the cache
+            return await self.cache.translate_entries(
+                subtitles, from_code, to_code, 'argos',
+                lambda pending: self._translate_entries(pending, route)
+            )
         
         except Exception as e:
             logger.error(f"Argos translation error: {e}")
             return subtitles
     
-    def _find_translation_package(self, from_code: str, to_code: str):
-        """Find the most appropriate translation package"""
-        installed_packages = argostranslate.package.get_installed_packages()
-        
-        # First, try direct translation
-        direct_package = next(
-            (pkg for pkg in installed_packages 
-             if pkg.from_code == from_code and pkg.to_code == to_code), 
-            None
+    async def _translate_entries(self, subtitles: List[SubtitleEntry], route: List) -> List[SubtitleEntry]:
+        """Translate all subtitles in one batch per hop on a worker thread"""
+        texts = await TranslationExecutor.shared().run(
+            self._translate_texts, [subtitle.text for subtitle in subtitles], route
         )
-        
-        if direct_package:
-            return direct_package
-        
-        # If direct translation not found, try English as intermediate
-        intermediate_packages = [
-            pkg for pkg in installed_packages 
-            if pkg.from_code == from_code and pkg.to_code == 'en'
+        return [
+            SubtitleEntry(
+                index=subtitle.index,
+                start_time=subtitle.start_time,
+                end_time=subtitle.end_time,
+                text=text
+            )
+            for subtitle, text in zip(subtitles, texts)
         ]
+    
+    def _translate_texts(self, texts: List[str], route: List) -> List[str]:
+        """Run the whole batch through each hop of the route in turn (blocking)"""
+        for package in route:
+            texts = self._translate_hop(texts, package)
+        return texts
+    
+    def _translate_hop(self, texts: List[str], package) -> List[str]:
+        """One package's batched CTranslate2 engine, per-text Argos if it cannot load"""
+        from_code, to_code = package.from_code, package.to_code
+        try:
+            # Engines are cached per hop, so pivot routes share them with direct ones
+            with self.registry.use(
+                f"argos:{from_code}->{to_code}",
+                lambda: ArgosBatchEngine.for_package(package, max_batch_size=self.max_batch_size),
+                exclusive=False
+            ) as engine:
+                return engine.translate(texts)
+        except Exception as e:
+            logger.warning(f"Batched Argos engine unavailable for {from_code}->{to_code}, "
+                           f"translating one subtitle at a time: {e}")
         
-        if intermediate_packages:
-            logger.info("Using English as intermediate translation language")
-            return intermediate_packages[0]
+        return [self._translate_text(text, from_code, to_code) for text in texts]
+    
+    @staticmethod
+    def _translate_text(text: str, from_code: str, to_code: str) -> str:
+        try:
+            return argostranslate.translate.translate(text, from_code, to_code)
+        except Exception as e:
+            logger.warning(f"Translation error for subtitle: {e}")
+            return text
+    
+    def _find_route(self, from_code: str, to_code: str) -> Optional[List]:
+        """Packages to chain for from_code->to_code, from the table built at initialization"""
+        if self._routes is None:
+            self._routes = PairRoutes(argostranslate.package.get_installed_packages())
         
-        logger.warning(f"No suitable translation package found for {from_code}->{to_code}")
-        return None
+        route = self._routes.route(from_code, to_code)
+        if route and len(route) > 1:
+            logger.info(f"Pivot translation {from_code}->{to_code} via "
+                        f"{' -> '.join(pkg.to_code for pkg in route[:-1])}")
+        return route
 
 class MultiTranslator(Translator):
-    def __init__(self):
-        self.googletrans_translator = GoogleTranslator()
-        argostranslate.translate.load_installed_languages()
-        self.google_translator_service = GoogleTranslatorService()
-        self.argos_translator_service = ArgosTranslatorService()
+    """Translation by method name over the shared backend registry"""
+    
+    def __init__(self, registry: Optional[TranslatorRegistry] = None):
+        self.registry = registry or TranslatorRegistry.shared()
 
     def get_translation_methods(self) -> List[str]:
         return ['GoogleTrans', 'Argos']
@@ -244,29 +495,17 @@ class MultiTranslator(Translator):
         self, 
         subtitles: List[SubtitleEntry], 
         target_language: str, 
-        method: str = 'GoogleTrans'
+        method: str = 'GoogleTrans',
+        source_language: Optional[str] = None
     ) -> List[SubtitleEntry]:
         try:
             if method not in self.get_translation_methods():
                 raise ValueError(f"Unsupported translation method: {method}")
             
-            translated_subtitles = []
-            for subtitle in subtitles:
-                translated_text = await self._translate_text(
-                    subtitle.text, 
-                    target_language, 
-                    method
-                )
-                
-                translated_subtitle = SubtitleEntry(
-                    index=subtitle.index,
-                    start_time=subtitle.start_time,
-                    end_time=subtitle.end_time,
-                    text=translated_text
-                )
-                translated_subtitles.append(translated_subtitle)
-            
-            return translated_subtitles
+            # Both services consult the shared translation cache
+            return await self._service_for(method).translate(
+                subtitles, target_language, source_language=source_language
+            )
         
         except Exception as e:
             logger.error(f"Translation error: {e}", exc_info=True)
@@ -279,19 +518,15 @@ class MultiTranslator(Translator):
         method: str
     ) -> str:
         try:
-            if method == 'GoogleTrans':
-                translation = self.googletrans_translator.translate(
-                    text, 
-                    dest=target_language
-                )
-                return translation.text
-            
-            elif method == 'Argos':
-                return await self.argos_translator_service.translate([SubtitleEntry(text=text)], target_language)[0].text
-            
-            else:
-                raise ValueError(f"Unsupported translation method: {method}")
+            entry = SubtitleEntry(index=1, start_time='', end_time='', text=text)
+            translated = await self._service_for(method).translate([entry], target_language)
+            return translated[0].text
         
         except Exception as e:
             logger.error(f"Text translation error: {e}", exc_info=True)
             return text
+
+    def _service_for(self, method: str) -> Translator:
+        if method not in self.get_translation_methods():
+            raise ValueError(f"Unsupported translation method: {method}")
+        return self.registry[method]
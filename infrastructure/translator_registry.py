@@ -0,0 +1,166 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+from domain.interfaces import Translator
+
+logger = logging.getLogger(__name__)
+
+# Method name that lets the router pick a backend per language pair
+AUTO_METHOD = 'Auto'
+
+@dataclass
+class BackendSpec:
+    """A translation backend and what it can do, known without constructing it"""
+    name: str
+    factory: Callable[["BackendSpec", "TranslatorRegistry"], Translator]
+    aliases: Tuple[str, ...] = ()
+    # Expected throughput until real jobs have been measured
+    chars_per_second: float = 1000.0
+    # Largest request the backend accepts, in characters and in items
+    max_batch_chars: Optional[int] = None
+    max_batch_items: Optional[int] = None
+    # Sustained request rate the service tolerates (None: unlimited)
+    requests_per_second: Optional[float] = None
+    cost_per_million_chars: float = 0.0
+    offline: bool = False
+    # Backend that takes over segments this one fails to translate
+    fallback: Optional[str] = None
+    # Moving average of measured throughput
+    measured_chars_per_second: Optional[float] = field(default=None, compare=False)
+
+    @property
+    def throughput(self) -> float:
+        return self.measured_chars_per_second or self.chars_per_second
+
+def _google_translator(spec: BackendSpec, registry: "TranslatorRegistry") -> Translator:
+    from infrastructure.translator import GoogleTranslatorService
+    return GoogleTranslatorService(
+        max_batch_chars=spec.max_batch_chars,
+        requests_per_second=spec.requests_per_second,
+        fallback=(lambda: registry[spec.fallback]) if spec.fallback else None
+    )
+
+def _argos_translator(spec: BackendSpec, registry: "TranslatorRegistry") -> Translator:
+    from infrastructure.translator import ArgosTranslatorService
+    return ArgosTranslatorService(max_batch_size=spec.max_batch_items)
+
+def default_backends() -> List[BackendSpec]:
+    return [
+        BackendSpec(
+            'GoogleTrans', _google_translator,
+            chars_per_second=5000.0, max_batch_chars=4500, requests_per_second=5.0,
+            fallback='Argos Translate'
+        ),
+        BackendSpec(
+            'Argos Translate', _argos_translator, aliases=('Argos',),
+            chars_per_second=1500.0, max_batch_items=32, offline=True
+        )
+    ]
+
+class TranslatorRegistry:
+    """Translator backends by method name, each constructed once on first use
+
+    Backends (and their imports) cost nothing until a job selects them, so a
+    GoogleTrans-only session never loads Argos packages. The shared registry
+    gives every front-end the same instance of each backend.
+    """
+
+    _shared: Optional["TranslatorRegistry"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, backends: Optional[List[BackendSpec]] = None):
+        self._specs: Dict[str, BackendSpec] = {}
+        self._aliases: Dict[str, str] = {}
+        self._instances: Dict[str, Translator] = {}
+        self._lock = threading.Lock()
+        # The shared registry serves every front-end, so its backends cannot be replaced
+        self._frozen = False
+        for spec in backends or []:
+            self.register(spec)
+
+    @classmethod
+    def default(cls) -> "TranslatorRegistry":
+        return cls(default_backends())
+
+    @classmethod
+    def shared(cls) -> "TranslatorRegistry":
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls.default()
+                cls._shared._frozen = True
+            return cls._shared
+
+    def register(self, spec: BackendSpec):
+        with self._lock:
+            self._specs[spec.name] = spec
+            self._instances.pop(spec.name, None)
+            for alias in spec.aliases:
+                self._aliases[alias] = spec.name
+
+    def names(self) -> List[str]:
+        return list(self._specs)
+
+    def loaded(self) -> List[str]:
+        """Backends constructed so far"""
+        return list(self._instances)
+
+    def spec(self, name: str) -> BackendSpec:
+        name = self._aliases.get(name, name)
+        if name not in self._specs:
+            raise KeyError(f"Unknown translation method: {name}")
+        return self._specs[name]
+
+    def get(self, name: str) -> Translator:
+        spec = self.spec(name)
+        with self._lock:
+            if spec.name not in self._instances:
+                start = time.perf_counter()
+                self._instances[spec.name] = spec.factory(spec, self)
+                logger.debug(f"Created translator {spec.name} in {time.perf_counter() - start:.2f}s")
+            return self._instances[spec.name]
+
+    def route(self, source_language: Optional[str], target_language: str) -> str:
+        """Name of the fastest backend that supports the pair
+
+        Candidates are tried in throughput order (cheapest first on ties), so
+        slower backends are only constructed when faster ones cannot help.
+        """
+        candidates = sorted(self._specs.values(), key=lambda spec: (-spec.throughput, spec.cost_per_million_chars))
+        for spec in candidates:
+            try:
+                if self.get(spec.name).supports(source_language, target_language):
+                    logger.debug(f"Routing {source_language}->{target_language} to {spec.name}")
+                    return spec.name
+            except Exception as e:
+                logger.warning(f"Translator {spec.name} unavailable: {e}")
+        raise LookupError(f"No translation backend supports {source_language}->{target_language}")
+
+    def record(self, name: str, chars: int, seconds: float):
+        """Fold a finished job's throughput into the backend's measured rate"""
+        if chars <= 0 or seconds <= 0:
+            return
+        spec = self.spec(name)
+        rate = chars / seconds
+        with self._lock:
+            previous = spec.measured_chars_per_second
+            spec.measured_chars_per_second = rate if previous is None else 0.7 * previous + 0.3 * rate
+
+    def __getitem__(self, name: str) -> Translator:
+        return self.get(name)
+
+    def __setitem__(self, name: str, translator: Translator):
+        """Use an already constructed backend for name"""
+        if self._frozen:
+            raise TypeError("The shared translator registry cannot be overridden; pass a registry of your own")
+        try:
+            spec = self.spec(name)
+        except KeyError:
+            spec = BackendSpec(name, lambda spec, registry: translator)
+            self.register(spec)
+        with self._lock:
+            self._instances[spec.name] = translator
+
+    def __contains__(self, name: str) -> bool:
+        return name == AUTO_METHOD or self._aliases.get(name, name) in self._specs
@@ -1,145 +1,169 @@
-import moviepy.editor as mp
-from domain.interfaces import VideoProcessor
+import numpy as np
+from domain.interfaces import VideoProcessor, MediaInfo, TimeRange, AUDIO_SAMPLE_RATE
+from infrastructure.media_probe import probe_media
+from infrastructure.toolchain import find_ffmpeg, find_ffprobe
+from typing import Callable, Deque, List, Optional
+from collections import deque
 import pathlib
+import asyncio
 import tempfile
 import logging
 import os
-import sys
-import subprocess
-import shutil
+import weakref
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-class FFmpegFinder:
-    """Utility class to find FFmpeg executable"""
-    _ffmpeg_path = None
-
-    @classmethod
-    def find_ffmpeg(cls):
-        """Find FFmpeg executable path with comprehensive search"""
-        # Skip if already found
-        if cls._ffmpeg_path:
-            return cls._ffmpeg_path
-
-        # Possible FFmpeg installation paths
-        possible_paths = [
-            # Standard installation paths
-            r"C:\Program Files\FFmpeg\bin\ffmpeg.exe",
-            r"C:\Program Files (x86)\FFmpeg\bin\ffmpeg.exe",
-            r"C:\ffmpeg\bin\ffmpeg.exe",
-            
-            # Winget installation paths
-            r"C:\Program Files\Gyan\FFmpeg\bin\ffmpeg.exe",
-            r"C:\Program Files\VideoLAN\VLC\ffmpeg.exe",
-            
-            # Path environment variable
-            *[os.path.join(path, "ffmpeg.exe") for path in os.environ.get("PATH", "").split(os.pathsep)],
-            
-            # Additional potential locations
-            os.path.expanduser("~\\ffmpeg\\bin\\ffmpeg.exe"),
-            r"D:\ffmpeg\bin\ffmpeg.exe",
-            r"E:\ffmpeg\bin\ffmpeg.exe"
-        ]
+# FFmpeg diagnostics kept for error messages
+STDERR_TAIL_LINES = 20
+
+class MoviePyVideoProcessor(VideoProcessor):
+    def __init__(
+        self,
+        max_concurrent_extractions: int = 2,
+        timeout: Optional[float] = None,
+        stall_timeout: Optional[float] = 120.0
+    ):
+        # Resolved on first use so constructing the processor never spawns processes
+        self.ffmpeg_path = None
+        # FFmpeg runs allowed at once on one event loop; more just fight over disk and cores
+        self.max_concurrent_extractions = max(1, max_concurrent_extractions)
+        # Limit on a whole extraction, and on time without any FFmpeg progress report
+        self.timeout = timeout
+        self.stall_timeout = stall_timeout
+        self._slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _extraction_slot(self) -> asyncio.Semaphore:
+        """Semaphore for the running loop; GUI jobs each run on a fresh loop"""
+        loop = asyncio.get_running_loop()
+        if loop not in self._slots:
+            self._slots[loop] = asyncio.Semaphore(self.max_concurrent_extractions)
+        return self._slots[loop]
+
+    def _require_ffmpeg(self, video_path: pathlib.Path) -> str:
+        """Validate the input file and return a usable FFmpeg path"""
+        # Validate input video file
+        if not video_path.exists():
+            raise FileNotFoundError(f"Video file not found: {video_path}")
         
-        # Try using shutil to find FFmpeg in PATH
-        ffmpeg_path = shutil.which("ffmpeg")
-        if ffmpeg_path:
-            possible_paths.append(ffmpeg_path)
+        # Verify FFmpeg is available
+        if not self.ffmpeg_path:
+            self.ffmpeg_path = find_ffmpeg()
+            
+            if not self.ffmpeg_path:
+                raise RuntimeError("FFmpeg is not installed or not found in system PATH")
         
-        # Additional system-wide search
-        try:
-            # Try using where command to find FFmpeg
-            result = subprocess.run(["where", "ffmpeg"], capture_output=True, text=True)
-            if result.returncode == 0:
-                possible_paths.extend(result.stdout.strip().split('\n'))
-        except:
-            pass
+        return self.ffmpeg_path
+
+    async def probe(self, video_path: pathlib.Path) -> Optional[MediaInfo]:
+        """Duration, codec and stream layout from a single ffprobe call"""
+        if not video_path.exists():
+            raise FileNotFoundError(f"Video file not found: {video_path}")
         
-        # Verify FFmpeg executable
-        for path in possible_paths:
-            try:
-                if os.path.exists(path):
-                    # Additional verification by running FFmpeg
-                    test_cmd = [path, "-version"]
-                    result = subprocess.run(test_cmd, capture_output=True, text=True)
-                    if result.returncode == 0:
-                        logger.debug(f"Found valid FFmpeg at: {path}")
-                        cls._ffmpeg_path = path
-                        return path
-            except Exception as e:
-                logger.warning(f"Error checking FFmpeg at {path}: {e}")
+        ffprobe_path = find_ffprobe()
+        if not ffprobe_path:
+            logger.warning("ffprobe not found. Media metadata unavailable.")
+            return None
         
-        logger.error("FFmpeg executable not found. Audio extraction may fail.")
-        return None
-
-    @classmethod
-    def get_ffmpeg_path(cls):
-        """Get cached FFmpeg path or find it"""
-        if not cls._ffmpeg_path:
-            cls._ffmpeg_path = cls.find_ffmpeg()
-        return cls._ffmpeg_path
-
-# Set FFmpeg path if found
-FFMPEG_PATH = FFmpegFinder.get_ffmpeg_path()
-if FFMPEG_PATH:
-    # Set environment variable
-    os.environ['FFMPEG_BINARY'] = FFMPEG_PATH
-    # Update MoviePy configuration
-    try:
-        mp.config.change_settings({"FFMPEG_BINARY": FFMPEG_PATH})
-    except AttributeError:
-        logger.warning("Could not update MoviePy FFmpeg configuration")
+        return await probe_media(ffprobe_path, video_path)
 
-class MoviePyVideoProcessor(VideoProcessor):
-    def __init__(self):
-        # Verify FFmpeg is available during initialization
-        self.ffmpeg_path = FFmpegFinder.get_ffmpeg_path()
-        if not self.ffmpeg_path:
-            logger.warning("FFmpeg not found during initialization")
+    @staticmethod
+    def _audio_map_args(video_path: pathlib.Path, media: Optional[MediaInfo]) -> List[str]:
+        """Select the probed audio stream explicitly; fail early on silent videos"""
+        if media is None:
+            return []
+        if not media.has_audio:
+            raise RuntimeError(f"No audio track found in {video_path}")
+        return ['-map', f"0:{media.audio_stream_index}"]
+
+    @staticmethod
+    def _range_args(time_range: Optional[TimeRange]) -> List[str]:
+        """Input options: FFmpeg seeks to start without decoding anything before it"""
+        if time_range is None:
+            return []
+        args = ['-ss', f"{time_range.start:.3f}"] if time_range.start else []
+        if time_range.duration is not None:
+            args += ['-t', f"{time_range.duration:.3f}"]
+        return args
 
-    async def extract_audio(self, video_path: pathlib.Path) -> pathlib.Path:
+    @staticmethod
+    def _is_whisper_pcm(media: Optional[MediaInfo]) -> bool:
+        """Audio already in Whisper's input format only needs remuxing, not decoding"""
+        return (
+            media is not None
+            and media.audio_codec == 'pcm_s16le'
+            and media.sample_rate == AUDIO_SAMPLE_RATE
+            and media.channels == 1
+        )
+
+    @staticmethod
+    def _decodes_directly(media: Optional[MediaInfo], time_range: Optional[TimeRange]) -> bool:
+        """Whole audio-only files go to Whisper as they are; it decodes with FFmpeg itself"""
+        return (
+            media is not None
+            and time_range is None
+            and media.has_audio
+            and media.video_stream_index is None
+        )
+
+    async def extract_audio(
+        self,
+        video_path: pathlib.Path,
+        media: Optional[MediaInfo] = None,
+        progress_callback: Optional[Callable[[float], None]] = None,
+        time_range: Optional[TimeRange] = None,
+        output_path: Optional[pathlib.Path] = None
+    ) -> pathlib.Path:
         try:
-            # Validate input video file
-            if not video_path.exists():
-                raise FileNotFoundError(f"Video file not found: {video_path}")
+            self._require_ffmpeg(video_path)
+            map_args = self._audio_map_args(video_path, media)
             
-            # Verify FFmpeg is available
-            if not self.ffmpeg_path:
-                # Attempt one last time to find FFmpeg
-                self.ffmpeg_path = FFmpegFinder.find_ffmpeg()
-                
-                if not self.ffmpeg_path:
-                    raise RuntimeError("FFmpeg is not installed or not found in system PATH")
+            # Cheapest path first: no extraction at all
+            if self._decodes_directly(media, time_range):
+                logger.debug(f"Audio-only input, skipping extraction for {video_path}")
+                if progress_callback:
+                    progress_callback(media.duration)
+                return video_path
+            
+            if self._is_whisper_pcm(media):
+                # Stream copy: the samples are written out untouched
+                codec_args = ['-acodec', 'copy']
+            else:
+                codec_args = [
+                    '-acodec', 'pcm_s16le',  # Audio codec
+                    '-ar', str(AUDIO_SAMPLE_RATE),  # Sample rate for Whisper
+                    '-ac', '1',  # Mono channel
+                ]
             
             # Log input video details
             logger.debug(f"Extracting audio from: {video_path}")
             logger.debug(f"Video file size: {os.path.getsize(video_path)} bytes")
             logger.debug(f"Using FFmpeg: {self.ffmpeg_path}")
             
-            # Create temporary audio file path
-            temp_dir = pathlib.Path(tempfile.gettempdir())
-            audio_path = temp_dir / f"{video_path.stem}_audio.wav"
+            audio_path = output_path or self._temp_audio_path(video_path)
             logger.debug(f"Temporary audio path: {audio_path}")
             
-            # Extract audio using FFmpeg directly
+            # Extract audio using FFmpeg directly, reporting position on stdout
             ffmpeg_cmd = [
                 self.ffmpeg_path,
+                '-nostdin',
+                '-y',  # The target path may already exist (e.g. a reserved temp file)
+                '-v', 'error',
+                '-nostats',
+                '-progress', 'pipe:1',
+                *self._range_args(time_range),
                 '-i', str(video_path),
+                *map_args,
                 '-vn',  # Disable video
-                '-acodec', 'pcm_s16le',  # Audio codec
-                '-ar', '16000',  # Sample rate for Whisper
-                '-ac', '1',  # Mono channel
+                *codec_args,
                 str(audio_path)
             ]
+            logger.debug(f"Extraction: {' '.join(codec_args)} range={time_range}")
             
-            # Run FFmpeg command
-            result = subprocess.run(ffmpeg_cmd, capture_output=True, text=True)
-            
-            # Check extraction result
-            if result.returncode != 0:
-                logger.error(f"FFmpeg extraction error: {result.stderr}")
-                raise RuntimeError(f"Audio extraction failed: {result.stderr}")
+            async with self._extraction_slot():
+                await self._run_ffmpeg(ffmpeg_cmd, progress_callback)
             
             # Verify audio file was created
             if not audio_path.exists():
@@ -152,3 +176,150 @@ class MoviePyVideoProcessor(VideoProcessor):
         except Exception as e:
             logger.error(f"Audio extraction error: {e}", exc_info=True)
             raise
+
+    @staticmethod
+    def _temp_audio_path(video_path: pathlib.Path) -> pathlib.Path:
+        """A fresh temp file, so jobs on same-named videos never share one"""
+        fd, path = tempfile.mkstemp(prefix=f"{video_path.stem}_", suffix="_audio.wav")
+        os.close(fd)
+        return pathlib.Path(path)
+
+    async def _run_ffmpeg(self, ffmpeg_cmd: List[str], progress_callback: Optional[Callable[[float], None]]):
+        """Run FFmpeg without blocking the loop; killed on error, timeout or cancellation"""
+        process = await asyncio.create_subprocess_exec(
+            *ffmpeg_cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        stderr_tail: Deque[str] = deque(maxlen=STDERR_TAIL_LINES)
+        try:
+            # Drain stderr concurrently so a chatty FFmpeg cannot block on a full pipe
+            await asyncio.wait_for(
+                asyncio.gather(
+                    self._read_progress(process.stdout, progress_callback, self.stall_timeout),
+                    self._read_stderr(process.stderr, stderr_tail)
+                ),
+                self.timeout
+            )
+            returncode = await process.wait()
+        except asyncio.TimeoutError:
+            raise RuntimeError(f"Audio extraction timed out after {self.timeout:.0f}s")
+        finally:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+        
+        # Check extraction result
+        if returncode != 0:
+            message = "\n".join(stderr_tail)
+            logger.error(f"FFmpeg extraction error: {message}")
+            raise RuntimeError(f"Audio extraction failed: {message}")
+
+    @staticmethod
+    async def _read_progress(
+        stdout,
+        progress_callback: Optional[Callable[[float], None]],
+        stall_timeout: Optional[float] = None
+    ):
+        """Parse FFmpeg -progress key=value lines into seconds of media processed
+
+        FFmpeg reports about twice a second, so silence for stall_timeout
+        seconds means it is stuck (e.g. on an unreachable network input).
+        """
+        while True:
+            try:
+                line = await asyncio.wait_for(stdout.readline(), stall_timeout)
+            except asyncio.TimeoutError:
+                raise RuntimeError(f"FFmpeg made no progress for {stall_timeout:.0f}s")
+            if not line:
+                return
+            
+            key, _, value = line.decode(errors='replace').strip().partition('=')
+            # out_time_us is microseconds; older builds misname it out_time_ms
+            if key in ('out_time_us', 'out_time_ms') and value.isdigit() and progress_callback:
+                progress_callback(int(value) / 1_000_000)
+
+    @staticmethod
+    async def _read_stderr(stderr, tail: Deque[str]):
+        """Log FFmpeg diagnostics as they arrive, keeping the last few for errors"""
+        async for line in stderr:
+            text = line.decode(errors='replace').rstrip()
+            if text:
+                tail.append(text)
+                logger.debug(f"ffmpeg: {text}")
+
+    async def stream_audio(
+        self,
+        video_path: pathlib.Path,
+        chunk_seconds: float = 30.0,
+        media: Optional[MediaInfo] = None,
+        time_range: Optional[TimeRange] = None
+    ):
+        """Stream 16 kHz mono float32 audio chunks straight from FFmpeg's stdout"""
+        ffmpeg_path = self._require_ffmpeg(video_path)
+        map_args = self._audio_map_args(video_path, media)
+        logger.debug(f"Streaming audio from: {video_path}")
+        
+        # Raw little-endian PCM on stdout, no intermediate file
+        ffmpeg_cmd = [
+            ffmpeg_path,
+            '-nostdin',
+            '-v', 'error',
+            *self._range_args(time_range),
+            '-i', str(video_path),
+            *map_args,
+            '-vn',  # Disable video
+            '-f', 's16le',  # Raw PCM container
+            '-acodec', 'pcm_s16le',
+            '-ar', str(AUDIO_SAMPLE_RATE),
+            '-ac', '1',  # Mono channel
+            'pipe:1'
+        ]
+        
+        process = await asyncio.create_subprocess_exec(
+            *ffmpeg_cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        stderr_tail: Deque[str] = deque(maxlen=STDERR_TAIL_LINES)
+        stderr_reader = asyncio.create_task(self._read_stderr(process.stderr, stderr_tail))
+        
+        # Two bytes per 16-bit sample
+        chunk_bytes = max(int(chunk_seconds * AUDIO_SAMPLE_RATE), 1) * 2
+        total_samples = 0
+        
+        try:
+            while True:
+                try:
+                    data = await process.stdout.readexactly(chunk_bytes)
+                except asyncio.IncompleteReadError as e:
+                    # Final partial chunk, trimmed to whole samples
+                    data = e.partial[:len(e.partial) - len(e.partial) % 2]
+                    if data:
+                        total_samples += len(data) // 2
+                        yield self._pcm_to_float32(data)
+                    break
+                
+                total_samples += len(data) // 2
+                yield self._pcm_to_float32(data)
+            
+            await stderr_reader
+            returncode = await process.wait()
+            if returncode != 0:
+                message = "\n".join(stderr_tail)
+                logger.error(f"FFmpeg streaming error: {message}")
+                raise RuntimeError(f"Audio streaming failed: {message}")
+            
+            logger.debug(f"Audio streamed successfully. {total_samples / AUDIO_SAMPLE_RATE:.1f} seconds decoded")
+        
+        finally:
+            # Consumer stopped early or an error occurred
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            stderr_reader.cancel()
+
+    @staticmethod
+    def _pcm_to_float32(data: bytes) -> np.ndarray:
+        """Convert signed 16-bit PCM bytes to float32 samples in [-1, 1)"""
+        return np.frombuffer(data, dtype=np.int16).astype(np.float32) / 32768.0
@@ -1,16 +1,25 @@
 import sys
 import logging
 import os
+from infrastructure.startup_profile import StartupProfile
+
+# Started before the imports below so their cost shows up in the report
+startup = StartupProfile()
+
 from PyQt6.QtWidgets import QApplication, QSplashScreen
 from PyQt6.QtGui import QPixmap, QIcon
 from PyQt6.QtCore import Qt, QTimer
 from infrastructure.video_processor import MoviePyVideoProcessor
 from infrastructure.transcriber import WhisperTranscriber
-from infrastructure.translator import GoogleTranslatorService
+from infrastructure.parallel_transcriber import ParallelWhisperTranscriber
 from infrastructure.terminal_debugger import TerminalDebugger
 from application.subtitle_service import SubtitleService
 from presentation.main_window import MainWindow
 from infrastructure.preferences import JsonUserPreferences
+from infrastructure.transcript_cache import TranscriptCache
+from infrastructure.checkpoints import CheckpointStore
+from infrastructure.scratch_space import ScratchSpace
+from infrastructure.translation_executor import TranslationExecutor, DEFAULT_TRANSLATION_THREADS
 import json
 
 # Configure logging
@@ -23,6 +32,7 @@ logging.basicConfig(
     ]
 )
 logger = logging.getLogger(__name__)
+startup.mark("imports")
 
 def create_splash_screen():
     """Create and display a splash screen"""
@@ -76,6 +86,7 @@ def main():
         
         logger.info("Dependency Versions:")
         logger.info(json.dumps(dependencies, indent=2))
+        startup.mark("dependency check")
         
         # Create application
         app = QApplication(sys.argv)
@@ -87,23 +98,44 @@ def main():
         
         # Create and show splash screen
         splash = create_splash_screen()
+        startup.mark("qt and splash")
         
         # Initialize services
-        video_processor = MoviePyVideoProcessor()
-        transcriber = WhisperTranscriber()
-        translator = GoogleTranslatorService()
         preferences = JsonUserPreferences()
+        video_processor = MoviePyVideoProcessor(
+            max_concurrent_extractions=preferences.load_preferences().get("extraction_concurrency", 2)
+        )
+        
+        # Spread transcription over CPU processes when configured
+        transcription_workers = preferences.load_preferences().get("transcription_workers", 1)
+        if transcription_workers > 1:
+            transcriber = ParallelWhisperTranscriber(workers=transcription_workers)
+        else:
+            transcriber = WhisperTranscriber()
+        
+        # Threads for blocking translator calls, shared by every job
+        TranslationExecutor.configure(
+            preferences.load_preferences().get("translation_threads", DEFAULT_TRANSLATION_THREADS)
+        )
         
-        # Create subtitle service with optional progress callback
+        # Create subtitle service with optional progress callback;
+        # translator backends are created when a job first selects one
+        scratch = ScratchSpace(use_ram=preferences.load_preferences().get("ram_scratch", False))
         subtitle_service = SubtitleService(
             video_processor=video_processor,
             transcriber=transcriber,
-            translator=translator,
-            progress_callback=None
+            translator=None,
+            progress_callback=None,
+            transcript_cache=TranscriptCache(),
+            checkpoints=CheckpointStore(scratch.checkpoint_root),
+            scratch=scratch
         )
+        startup.mark("services")
 
         # Create main window
         window = MainWindow(subtitle_service, preferences)
+        startup.mark("main window")
+        startup.log()
         
         # Close splash screen after a delay and show main window
         QTimer.singleShot(2000, splash.close)  # 2-second splash screen
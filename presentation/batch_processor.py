@@ -1,5 +1,6 @@
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-                           QListWidget, QLabel, QSpinBox, QProgressBar)
+                           QListWidget, QLabel, QSpinBox, QProgressBar,
+                           QFileDialog, QComboBox)
 from PyQt6.QtCore import pyqtSignal
 import pathlib
 
@@ -40,9 +41,30 @@ class BatchProcessingWidget(QWidget):
         
         layout.addLayout(controls_layout)
 
+        # Batch target and start
+        start_layout = QHBoxLayout()
+        
+        self.target_language_combo = QComboBox()
+        self.target_language_combo.addItems([
+            "en English", "es Spanish", "fr French", 
+            "de German", "it Italian", "pt Portuguese", "ar Arabic"
+        ])
+        
+        self.start_btn = QPushButton("Process Batch")
+        self.start_btn.clicked.connect(self.start_batch)
+        
+        start_layout.addWidget(QLabel("Target Language:"))
+        start_layout.addWidget(self.target_language_combo)
+        start_layout.addWidget(self.start_btn)
+        
+        layout.addLayout(start_layout)
+
         # Batch progress
         self.batch_progress = QProgressBar()
         layout.addWidget(self.batch_progress)
+        
+        self.summary_label = QLabel("")
+        layout.addWidget(self.summary_label)
 
     def add_files(self):
         files, _ = QFileDialog.getOpenFileNames(
@@ -66,3 +88,33 @@ class BatchProcessingWidget(QWidget):
     def update_progress(self):
         self.batch_progress.setMaximum(len(self.files))
         self.batch_progress.setValue(0)
+
+    def start_batch(self):
+        if not self.files:
+            return
+        
+        selected_lang = self.target_language_combo.currentText().split()[0]
+        self.update_progress()
+        self.summary_label.setText("")
+        self.set_running(True)
+        self.process_batch.emit(list(self.files), selected_lang)
+
+    def set_running(self, running: bool):
+        for widget in (self.add_files_btn, self.clear_btn, self.concurrent_spin, self.start_btn):
+            widget.setEnabled(not running)
+
+    def set_file_status(self, file_path: str, status: str):
+        """Show per-file status next to its name"""
+        if file_path in self.files:
+            row = self.files.index(file_path)
+            self.file_list.item(row).setText(f"{pathlib.Path(file_path).name} - {status}")
+
+    def mark_file_done(self, file_path: str, succeeded: bool, message: str):
+        self.set_file_status(file_path, "done" if succeeded else f"failed: {message}")
+        self.batch_progress.setValue(self.batch_progress.value() + 1)
+
+    def show_summary(self, succeeded: int, failed: int, files_per_hour: float):
+        self.set_running(False)
+        self.summary_label.setText(
+            f"{succeeded} succeeded, {failed} failed - {files_per_hour:.1f} files/hour"
+        )
@@ -4,15 +4,21 @@ from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QPushButton,
                            QStackedWidget, QToolBar, QDialog, QSpinBox, QCheckBox,
                            QApplication, QGroupBox, QGridLayout, QLineEdit,
                            QTabWidget, QDialogButtonBox, QFormLayout)
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer
+from PyQt6.QtCore import Qt, QThread, pyqtSignal
 from PyQt6.QtGui import QIcon, QPixmap
 from presentation.styles import LIGHT_STYLE, DARK_STYLE
 from presentation.animations import WidgetAnimations
 from presentation.batch_processor import BatchProcessingWidget
 from infrastructure.preferences import JsonUserPreferences
+from infrastructure.loop_monitor import monitored
+from infrastructure.parallel_transcriber import ParallelWhisperTranscriber, transcription_workers
 from application.subtitle_service import SubtitleService
+from application.batch_scheduler import BatchScheduler
+from application.progress import format_duration
 from domain.interfaces import ProcessingStatus
+from domain.entities import CancellationToken
 import asyncio
+import copy
 import pathlib
 import os
 import logging
@@ -49,6 +55,8 @@ class VideoProcessingThread(QThread):
     """Dedicated thread for video processing with signal-based error handling"""
     processing_complete = pyqtSignal(object)
     processing_error = pyqtSignal(str, str)
+    # ProcessingResult progress updates, emitted from the worker thread
+    progress_changed = pyqtSignal(object)
 
     def __init__(
         self, 
@@ -62,17 +70,25 @@ class VideoProcessingThread(QThread):
         self.file_path = file_path
         self.target_language = target_language
         self.translation_method = translation_method
+        self.cancel_token = CancellationToken()
+
+    def cancel(self):
+        """Ask the running job to stop; safe to call from the GUI thread"""
+        self.cancel_token.cancel()
 
     def run(self):
         try:
-            # Simulate processing with progress updates
-            result = asyncio.run(
+            # PYTHONASYNCIODEBUG=1 reports calls that block the job's loop
+            result = asyncio.run(monitored(
                 self.subtitle_service.process_video(
                     pathlib.Path(self.file_path), 
                     self.target_language,
-                    self.translation_method
+                    self.translation_method,
+                    cancel_token=self.cancel_token,
+                    # Signals are queued to the GUI thread, so emitting from here is thread-safe
+                    progress_callback=self.progress_changed.emit
                 )
-            )
+            ))
             self.processing_complete.emit(result)
         except Exception as e:
             # Capture full traceback for detailed error logging
@@ -81,6 +97,55 @@ class VideoProcessingThread(QThread):
             logger.error(error_traceback)
             self.processing_error.emit(str(e), error_traceback)
 
+class BatchProcessingThread(QThread):
+    """Runs a BatchScheduler on its own event loop and reports per-file progress"""
+    file_progress = pyqtSignal(str, str)
+    file_finished = pyqtSignal(str, bool, str)
+    batch_finished = pyqtSignal(object)
+    batch_error = pyqtSignal(str, str)
+
+    def __init__(
+        self, 
+        subtitle_service, 
+        files, 
+        target_language, 
+        translation_method='GoogleTrans',
+        concurrency=3
+    ):
+        super().__init__()
+        self.subtitle_service = subtitle_service
+        self.files = files
+        self.target_language = target_language
+        self.translation_method = translation_method
+        self.concurrency = concurrency
+
+    def run(self):
+        try:
+            # Report back with the original strings the widget knows about
+            originals = {pathlib.Path(f): f for f in self.files}
+            
+            scheduler = BatchScheduler(
+                self.subtitle_service,
+                concurrency=self.concurrency,
+                file_progress_callback=lambda path, result: self.file_progress.emit(
+                    originals.get(path, str(path)), result.message
+                ),
+                file_done_callback=lambda item: self.file_finished.emit(
+                    originals.get(item.video_path, str(item.video_path)),
+                    item.succeeded,
+                    item.error or ""
+                )
+            )
+            report = asyncio.run(monitored(scheduler.run(
+                list(originals), [self.target_language], self.translation_method
+            )))
+            self.batch_finished.emit(report)
+        except Exception as e:
+            error_traceback = traceback.format_exc()
+            logger.error(f"Batch processing error: {e}")
+            logger.error(error_traceback)
+            self.batch_error.emit(str(e), error_traceback)
+
 class PreferencesDialog(QDialog):
     """Modern, responsive preferences dialog"""
     
@@ -130,7 +195,7 @@ class PreferencesDialog(QDialog):
         # Translation Method
         method_label = QLabel("Default Translation Method:")
         self.method_combo = QComboBox()
-        self.method_combo.addItems(["GoogleTrans", "Argos Translate"])
+        self.method_combo.addItems(["GoogleTrans", "Argos Translate", "Auto"])
         translation_layout.addRow(method_label, self.method_combo)
         
         # Max Chunk Size
@@ -288,6 +353,8 @@ class MainWindow(QMainWindow):
         self.subtitle_service = subtitle_service
         self.preferences = preferences
         self.animations = WidgetAnimations()
+        # Process pool for batches when the shared transcriber decodes one file at a time
+        self._batch_transcriber = None
         
         # Set window icon
         icon_path = os.path.join('assets', 'logo.jpg')
@@ -329,12 +396,19 @@ class MainWindow(QMainWindow):
         preferences_action = toolbar.addAction("Preferences")
         preferences_action.triggered.connect(self.show_preferences)
         
-        # Main processing UI
-        self.create_main_processing_ui(central_layout)
+        # Main processing UI: single video and batch tabs
+        tabs = QTabWidget()
+        
+        single_tab = QWidget()
+        single_layout = QVBoxLayout(single_tab)
+        self.create_main_processing_ui(single_layout)
+        tabs.addTab(single_tab, "Single Video")
         
-        # Initialize progress timer
-        self.progress_timer = QTimer(self)
-        self.progress_timer.timeout.connect(self.update_progress)
+        self.batch_widget = BatchProcessingWidget()
+        self.batch_widget.process_batch.connect(self.process_batch)
+        tabs.addTab(self.batch_widget, "Batch")
+        
+        central_layout.addWidget(tabs)
         
         logger.debug("MainWindow initialization COMPLETED")
 
@@ -402,7 +476,7 @@ class MainWindow(QMainWindow):
         method_label = QLabel("Translation Method:")
         self.translation_method_combo = QComboBox()
         self.translation_method_combo.addItems([
-            "GoogleTrans", "Argos Translate"
+            "GoogleTrans", "Argos Translate", "Auto"
         ])
         
         processing_options_layout.addWidget(language_label, 0, 0)
@@ -425,7 +499,11 @@ class MainWindow(QMainWindow):
         self.progress_bar.setTextVisible(True)
         self.progress_bar.setFormat("%p% - Processing")
         
+        # Throughput and ETA of the current stage
+        self.progress_detail_label = QLabel("")
+        
         progress_layout.addWidget(self.progress_bar)
+        progress_layout.addWidget(self.progress_detail_label)
         
         # Results text area
         self.results_text = QTextEdit()
@@ -442,9 +520,16 @@ class MainWindow(QMainWindow):
         self.export_srt_button.clicked.connect(self.export_subtitles_to_srt)
         self.export_srt_button.setEnabled(False)  # Disable until subtitles are generated
         
+        # Cancel button
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.clicked.connect(self.cancel_processing)
+        self.cancel_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_MediaStop))
+        self.cancel_button.setEnabled(False)  # Enabled while a video is processing
+        
         # Buttons layout
         buttons_layout = QHBoxLayout()
         buttons_layout.addWidget(self.process_button)
+        buttons_layout.addWidget(self.cancel_button)
         buttons_layout.addWidget(self.export_srt_button)
         
         # Add to progress and results layout
@@ -513,6 +598,8 @@ class MainWindow(QMainWindow):
             # Reset UI
             self.results_text.clear()
             self.progress_bar.setValue(0)
+            self.progress_bar.setFormat("%p% - Starting...")
+            self.progress_detail_label.clear()
             
             # Start video processing in a separate thread
             self.processing_thread = VideoProcessingThread(
@@ -523,11 +610,14 @@ class MainWindow(QMainWindow):
             )
             
             # Connect thread signals
+            self.processing_thread.progress_changed.connect(self.on_progress)
             self.processing_thread.processing_complete.connect(self.on_processing_complete)
             self.processing_thread.processing_error.connect(self.on_processing_error)
             
             # Start processing
             self.processing_thread.start()
+            self.process_button.setEnabled(False)
+            self.cancel_button.setEnabled(True)
         
         except Exception as e:
             ErrorHandler.show_error_message(
@@ -537,39 +627,110 @@ class MainWindow(QMainWindow):
                 str(traceback.format_exc())
             )
 
-    def update_progress(self):
-        """Update progress bar dynamically"""
-        current_value = self.progress_bar.value()
-        if current_value < 100:
-            # Increment progress
-            new_value = min(current_value + 5, 100)
-            self.progress_bar.setValue(new_value)
-            
-            # Update status text
-            status_text = {
-                0: "Initializing...",
-                20: "Extracting audio...",
-                40: "Transcribing audio...",
-                60: "Translating subtitles...",
-                80: "Finalizing...",
-                100: "Processing complete!"
-            }.get(new_value, "Processing...")
-            
-            self.progress_bar.setFormat(f"%p% - {status_text}")
-        else:
-            # Stop timer when progress is complete
-            if hasattr(self, 'progress_timer'):
-                self.progress_timer.stop()
+    def cancel_processing(self):
+        """Stop the running video; finished stages are kept for the next run"""
+        thread = getattr(self, 'processing_thread', None)
+        if thread and thread.isRunning():
+            self.cancel_button.setEnabled(False)
+            self.progress_bar.setFormat("%p% - Cancelling...")
+            thread.cancel()
+
+    def batch_service(self, concurrency):
+        """The shared service, with a process per concurrent file when it has too few workers"""
+        transcriber = self.subtitle_service.transcriber
+        current = transcriber.workers if isinstance(transcriber, ParallelWhisperTranscriber) else 1
+        workers = transcription_workers(current, concurrency)
+        if workers == current:
+            return self.subtitle_service
+
+        if self._batch_transcriber is None or self._batch_transcriber.workers != workers:
+            if self._batch_transcriber is not None:
+                self._batch_transcriber.shutdown()
+            self._batch_transcriber = ParallelWhisperTranscriber(
+                model_name=transcriber.model_name, workers=workers
+            )
+        service = copy.copy(self.subtitle_service)
+        service.transcriber = self._batch_transcriber
+        return service
+
+    def process_batch(self, files, target_language):
+        """Start processing several videos concurrently"""
+        try:
+            selected_method = self.translation_method_combo.currentText()
+            
+            concurrency = self.batch_widget.concurrent_spin.value()
+            self.batch_thread = BatchProcessingThread(
+                self.batch_service(concurrency),
+                files,
+                target_language,
+                selected_method,
+                concurrency
+            )
+            
+            # Connect thread signals
+            self.batch_thread.file_progress.connect(self.batch_widget.set_file_status)
+            self.batch_thread.file_finished.connect(self.batch_widget.mark_file_done)
+            self.batch_thread.batch_finished.connect(self.on_batch_complete)
+            self.batch_thread.batch_error.connect(self.on_batch_error)
+            
+            self.batch_thread.start()
+        
+        except Exception as e:
+            self.batch_widget.set_running(False)
+            ErrorHandler.show_error_message(
+                self, 
+                "Batch Processing Error", 
+                "Failed to start batch processing",
+                str(traceback.format_exc())
+            )
+
+    def on_batch_complete(self, report):
+        """Show batch throughput once every file has finished"""
+        self.batch_widget.show_summary(report.succeeded, report.failed, report.files_per_hour)
+        QMessageBox.information(
+            self,
+            "Batch Complete",
+            f"Processed {len(report.items)} videos in {report.elapsed:.0f}s\n"
+            f"{report.succeeded} succeeded, {report.failed} failed\n"
+            f"Throughput: {report.files_per_hour:.1f} files/hour"
+        )
+
+    def on_batch_error(self, error_message, error_traceback):
+        self.batch_widget.set_running(False)
+        ErrorHandler.show_error_message(
+            self, 
+            "Batch Processing Error", 
+            f"Batch processing failed: {error_message}",
+            error_traceback
+        )
+
+    def on_progress(self, result):
+        """Show measured stage progress reported by the processing thread"""
+        self.progress_bar.setValue(int(result.progress * 100))
+        self.progress_bar.setFormat(f"%p% - {result.message}")
+        
+        event = result.event
+        if event is None:
+            return
+        
+        details = []
+        if event.total:
+            details.append(f"{event.done:.0f}/{event.total:.0f} {event.unit}")
+        if event.rate:
+            details.append(f"{event.rate:.1f} {event.unit}/s")
+        if event.eta_seconds is not None:
+            details.append(f"ETA {format_duration(event.eta_seconds)}")
+        self.progress_detail_label.setText(" · ".join(details))
 
     def on_processing_complete(self, result):
         """Handle successful video processing"""
+        self.process_button.setEnabled(True)
+        self.cancel_button.setEnabled(False)
         try:
-            # Stop progress timer if it exists
-            if hasattr(self, 'progress_timer'):
-                self.progress_timer.stop()
-            
             # Update progress bar
             self.progress_bar.setValue(100)
+            self.progress_bar.setFormat(f"%p% - {result.message}")
+            self.progress_detail_label.clear()
             
             # Log processing result details
             logger.debug(f"Processing Result Status: {result.status}")
@@ -595,6 +756,9 @@ class MainWindow(QMainWindow):
                     "Processing Complete", 
                     f"Video processing finished successfully!\nGenerated {len(result.subtitles)} subtitles."
                 )
+            elif result.status == ProcessingStatus.CANCELLED:
+                self.export_srt_button.setEnabled(False)
+                self.results_text.setText(result.message)
             else:
                 # Disable SRT export button
                 self.export_srt_button.setEnabled(False)
@@ -617,9 +781,12 @@ class MainWindow(QMainWindow):
 
     def on_processing_error(self, error_message, error_traceback):
         """Handle processing errors"""
+        self.process_button.setEnabled(True)
+        self.cancel_button.setEnabled(False)
         try:
-            self.progress_timer.stop()
             self.progress_bar.setValue(0)
+            self.progress_bar.setFormat("%p% - Failed")
+            self.progress_detail_label.clear()
             
             # Log the full error
             logger.error(f"Video processing error: {error_message}")
@@ -0,0 +1,66 @@
+from types import SimpleNamespace
+from infrastructure.argos_engine import ArgosBatchEngine, PairRoutes, split_sentences
+
+class FakeTokenizer:
+    def encode(self, sentences, out_type=str):
+        return [sentence.split() for sentence in sentences]
+
+    def decode(self, tokens):
+        return " ".join(tokens)
+
+class FakeTranslator:
+    def __init__(self):
+        self.calls = []
+
+    def translate_batch(self, tokens, target_prefix=None, max_batch_size=0, beam_size=1):
+        self.calls.append((tokens, target_prefix))
+        prefixes = target_prefix or [[]] * len(tokens)
+        return [
+            SimpleNamespace(hypotheses=[prefix + [token.upper() for token in sentence]])
+            for prefix, sentence in zip(prefixes, tokens)
+        ]
+
+def make_engine(target_prefix=""):
+    engine = ArgosBatchEngine.__new__(ArgosBatchEngine)
+    engine.translator = FakeTranslator()
+    engine.tokenizer = FakeTokenizer()
+    engine.target_prefix = target_prefix
+    engine.max_batch_size = 32
+    engine.beam_size = 1
+    return engine
+
+def test_split_sentences():
+    assert split_sentences(" Hello there. How are you?  Fine ") == ["Hello there.", "How are you?", "Fine"]
+    assert split_sentences("   ") == []
+
+def test_translate_sends_every_sentence_in_one_batch_and_maps_back():
+    engine = make_engine()
+    result = engine.translate(["Hi. Bye.", "", "one more"])
+
+    assert result == ["HI. BYE.", "", "ONE MORE"]
+    assert len(engine.translator.calls) == 1
+    tokens, _ = engine.translator.calls[0]
+    assert tokens == [["Hi."], ["Bye."], ["one", "more"]]
+
+def test_target_prefix_is_requested_and_stripped():
+    engine = make_engine(target_prefix="__es__")
+    assert engine.translate(["hola"]) == ["HOLA"]
+    assert engine.translator.calls[0][1] == [["__es__"]]
+
+def package(from_code, to_code):
+    return SimpleNamespace(from_code=from_code, to_code=to_code)
+
+def test_routes_prefer_direct_then_shortest_pivot():
+    routes = PairRoutes([
+        package("ar", "en"), package("en", "fr"), package("en", "es"),
+        package("es", "fr"), package("ar", "es")
+    ])
+
+    def hops(from_code, to_code):
+        route = routes.route(from_code, to_code)
+        return None if route is None else [(p.from_code, p.to_code) for p in route]
+
+    assert hops("en", "fr") == [("en", "fr")]
+    assert hops("ar", "fr") in ([("ar", "en"), ("en", "fr")], [("ar", "es"), ("es", "fr")])
+    assert hops("fr", "en") is None
+    assert hops("en", "en") == []
@@ -0,0 +1,36 @@
+import numpy as np
+from infrastructure.audio_segmentation import find_split_points, split_on_silence
+
+SAMPLE_RATE = 16000
+
+def _speech_with_pauses(pause_at_seconds, total_seconds):
+    rng = np.random.default_rng(0)
+    samples = rng.uniform(-0.5, 0.5, int(total_seconds * SAMPLE_RATE)).astype(np.float32)
+    for pause in pause_at_seconds:
+        start = int(pause * SAMPLE_RATE)
+        samples[start:start + SAMPLE_RATE // 2] = 0.0
+    return samples
+
+def test_split_points_snap_to_nearby_silence():
+    samples = _speech_with_pauses([57.0, 124.0], 180)
+
+    points = find_split_points(samples, SAMPLE_RATE, target_chunk_seconds=60, search_seconds=10)
+
+    assert len(points) == 2
+    assert 57.0 <= points[0] / SAMPLE_RATE <= 57.5
+    assert 124.0 <= points[1] / SAMPLE_RATE <= 124.5
+
+def test_split_on_silence_covers_all_samples():
+    samples = _speech_with_pauses([30.0, 70.0], 100)
+
+    chunks = split_on_silence(samples, SAMPLE_RATE, target_chunk_seconds=35)
+
+    assert chunks[0][0] == 0
+    assert sum(len(chunk) for _, chunk in chunks) == len(samples)
+    for (start, chunk), (next_start, _) in zip(chunks, chunks[1:]):
+        assert start + len(chunk) == next_start
+
+def test_short_audio_is_not_split():
+    samples = np.zeros(SAMPLE_RATE * 5, dtype=np.float32)
+    assert len(split_on_silence(samples, SAMPLE_RATE, target_chunk_seconds=60)) == 1
+    assert find_split_points(samples, SAMPLE_RATE, target_chunk_seconds=60) == []
@@ -0,0 +1,49 @@
+import pytest
+from pathlib import Path
+from domain.interfaces import SubtitleEntry, ProcessingStatus
+from domain.entities import ProcessingResult
+from application.batch_scheduler import BatchScheduler
+
+class FakeService:
+    def __init__(self):
+        self.progress_callback = self.shared_progress = lambda result: None
+
+    async def process_video_multi(self, video_path, targets, translation_method, output_dir, **kwargs):
+        if video_path.name == "broken.mp4":
+            raise RuntimeError("decode failed")
+        kwargs["progress_callback"](ProcessingResult(ProcessingStatus.TRANSCRIBING, "Transcribing audio...", 0.33))
+        return {
+            language: ProcessingResult(
+                status=ProcessingStatus.COMPLETED,
+                message="done",
+                progress=1.0,
+                subtitles=[SubtitleEntry(1, "00:00:01,000", "00:00:02,000", language)]
+            )
+            for language in targets
+        }
+
+@pytest.mark.asyncio
+async def test_batch_continues_after_a_failing_file():
+    progress = []
+    done = []
+    service = FakeService()
+    scheduler = BatchScheduler(
+        service,
+        concurrency=2,
+        file_progress_callback=lambda path, result: progress.append(path.name),
+        file_done_callback=done.append
+    )
+
+    report = await scheduler.run(
+        [Path("a.mp4"), Path("broken.mp4"), Path("b.mp4")], ["es", "fr"]
+    )
+
+    assert report.succeeded == 2
+    assert report.failed == 1
+    assert report.files_per_hour > 0
+    assert sorted(progress) == ["a.mp4", "b.mp4"]
+    assert [item.video_path.name for item in report.items] == ["a.mp4", "broken.mp4", "b.mp4"]
+    assert "decode failed" in report.items[1].error
+    assert len(done) == 3
+    # Progress is routed per call; the shared service callback is never swapped
+    assert service.progress_callback is service.shared_progress
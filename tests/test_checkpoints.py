@@ -0,0 +1,96 @@
+import os
+import time
+import wave
+import numpy as np
+from domain.interfaces import SubtitleEntry, AUDIO_SAMPLE_RATE
+from infrastructure.checkpoints import CheckpointStore
+from infrastructure.scratch_space import ScratchSpace
+
+def entry(index):
+    return SubtitleEntry(index, "00:00:01,000", "00:00:02,000", f"line {index}")
+
+def test_transcript_drops_segments_of_unfinished_window(tmp_path):
+    video_path = tmp_path / "talk.mp4"
+    video_path.write_bytes(b"video")
+    checkpoint = CheckpointStore(tmp_path / "checkpoints").job(video_path, {"model": "base"})
+
+    checkpoint.append_segment(entry(1))
+    checkpoint.append_segment(entry(2))
+    checkpoint.mark_transcribed(30.0)
+    checkpoint.append_segment(entry(3))
+    with open(checkpoint.transcript_path, 'a', encoding='utf-8') as f:
+        f.write('{"index": 4, "start')
+
+    entries, until, complete = checkpoint.load_transcript()
+
+    assert [e.index for e in entries] == [1, 2]
+    assert until == 30.0
+    assert not complete
+
+def test_job_is_keyed_by_video_and_settings(tmp_path):
+    video_path = tmp_path / "talk.mp4"
+    video_path.write_bytes(b"video")
+    store = CheckpointStore(tmp_path / "checkpoints")
+
+    checkpoint = store.job(video_path, {"model": "base"})
+    checkpoint.append_translations("GoogleTrans:en:es", [entry(1)])
+
+    assert store.job(video_path, {"model": "base"}).load_translations("GoogleTrans:en:es") == {1: entry(1)}
+    assert store.job(video_path, {"model": "small"}).load_translations("GoogleTrans:en:es") == {}
+
+    checkpoint.complete()
+    assert store.job(video_path, {"model": "base"}).load_translations("GoogleTrans:en:es") == {}
+
+def test_read_audio_from_offset(tmp_path):
+    extracted = tmp_path / "audio.wav"
+    samples = np.arange(2 * AUDIO_SAMPLE_RATE, dtype=np.int16)
+    with wave.open(str(extracted), 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(AUDIO_SAMPLE_RATE)
+        wav.writeframes(samples.tobytes())
+    video_path = tmp_path / "talk.mp4"
+    video_path.write_bytes(b"video")
+    checkpoint = CheckpointStore(tmp_path / "checkpoints").job(video_path, {})
+
+    checkpoint.save_audio(extracted)
+    tail = checkpoint.read_audio(1.5)
+
+    assert not extracted.exists()
+    assert len(tail) == AUDIO_SAMPLE_RATE // 2
+    assert tail[0] == np.float32(samples[int(1.5 * AUDIO_SAMPLE_RATE)] / 32768.0)
+
+def make_checkpoint(root, name, size, age_seconds):
+    directory = root / name
+    directory.mkdir(parents=True)
+    audio = directory / "audio.wav"
+    audio.write_bytes(b"\0" * size)
+    used = time.time() - age_seconds
+    os.utime(audio, (used, used))
+    os.utime(directory, (used, used))
+    return directory
+
+def test_stale_and_oversized_checkpoints_are_swept_on_startup(tmp_path):
+    root = tmp_path / "checkpoints"
+    abandoned = make_checkpoint(root, "abandoned", 10, age_seconds=30 * 24 * 3600)
+    older = make_checkpoint(root, "older", 600, age_seconds=3600)
+    recent = make_checkpoint(root, "recent", 600, age_seconds=60)
+
+    CheckpointStore(root, max_age_seconds=7 * 24 * 3600, max_total_bytes=1000)
+
+    assert not abandoned.exists()
+    assert not older.exists()
+    assert recent.exists()
+
+def test_checkpoint_audio_counts_against_scratch_quota(tmp_path):
+    scratch = ScratchSpace(tmp_path / "scratch")
+    video_path = tmp_path / "talk.mp4"
+    video_path.write_bytes(b"video")
+    extracted = scratch.root / "audio.wav"
+    extracted.write_bytes(b"\0" * 1000)
+
+    checkpoint = CheckpointStore(scratch.checkpoint_root).job(video_path, {})
+    checkpoint.save_audio(extracted)
+
+    assert checkpoint.audio_path.is_relative_to(scratch.root)
+    assert scratch.usage() >= 1000
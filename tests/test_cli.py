@@ -0,0 +1,96 @@
+import argparse
+import json
+import pytest
+from domain.entities import ProcessingResult
+from domain.interfaces import ProcessingStatus, SubtitleEntry
+import cli
+
+def test_parse_clock_accepts_seconds_and_clocks():
+    assert cli.parse_clock("90") == 90.0
+    assert cli.parse_clock("1:30") == 90.0
+    assert cli.parse_clock("01:01:30.5") == 3690.5
+    with pytest.raises(argparse.ArgumentTypeError):
+        cli.parse_clock("1:xx")
+
+def test_expand_inputs_globs_directories_and_duplicates(tmp_path):
+    for name in ("b.mp4", "a.mkv", "notes.txt"):
+        (tmp_path / name).write_bytes(b"")
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "nested" / "c.MOV").write_bytes(b"")
+
+    paths = cli.expand_inputs([
+        str(tmp_path / "b.mp4"),
+        str(tmp_path / "*.mp4"),
+        str(tmp_path),
+        str(tmp_path / "nested"),
+        str(tmp_path / "missing.mp4")
+    ])
+
+    assert paths == [
+        tmp_path / "b.mp4",
+        tmp_path / "a.mkv",
+        tmp_path / "nested" / "c.MOV",
+        tmp_path / "missing.mp4"
+    ]
+
+class FakeService:
+    def __init__(self, cancel=False):
+        self.progress_callback = lambda result: None
+        self.cancel = cancel
+
+    async def process_video_multi(self, video_path, targets, translation_method, output_dir, **kwargs):
+        if video_path.name == "broken.mp4":
+            raise RuntimeError("decode failed")
+        if self.cancel:
+            kwargs["cancel_token"].cancel()
+        return {
+            language: ProcessingResult(
+                status=ProcessingStatus.COMPLETED,
+                message="done",
+                progress=1.0,
+                subtitles=[SubtitleEntry(1, "00:00:01,000", "00:00:02,000", language)]
+            )
+            for language in targets
+        }
+
+def run_cli(monkeypatch, capsys, argv, service=None):
+    monkeypatch.setattr(cli, "build_service", lambda args: service or FakeService())
+    monkeypatch.setattr(cli, "build_transcription_options", lambda args: None)
+    code = cli.main(argv)
+    events = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    return code, events
+
+def test_exit_code_when_nothing_matches(monkeypatch, capsys, tmp_path):
+    code, events = run_cli(monkeypatch, capsys, [str(tmp_path / "*.mp4"), "-l", "es"])
+
+    assert code == 2
+    assert events[-1]["event"] == "error"
+
+def test_exit_code_for_invalid_options(monkeypatch, capsys, tmp_path):
+    def invalid(args):
+        raise ValueError("Unknown preset 'slowest'")
+
+    monkeypatch.setattr(cli, "build_transcription_options", invalid)
+    code = cli.main([str(tmp_path / "a.mp4"), "-l", "es"])
+
+    assert code == 2
+    assert "slowest" in json.loads(capsys.readouterr().out)["message"]
+
+def test_exit_codes_for_success_and_failure(monkeypatch, capsys, tmp_path):
+    code, events = run_cli(monkeypatch, capsys, [str(tmp_path / "a.mp4"), "-l", "es,fr"])
+
+    assert code == 0
+    assert [event["language"] for event in events if event["event"] == "completed"] == ["es", "fr"]
+    assert events[-1]["event"] == "summary" and events[-1]["succeeded"] == 1
+
+    code, events = run_cli(monkeypatch, capsys, [str(tmp_path / "a.mp4"), str(tmp_path / "broken.mp4"), "-l", "es"])
+
+    assert code == 1
+    assert events[-1]["failed"] == 1
+    assert any(event["event"] == "error" and "decode failed" in event["message"] for event in events)
+
+def test_exit_code_when_cancelled(monkeypatch, capsys, tmp_path):
+    code, events = run_cli(monkeypatch, capsys, [str(tmp_path / "a.mp4"), "-l", "es"], FakeService(cancel=True))
+
+    assert code == 130
+    assert events[-1]["event"] == "summary"
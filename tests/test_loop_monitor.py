@@ -0,0 +1,25 @@
+import asyncio
+import logging
+import time
+import pytest
+from infrastructure.loop_monitor import LoopBlockingMonitor, monitored
+
+def blocking_call():
+    time.sleep(0.3)
+
+@pytest.mark.asyncio
+async def test_monitor_reports_the_blocking_call(caplog):
+    monitor = LoopBlockingMonitor(asyncio.get_running_loop(), threshold=0.05).start()
+    with caplog.at_level(logging.WARNING, logger="infrastructure.loop_monitor"):
+        await asyncio.sleep(0.1)
+        blocking_call()
+        await asyncio.sleep(0.1)
+        monitor.stop()
+
+    assert monitor.stalls == 1
+    assert "blocking_call" in caplog.text
+
+@pytest.mark.asyncio
+async def test_monitored_is_a_no_op_outside_debug_mode():
+    asyncio.get_running_loop().set_debug(False)
+    assert await monitored(asyncio.sleep(0, result=42)) == 42
@@ -0,0 +1,27 @@
+from infrastructure.media_probe import parse_ffprobe
+
+def test_parse_ffprobe_picks_audio_and_video_streams():
+    data = {
+        "streams": [
+            {"index": 0, "codec_type": "video", "codec_name": "mjpeg", "disposition": {"attached_pic": 1}},
+            {"index": 1, "codec_type": "video", "codec_name": "h264", "disposition": {"attached_pic": 0}},
+            {"index": 2, "codec_type": "audio", "codec_name": "aac", "sample_rate": "48000", "channels": 2},
+        ],
+        "format": {"format_name": "mov,mp4,m4a", "duration": "95.250000"}
+    }
+
+    media = parse_ffprobe(data)
+
+    assert media.duration == 95.25
+    assert media.audio_codec == "aac"
+    assert media.sample_rate == 48000
+    assert media.channels == 2
+    assert media.audio_stream_index == 2
+    assert media.video_stream_index == 1
+    assert media.has_audio
+
+def test_parse_ffprobe_without_audio():
+    media = parse_ffprobe({"streams": [{"index": 0, "codec_type": "video"}], "format": {}})
+
+    assert media.duration == 0.0
+    assert not media.has_audio
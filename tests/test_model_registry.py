@@ -0,0 +1,35 @@
+import threading
+from infrastructure.model_registry import ModelRegistry
+
+def test_model_is_loaded_lazily_once_and_shared():
+    registry = ModelRegistry(idle_timeout=0)
+    loads = []
+
+    def loader():
+        loads.append(1)
+        return object()
+
+    assert registry.loaded() == {}
+
+    models = []
+    threads = [
+        threading.Thread(target=lambda: models.append(registry.get("whisper:base", loader)))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(loads) == 1
+    assert all(model is models[0] for model in models)
+
+def test_idle_models_are_unloaded_but_not_while_in_use():
+    registry = ModelRegistry(idle_timeout=0)
+
+    with registry.use("whisper:base", object):
+        assert registry.unload_idle() == 0
+        assert "whisper:base" in registry.loaded()
+
+    assert registry.unload_idle() == 1
+    assert registry.loaded() == {}
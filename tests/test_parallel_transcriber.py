@@ -0,0 +1,70 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pytest
+
+pytest.importorskip("torch")
+pytest.importorskip("whisper")
+
+from domain.interfaces import TranscriptionOptions, AUDIO_SAMPLE_RATE
+from infrastructure import parallel_transcriber
+from infrastructure.audio_segmentation import split_on_silence
+from infrastructure.parallel_transcriber import ParallelWhisperTranscriber
+from infrastructure.srt_writer import format_timestamp
+
+def _speech_with_pauses(pause_at_seconds, total_seconds):
+    rng = np.random.default_rng(0)
+    samples = rng.uniform(-0.5, 0.5, int(total_seconds * AUDIO_SAMPLE_RATE)).astype(np.float32)
+    for pause in pause_at_seconds:
+        start = int(pause * AUDIO_SAMPLE_RATE)
+        samples[start:start + AUDIO_SAMPLE_RATE // 2] = 0.0
+    return samples
+
+@pytest.mark.asyncio
+async def test_chunks_are_stitched_onto_the_global_timeline(monkeypatch):
+    samples = _speech_with_pauses([57.0, 124.0], 180)
+    chunks = split_on_silence(samples, AUDIO_SAMPLE_RATE, 60.0)
+    assert len(chunks) == 3
+
+    # Earlier chunks finish last, so order must come from the timeline
+    delays = [0.1, 0.05, 0.0]
+    lock = threading.Lock()
+
+    def transcribe_chunk(chunk, model_name, quantize_int8, kwargs):
+        with lock:
+            delay = delays.pop(0)
+        time.sleep(delay)
+        return [(0.5, 1.0, f"first {len(chunk)}"), (2.0, 3.5, f"second {len(chunk)}")]
+
+    transcriber = ParallelWhisperTranscriber(workers=3, chunk_seconds=60.0)
+    pool = ThreadPoolExecutor(max_workers=3)
+    monkeypatch.setattr(parallel_transcriber, "_transcribe_chunk", transcribe_chunk)
+    monkeypatch.setattr(transcriber, "_get_pool", lambda: pool)
+    progress = []
+
+    try:
+        entries = await transcriber.transcribe(
+            samples, TranscriptionOptions(language="en"), progress_callback=progress.append
+        )
+    finally:
+        pool.shutdown()
+
+    expected = []
+    for start_sample, chunk in chunks:
+        offset = start_sample / AUDIO_SAMPLE_RATE
+        expected += [
+            (format_timestamp(offset + 0.5), format_timestamp(offset + 1.0), f"first {len(chunk)}"),
+            (format_timestamp(offset + 2.0), format_timestamp(offset + 3.5), f"second {len(chunk)}")
+        ]
+    assert [entry.index for entry in entries] == list(range(1, 7))
+    assert [(entry.start_time, entry.end_time, entry.text) for entry in entries] == expected
+    assert progress[-1] == pytest.approx(180.0)
+
+def test_concurrent_files_get_a_worker_each_on_cpu(monkeypatch):
+    monkeypatch.setattr(parallel_transcriber.torch.cuda, "is_available", lambda: False)
+    assert parallel_transcriber.transcription_workers(1, 3) == 3
+    assert parallel_transcriber.transcription_workers(4, 2) == 4
+
+    monkeypatch.setattr(parallel_transcriber.torch.cuda, "is_available", lambda: True)
+    assert parallel_transcriber.transcription_workers(1, 3) == 1
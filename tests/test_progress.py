@@ -0,0 +1,43 @@
+from domain.interfaces import ProcessingStatus
+from application.progress import StageProgress, format_duration
+
+def test_stage_progress_maps_fraction_into_stage_span():
+    events = []
+    progress = StageProgress(
+        events.append, ProcessingStatus.TRANSCRIBING, "Transcribing audio...",
+        total=100.0, unit="s", min_interval=0
+    )
+    progress.start()
+    progress.update(50.0)
+    progress.update(100.0)
+
+    assert [round(result.progress, 3) for result in events] == [0.33, 0.495, 0.66]
+    assert events[1].event.fraction == 0.5
+    assert events[1].event.done == 50.0
+    assert events[-1].event.eta_seconds == 0.0
+
+def test_stage_progress_throttles_but_always_reports_completion():
+    events = []
+    progress = StageProgress(
+        events.append, ProcessingStatus.TRANSLATING, "Translating subtitles...",
+        total=10, unit="subtitles", min_interval=60
+    )
+    progress.start()
+    for _ in range(10):
+        progress.advance(1)
+
+    assert len(events) == 2
+    assert events[-1].event.fraction == 1.0
+
+def test_stage_progress_without_total():
+    events = []
+    progress = StageProgress(events.append, ProcessingStatus.EXTRACTING, "Extracting audio...", total=None, unit="s")
+    progress.start()
+
+    assert events[0].event.fraction is None
+    assert events[0].progress == 0.0
+
+def test_format_duration():
+    assert format_duration(45) == "45s"
+    assert format_duration(192) == "3m12s"
+    assert format_duration(3900) == "1h05m"
@@ -0,0 +1,107 @@
+import asyncio
+import json
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from infrastructure.resilience import (
+    CircuitBreaker, CircuitOpenError, RemoteCallGuard, RetryPolicy, TokenBucket
+)
+
+class StubTranslationServer:
+    """Local HTTP translation endpoint that fails the first `failures` requests"""
+
+    def __init__(self, failures=0, status=503):
+        self.failures = failures
+        self.requests = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                server.requests += 1
+                texts = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+                if server.requests <= server.failures:
+                    self.send_response(status)
+                    self.end_headers()
+                    return
+                body = json.dumps([text.upper() for text in texts]).encode()
+                self.send_response(200)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/translate"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    async def translate(self, texts):
+        def post():
+            request = urllib.request.Request(self.url, data=json.dumps(texts).encode(), method='POST')
+            with urllib.request.urlopen(request, timeout=5) as response:
+                return json.loads(response.read())
+        return await asyncio.get_running_loop().run_in_executor(None, post)
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+@pytest.fixture
+def fast_retry():
+    return RetryPolicy(attempts=4, base_delay=0.001, max_delay=0.01)
+
+@pytest.mark.asyncio
+async def test_transient_errors_are_retried(fast_retry):
+    server = StubTranslationServer(failures=2)
+    try:
+        guard = RemoteCallGuard('stub', retry=fast_retry, breaker=CircuitBreaker(failure_threshold=5))
+        result = await guard.call(lambda: server.translate(["a", "b"]), segments=2)
+    finally:
+        server.close()
+
+    assert result == ["A", "B"]
+    assert server.requests == 3
+    assert guard.metrics.retries == 2
+    assert guard.metrics.retried_segments == 4
+
+@pytest.mark.asyncio
+async def test_circuit_opens_and_stops_calling_a_failing_backend(fast_retry):
+    server = StubTranslationServer(failures=100, status=500)
+    try:
+        guard = RemoteCallGuard(
+            'stub', retry=fast_retry, breaker=CircuitBreaker(failure_threshold=2, reset_timeout=60)
+        )
+        with pytest.raises(CircuitOpenError):
+            await guard.call(lambda: server.translate(["a"]))
+        with pytest.raises(CircuitOpenError):
+            await guard.call(lambda: server.translate(["a"]))
+    finally:
+        server.close()
+
+    # Two failures opened the circuit; later calls never reached the server
+    assert server.requests == 2
+    assert guard.metrics.circuit_opened == 1
+    assert not guard.healthy
+
+def test_circuit_lets_a_probe_through_after_reset_timeout():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    assert breaker.record_failure()
+    assert not breaker.allow() and not breaker.available()
+    time.sleep(0.06)
+    assert breaker.available()
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.allow() and not breaker.is_open
+
+@pytest.mark.asyncio
+async def test_token_bucket_smooths_bursts_to_the_rate():
+    bucket = TokenBucket(rate=100.0, capacity=1)
+    start = time.monotonic()
+    for _ in range(6):
+        await bucket.acquire()
+    # One token up front, five more at 10 ms each
+    assert time.monotonic() - start >= 0.045
@@ -0,0 +1,43 @@
+import json
+import pytest
+from infrastructure.scratch_space import ScratchSpace, ScratchQuotaExceeded, OWNER_FILE
+
+def test_same_named_videos_get_separate_files_removed_on_close(tmp_path):
+    space = ScratchSpace(tmp_path / "scratch")
+    first = tmp_path / "a" / "intro.mp4"
+    second = tmp_path / "b" / "intro.mp4"
+    for path, content in ((first, b"first"), (second, b"second")):
+        path.parent.mkdir()
+        path.write_bytes(content)
+
+    with space.job() as job_a, space.job() as job_b:
+        path_a = job_a.path_for(first, ".wav")
+        path_b = job_b.path_for(second, ".wav")
+        path_a.write_bytes(b"pcm")
+        path_b.write_bytes(b"pcm")
+        assert path_a != path_b
+        assert path_a.parent != path_b.parent
+
+    assert not path_a.exists() and not path_b.exists()
+    assert not any((tmp_path / "scratch").iterdir())
+
+def test_quota_rejects_files_that_would_not_fit(tmp_path):
+    space = ScratchSpace(tmp_path / "scratch", quota_bytes=1000)
+    video_path = tmp_path / "talk.mp4"
+    video_path.write_bytes(b"video")
+
+    with space.job() as job:
+        job.path_for(video_path, ".wav", expected_bytes=500).write_bytes(b"x" * 500)
+        with pytest.raises(ScratchQuotaExceeded):
+            job.path_for(video_path, ".wav", expected_bytes=600, variant="other")
+
+def test_directories_of_dead_processes_are_swept(tmp_path):
+    root = tmp_path / "scratch"
+    stale = root / "job-999999999-dead"
+    stale.mkdir(parents=True)
+    (stale / OWNER_FILE).write_text(json.dumps({"pid": 999999999, "created": 0}))
+    (stale / "left_over.wav").write_bytes(b"pcm")
+
+    ScratchSpace(root)
+
+    assert not stale.exists()
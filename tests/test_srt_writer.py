@@ -0,0 +1,13 @@
+from infrastructure.srt_writer import format_timestamp, parse_timestamp
+
+def test_format_timestamp_rounds_to_the_nearest_millisecond():
+    assert format_timestamp(1.001) == "00:00:01,001"
+    assert format_timestamp(3661.9996) == "01:01:02,000"
+    assert format_timestamp(0.0) == "00:00:00,000"
+
+def test_shifted_timestamps_survive_a_round_trip():
+    for ms in range(0, 7_200_000, 997):
+        timestamp = format_timestamp(ms / 1000)
+        assert format_timestamp(parse_timestamp(timestamp)) == timestamp
+        shifted = format_timestamp(parse_timestamp(timestamp) + 30.0)
+        assert round(parse_timestamp(shifted) * 1000) == ms + 30_000
@@ -0,0 +1,12 @@
+import time
+from infrastructure.startup_profile import StartupProfile
+
+def test_report_orders_phases_by_cost():
+    profile = StartupProfile(budget_seconds=10.0)
+    profile.mark("fast")
+    time.sleep(0.02)
+    profile.mark("slow")
+
+    report = profile.report()
+    assert report.index("slow=") < report.index("fast=")
+    assert profile.total >= 0.02
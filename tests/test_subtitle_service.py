@@ -1,4 +1,7 @@
 import pytest
+from pathlib import Path
+from unittest.mock import Mock
+from domain.interfaces import SubtitleEntry, ProcessingStatus
 from application.subtitle_service import SubtitleService
 
 @pytest.mark.asyncio
@@ -42,3 +45,356 @@ async def test_subtitle_service_error_handling(
     assert result.status == ProcessingStatus.ERROR
     assert result.progress == 0.0
     assert "Test error" in result.message
+
+@pytest.mark.asyncio
+async def test_subtitle_service_pipelined_matches_sequential(
+    mock_video_processor,
+    mock_translator,
+    tmp_path,
+    translator_registry
+):
+    import numpy as np
+    pytest.importorskip("torch")
+    pytest.importorskip("whisper")
+    from domain.interfaces import AUDIO_SAMPLE_RATE
+    from infrastructure.transcriber import WhisperTranscriber
+
+    video_path = tmp_path / "test.mp4"
+    video_path.write_bytes(b"")
+    # Speech with pauses, long enough for several windows
+    samples = np.random.default_rng(0).uniform(-0.5, 0.5, 80 * AUDIO_SAMPLE_RATE).astype(np.float32)
+    for pause in (18.0, 41.0, 63.0):
+        samples[int(pause * AUDIO_SAMPLE_RATE):int((pause + 0.5) * AUDIO_SAMPLE_RATE)] = 0.0
+
+    def transcribe_window(window, options):
+        # Two segments per window, so each window's words stay together
+        seconds = len(window) / AUDIO_SAMPLE_RATE
+        return {"language": "en", "segments": [
+            {"start": 0.0, "end": seconds / 2, "text": f"first half of {len(window)}"},
+            {"start": seconds / 2, "end": seconds, "text": f"second half of {len(window)}"}
+        ]}
+
+    calls = []
+
+    async def translate(subtitles, target_language, source_language=None):
+        calls.append(len(subtitles))
+        return [
+            SubtitleEntry(s.index, s.start_time, s.end_time, s.text.upper())
+            for s in subtitles
+        ]
+
+    results = []
+    for pipelined in (False, True):
+        calls.clear()
+        transcriber = WhisperTranscriber(window_seconds=20.0)
+        transcriber._load_audio_file = lambda path: samples
+        transcriber._transcribe_window = transcribe_window
+        service = SubtitleService(
+            mock_video_processor,
+            transcriber,
+            mock_translator,
+            pipelined=pipelined,
+            translators=translator_registry
+        )
+        service.translators['GoogleTrans'] = Mock(translate=translate)
+        results.append(await service.process_video(video_path, "es", source_language="en"))
+
+    sequential, pipelined = results
+    assert sequential.status == pipelined.status == ProcessingStatus.COMPLETED
+    assert len(sequential.subtitles) == 8
+    assert pipelined.subtitles == sequential.subtitles
+    assert {'extraction', 'transcription', 'translation'} <= set(pipelined.stage_timings)
+    # Workers drain the queue into micro-batches instead of one call per segment
+    assert sum(calls) == 8 and len(calls) < 8
+
+@pytest.mark.asyncio
+async def test_subtitle_service_reuses_cached_transcript(
+    mock_video_processor,
+    mock_transcriber,
+    mock_translator,
+    tmp_path,
+    translator_registry
+):
+    from infrastructure.transcript_cache import TranscriptCache
+
+    video_path = tmp_path / "test.mp4"
+    video_path.write_bytes(b"video")
+    mock_transcriber.describe_settings.return_value = {"model": "base"}
+    service = SubtitleService(
+        mock_video_processor,
+        mock_transcriber,
+        mock_translator,
+        transcript_cache=TranscriptCache(tmp_path / "transcripts"),
+        translators=translator_registry
+    )
+    service.translators['GoogleTrans'] = mock_translator
+
+    first = await service.process_video(video_path, "es")
+    second = await service.process_video(video_path, "fr")
+
+    assert first.status == second.status == ProcessingStatus.COMPLETED
+    assert mock_video_processor.extract_audio.call_count == 1
+    assert mock_transcriber.transcribe.call_count == 1
+    assert mock_translator.translate.call_count == 2
+
+@pytest.mark.asyncio
+async def test_subtitle_service_multi_language_transcribes_once(
+    mock_video_processor,
+    mock_transcriber,
+    mock_translator,
+    tmp_path,
+    translator_registry
+):
+    video_path = tmp_path / "talk.mp4"
+    video_path.write_bytes(b"")
+
+    async def translate(subtitles, target_language, source_language=None):
+        return [
+            SubtitleEntry(s.index, s.start_time, s.end_time, f"[{target_language}] {s.text}")
+            for s in subtitles
+        ]
+
+    service = SubtitleService(mock_video_processor, mock_transcriber, mock_translator, translators=translator_registry)
+    service.translators['GoogleTrans'] = Mock(translate=translate)
+
+    results = await service.process_video_multi(video_path, ["es", "fr"])
+
+    assert mock_transcriber.transcribe.call_count == 1
+    assert results["fr"].subtitles[0].text == "[fr] Test subtitle"
+    assert (tmp_path / "talk.es.srt").read_text(encoding="utf-8").startswith("1\n00:00:01,000 --> ")
+    assert (tmp_path / "talk.fr.srt").exists()
+
+@pytest.mark.asyncio
+async def test_subtitle_service_detects_source_language_once(
+    mock_video_processor,
+    mock_transcriber,
+    mock_translator,
+    tmp_path,
+    translator_registry
+):
+    video_path = tmp_path / "talk.mp4"
+    video_path.write_bytes(b"video")
+    mock_transcriber.detect_language.return_value = "de"
+    service = SubtitleService(mock_video_processor, mock_transcriber, mock_translator, translators=translator_registry)
+    service.translators['GoogleTrans'] = mock_translator
+
+    await service.process_video(video_path, "es")
+    await service.process_video(video_path, "fr")
+
+    assert mock_transcriber.detect_language.call_count == 1
+    options = mock_transcriber.transcribe.call_args.args[1]
+    assert options.language == "de"
+    assert mock_translator.translate.call_args.kwargs["source_language"] == "de"
+
+@pytest.mark.asyncio
+async def test_subtitle_service_known_source_language_skips_detection(
+    mock_video_processor,
+    mock_transcriber,
+    mock_translator,
+    tmp_path,
+    translator_registry
+):
+    video_path = tmp_path / "talk.mp4"
+    video_path.write_bytes(b"video")
+    service = SubtitleService(mock_video_processor, mock_transcriber, mock_translator, translators=translator_registry)
+    service.translators['GoogleTrans'] = mock_translator
+
+    result = await service.process_video(video_path, "es", source_language="en")
+
+    assert result.status == ProcessingStatus.COMPLETED
+    mock_transcriber.detect_language.assert_not_called()
+    assert mock_transcriber.transcribe.call_args.args[1].language == "en"
+
+@pytest.mark.asyncio
+async def test_subtitle_service_resumes_cancelled_job_from_checkpoint(
+    mock_video_processor,
+    mock_transcriber,
+    mock_translator,
+    tmp_path,
+    translator_registry
+):
+    import asyncio
+    from domain.entities import CancellationToken
+    from infrastructure.checkpoints import CheckpointStore
+
+    video_path = tmp_path / "talk.mp4"
+    video_path.write_bytes(b"video")
+    mock_transcriber.describe_settings.return_value = {"model": "base"}
+
+    def extract_audio(video_path, media=None, progress_callback=None, time_range=None, output_path=None):
+        audio_path = output_path or tmp_path / "extracted.wav"
+        audio_path.write_bytes(b"RIFF")
+        return audio_path
+
+    mock_video_processor.extract_audio.side_effect = extract_audio
+    streamed = []
+
+    async def transcribe_stream(audio, options=None, media=None, progress_callback=None):
+        for i in range(1, 46):
+            streamed.append(i)
+            yield SubtitleEntry(i, "00:00:01,000", "00:00:02,000", f"line {i}")
+            progress_callback(float(i))
+
+    mock_transcriber.transcribe_stream = transcribe_stream
+    token = CancellationToken()
+    translated = []
+
+    async def translate(subtitles, target_language, source_language=None):
+        if not token.cancelled and translated:
+            # Cancel while the second slice is in flight
+            token.cancel()
+            await asyncio.sleep(10)
+        translated.extend(s.index for s in subtitles)
+        return [SubtitleEntry(s.index, s.start_time, s.end_time, s.text.upper()) for s in subtitles]
+
+    service = SubtitleService(
+        mock_video_processor,
+        mock_transcriber,
+        mock_translator,
+        translation_workers=1,
+        checkpoints=CheckpointStore(tmp_path / "checkpoints"),
+        translators=translator_registry
+    )
+    service.translators['GoogleTrans'] = Mock(translate=translate)
+
+    cancelled = await service.process_video(video_path, "es", cancel_token=token)
+    assert cancelled.status == ProcessingStatus.CANCELLED
+    assert translated == list(range(1, 21))
+
+    resumed = await service.process_video(video_path, "es")
+
+    assert resumed.status == ProcessingStatus.COMPLETED
+    assert [s.text for s in resumed.subtitles] == [f"LINE {i}" for i in range(1, 46)]
+    # Neither extraction, transcription nor the first slice ran again
+    assert mock_video_processor.extract_audio.call_count == 1
+    assert streamed == list(range(1, 46))
+    assert translated == list(range(1, 46))
+    assert not any((tmp_path / "checkpoints").iterdir())
+
+@pytest.mark.asyncio
+async def test_subtitle_service_captions_time_range_on_full_timeline(
+    mock_video_processor,
+    mock_transcriber,
+    mock_translator,
+    tmp_path,
+    translator_registry
+):
+    from domain.interfaces import TimeRange
+
+    video_path = tmp_path / "lecture.mp4"
+    video_path.write_bytes(b"video")
+    mock_transcriber.describe_settings.return_value = {"model": "base"}
+    service = SubtitleService(mock_video_processor, mock_transcriber, mock_translator, translators=translator_registry)
+    service.translators['GoogleTrans'] = Mock(translate=lambda subtitles, *args, **kwargs: _identity(subtitles))
+
+    result = await service.process_video(video_path, "es", time_range=TimeRange(30.0, 45.0))
+
+    assert result.status == ProcessingStatus.COMPLETED
+    assert mock_video_processor.extract_audio.call_args.kwargs["time_range"] == TimeRange(30.0, 45.0)
+    # Progress and ETA cover the clip, timestamps the whole recording
+    assert mock_transcriber.transcribe.call_args.kwargs["media"].duration == 15.0
+    assert (result.subtitles[0].start_time, result.subtitles[0].end_time) == ("00:00:31,000", "00:00:32,000")
+
+@pytest.mark.asyncio
+async def test_subtitle_service_detects_language_at_the_time_range(
+    mock_video_processor,
+    mock_transcriber,
+    mock_translator,
+    tmp_path,
+    translator_registry
+):
+    from domain.interfaces import TimeRange
+    from infrastructure.transcript_cache import TranscriptCache
+
+    video_path = tmp_path / "lecture.mp4"
+    video_path.write_bytes(b"video")
+    cache = TranscriptCache(tmp_path / "transcripts")
+    cache.put_language(video_path, "en")
+    mock_transcriber.detect_language.return_value = "de"
+    service = SubtitleService(
+        mock_video_processor, mock_transcriber, mock_translator,
+        transcript_cache=cache, translators=translator_registry
+    )
+
+    clip = TimeRange(600.0, 900.0)
+    language, options = await service._resolve_source_language(video_path, None, None, {}, clip)
+    whole, _ = await service._resolve_source_language(video_path, None, None, {})
+
+    assert (language, options.language) == ("de", "de")
+    assert mock_transcriber.detect_language.call_args.kwargs["time_range"] == clip
+    # The intro's language stays cached for runs over the whole recording
+    assert whole == "en"
+    assert cache.get_language(video_path) == "en"
+
+async def _identity(subtitles):
+    return subtitles
+
+@pytest.mark.asyncio
+async def test_subtitle_service_routes_progress_per_call(
+    mock_video_processor,
+    mock_transcriber,
+    mock_translator,
+    tmp_path,
+    translator_registry
+):
+    video_path = tmp_path / "talk.mp4"
+    video_path.write_bytes(b"video")
+    shared = Mock()
+    service = SubtitleService(
+        mock_video_processor,
+        mock_transcriber,
+        mock_translator,
+        shared,
+        translators=translator_registry
+    )
+    service.translators['GoogleTrans'] = mock_translator
+    job_progress = []
+
+    result = await service.process_video(video_path, "es", progress_callback=job_progress.append)
+
+    assert result.status == ProcessingStatus.COMPLETED
+    assert job_progress and not shared.called
+    assert service.progress_callback is shared
+
+def test_subtitle_service_clips_media_of_unknown_duration():
+    from domain.interfaces import MediaInfo, TimeRange
+
+    unknown = MediaInfo(duration=0.0, audio_codec="aac", audio_stream_index=1)
+    assert SubtitleService._clip_media(unknown, TimeRange(0.0, None)).duration == 0.0
+    assert SubtitleService._clip_media(unknown, TimeRange(10.0, 25.0)).duration == 15.0
+
+    known = MediaInfo(duration=60.0, audio_codec="aac", audio_stream_index=1)
+    assert SubtitleService._clip_media(known, TimeRange(50.0, None)).duration == 10.0
+    with pytest.raises(ValueError):
+        SubtitleService._clip_media(known, TimeRange(60.0, None))
+
+@pytest.mark.asyncio
+async def test_subtitle_service_pipeline_does_not_checkpoint_short_results(
+    mock_video_processor,
+    mock_transcriber,
+    mock_translator,
+    tmp_path,
+    caplog
+):
+    from infrastructure.checkpoints import JobCheckpoint
+
+    async def transcribe_stream(audio, options=None, media=None, progress_callback=None):
+        for i in range(1, 4):
+            yield SubtitleEntry(i, "00:00:01,000", "00:00:02,000", f"line {i}")
+        progress_callback(3.0)
+
+    async def translate(subtitles, target_language, source_language=None):
+        return []
+
+    mock_transcriber.transcribe_stream = transcribe_stream
+    checkpoint = JobCheckpoint(tmp_path / "job")
+    service = SubtitleService(mock_video_processor, mock_transcriber, mock_translator, pipelined=True)
+
+    _, translated = await service._run_pipeline(
+        tmp_path / "audio.wav", Mock(translate=translate), "es", {},
+        checkpoint=checkpoint, checkpoint_key="google:en:es"
+    )
+
+    assert [entry.text for entry in translated] == ["line 1", "line 2", "line 3"]
+    assert checkpoint.load_translations("google:en:es") == {}
+    assert "results for" in caplog.text
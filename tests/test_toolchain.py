@@ -0,0 +1,38 @@
+import os
+import subprocess
+import sys
+import pytest
+from infrastructure.toolchain import Toolchain
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="uses a shell script as the fake binary")
+
+@pytest.fixture
+def fake_ffmpeg(tmp_path, monkeypatch):
+    binary = tmp_path / "ffmpeg"
+    binary.write_text("#!/bin/sh\necho 'ffmpeg version 9.9-test Copyright'\n")
+    binary.chmod(0o755)
+    monkeypatch.setenv("FFMPEG_BINARY", str(binary))
+    return binary
+
+def test_toolchain_validates_once_and_reuses_cache(fake_ffmpeg, tmp_path, monkeypatch):
+    cache_path = tmp_path / "toolchain.json"
+
+    info = Toolchain(cache_path).find("ffmpeg")
+    assert info.path == str(fake_ffmpeg)
+    assert info.version == "9.9-test"
+
+    # A later launch must not run the binary again
+    def fail(*args, **kwargs):
+        raise AssertionError("binary re-validated")
+    monkeypatch.setattr(subprocess, "run", fail)
+    assert Toolchain(cache_path).path("ffmpeg") == str(fake_ffmpeg)
+
+def test_toolchain_revalidates_when_binary_changes(fake_ffmpeg, tmp_path):
+    cache_path = tmp_path / "toolchain.json"
+    Toolchain(cache_path).find("ffmpeg")
+
+    fake_ffmpeg.write_text("#!/bin/sh\necho 'ffmpeg version 10.0 Copyright'\n")
+    stat = fake_ffmpeg.stat()
+    os.utime(fake_ffmpeg, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert Toolchain(cache_path).find("ffmpeg").version == "10.0"
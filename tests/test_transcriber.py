@@ -0,0 +1,117 @@
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+whisper = pytest.importorskip("whisper")
+
+from types import SimpleNamespace
+from domain.interfaces import AUDIO_SAMPLE_RATE, TimeRange
+from infrastructure import transcriber as transcriber_module
+from infrastructure.transcriber import WhisperTranscriber, load_whisper_model
+
+def test_int8_model_quantizes_whisper_linear_layers(monkeypatch):
+    model = torch.nn.Sequential(
+        whisper.model.Linear(8, 8),
+        torch.nn.Sequential(whisper.model.Linear(8, 4))
+    )
+    monkeypatch.setattr(whisper, "load_model", lambda name, device=None: model)
+
+    quantized = load_whisper_model("tiny", quantize_int8=True)
+
+    dynamic_linear = torch.ao.nn.quantized.dynamic.Linear
+    layers = [module for module in quantized.modules() if isinstance(module, dynamic_linear)]
+    assert len(layers) == 2
+    assert not any(type(module) is whisper.model.Linear for module in quantized.modules())
+
+
+def fake_window_decoder(transcriber, calls):
+    def transcribe_window(window, options):
+        calls.append(len(window))
+        seconds = len(window) / AUDIO_SAMPLE_RATE
+        return {"language": "en", "segments": [{"start": 0.0, "end": seconds, "text": "speech"}]}
+    transcriber._transcribe_window = transcribe_window
+
+def speech_with_pauses(pause_at_seconds, total_seconds):
+    rng = np.random.default_rng(0)
+    samples = rng.uniform(-0.5, 0.5, int(total_seconds * AUDIO_SAMPLE_RATE)).astype(np.float32)
+    for pause in pause_at_seconds:
+        start = int(pause * AUDIO_SAMPLE_RATE)
+        samples[start:start + AUDIO_SAMPLE_RATE // 2] = 0.0
+    return samples
+
+async def stream_of(samples, chunk_seconds=1.3):
+    step = int(chunk_seconds * AUDIO_SAMPLE_RATE)
+    for start in range(0, len(samples), step):
+        yield samples[start:start + step]
+
+@pytest.mark.asyncio
+async def test_windows_are_cut_at_pauses_whatever_the_input():
+    samples = speech_with_pauses([18.0, 41.0, 63.0], 80)
+    results = []
+    for audio in (samples, stream_of(samples)):
+        transcriber = WhisperTranscriber(window_seconds=20.0)
+        calls = []
+        fake_window_decoder(transcriber, calls)
+        entries = await transcriber.transcribe(audio)
+        results.append((calls, entries))
+
+    (buffer_calls, buffer_entries), (stream_calls, stream_entries) = results
+    assert stream_calls == buffer_calls
+    assert stream_entries == buffer_entries
+    # Every cut lands inside one of the pauses
+    cuts = np.cumsum(buffer_calls)[:-1] / AUDIO_SAMPLE_RATE
+    assert len(cuts) == 3
+    assert all(any(pause <= cut <= pause + 0.5 for pause in (18.0, 41.0, 63.0)) for cut in cuts)
+
+@pytest.mark.asyncio
+async def test_transcribe_matches_transcribe_stream():
+    samples = speech_with_pauses([18.0, 41.0], 60)
+    transcriber = WhisperTranscriber(window_seconds=20.0)
+    fake_window_decoder(transcriber, [])
+
+    entries = await transcriber.transcribe(samples)
+
+    assert entries == [entry async for entry in transcriber.transcribe_stream(samples)]
+    assert [entry.index for entry in entries] == [1, 2, 3]
+
+@pytest.mark.asyncio
+async def test_transcribe_reports_progress_after_every_window():
+    samples = speech_with_pauses([18.0, 41.0], 60)
+    transcriber = WhisperTranscriber(window_seconds=20.0)
+    calls = []
+    fake_window_decoder(transcriber, calls)
+    progress = []
+
+    await transcriber.transcribe(samples, progress_callback=lambda seconds: progress.append((seconds, len(calls))))
+
+    # Each update arrives as soon as its window is decoded, long before the file is done
+    assert [decoded for _, decoded in progress] == [1, 2, 3]
+    assert [seconds for seconds, _ in progress] == sorted(seconds for seconds, _ in progress)
+    assert progress[0][0] == pytest.approx(18.0, abs=0.6)
+    assert progress[-1][0] == pytest.approx(60.0)
+
+@pytest.mark.asyncio
+async def test_language_is_detected_from_the_start_of_the_time_range(monkeypatch, tmp_path):
+    commands = []
+
+    def run(cmd, **kwargs):
+        commands.append(cmd)
+        return SimpleNamespace(stdout=np.ones(AUDIO_SAMPLE_RATE, np.int16).tobytes())
+
+    monkeypatch.setattr(transcriber_module.subprocess, "run", run)
+    transcriber = WhisperTranscriber()
+    heard = []
+    monkeypatch.setattr(transcriber, "_detect_window", lambda samples, options: heard.append(samples) or "de")
+
+    language = await transcriber.detect_language(tmp_path / "talk.mp4", time_range=TimeRange(600.0, 610.0))
+    buffer = np.arange(700 * AUDIO_SAMPLE_RATE, dtype=np.float32)
+    await transcriber.detect_language(buffer, time_range=TimeRange(600.0, None))
+
+    assert language == "de"
+    cmd = commands[0]
+    # Seek in the input, and only for the clip's 10 s
+    assert cmd.index("-ss") < cmd.index("-i")
+    assert cmd[cmd.index("-ss") + 1] == "600.0"
+    assert cmd[cmd.index("-t") + 1] == "10.0"
+    assert heard[1][0] == 600 * AUDIO_SAMPLE_RATE
+    assert len(heard[1]) == 30 * AUDIO_SAMPLE_RATE
@@ -0,0 +1,76 @@
+import os
+import time
+from domain.interfaces import SubtitleEntry
+from infrastructure.transcript_cache import TranscriptCache, main
+
+SETTINGS = {"model": "base"}
+
+def subtitles(text="hello"):
+    return [SubtitleEntry(1, "00:00:01,000", "00:00:02,000", text)]
+
+def cached_video(cache, tmp_path, name, text="hello", language=None):
+    video = tmp_path / name
+    video.write_bytes(name.encode())
+    key = cache.make_key(video, SETTINGS)
+    cache.put(key, subtitles(text), video, SETTINGS)
+    if language:
+        cache.put_language(video, language)
+    return video, key
+
+def age(cache, key, days):
+    past = time.time() - days * 86400
+    os.utime(cache.cache_dir / f"{key}.json", (past, past))
+
+def test_changed_video_misses_the_cache(tmp_path):
+    cache = TranscriptCache(tmp_path / "cache")
+    video, key = cached_video(cache, tmp_path, "talk.mp4")
+    assert cache.get(key) == subtitles()
+
+    # Touching the file alone changes the fingerprint
+    os.utime(video, ns=(0, 1_000_000_000))
+    assert cache.make_key(video, SETTINGS) != key
+
+    video.write_bytes(b"re-encoded")
+    assert cache.get(cache.make_key(video, SETTINGS)) is None
+    assert cache.make_key(video, {"model": "small"}) != cache.make_key(video, SETTINGS)
+
+def test_prune_by_age_and_size_drops_orphaned_languages(tmp_path):
+    cache = TranscriptCache(tmp_path / "cache")
+    old_video, old_key = cached_video(cache, tmp_path, "old.mp4", language="de")
+    lru_video, lru_key = cached_video(cache, tmp_path, "lru.mp4", "x" * 500, language="fr")
+    new_video, new_key = cached_video(cache, tmp_path, "new.mp4", language="es")
+    age(cache, old_key, 30)
+    age(cache, lru_key, 2)
+
+    assert cache.prune(max_age_days=7) == 1
+    assert cache.get_language(old_video) is None
+    assert cache.get_language(lru_video) == "fr"
+
+    assert cache.prune(max_total_bytes=(cache.cache_dir / f"{new_key}.json").stat().st_size) == 1
+    assert cache.get(lru_key) is None and cache.get_language(lru_video) is None
+    assert cache.get(new_key) == subtitles() and cache.get_language(new_video) == "es"
+
+    assert cache.clear() == 1
+    assert list(cache.cache_dir.iterdir()) == []
+
+def test_cli_lists_shows_prunes_and_clears(tmp_path, capsys):
+    cache_dir = tmp_path / "cache"
+    cache = TranscriptCache(cache_dir)
+    _, old_key = cached_video(cache, tmp_path, "old.mp4", "old words")
+    _, key = cached_video(cache, tmp_path, "new.mp4", "new words")
+    age(cache, old_key, 30)
+
+    assert main(["--cache-dir", str(cache_dir), "list"]) == 0
+    listing = capsys.readouterr().out
+    assert "2 transcripts" in listing and "new.mp4" in listing
+
+    assert main(["--cache-dir", str(cache_dir), "show", key[:12]]) == 0
+    assert "00:00:01,000 --> 00:00:02,000\nnew words" in capsys.readouterr().out
+    assert main(["--cache-dir", str(cache_dir), "show", "zzz"]) == 1
+
+    assert main(["--cache-dir", str(cache_dir), "prune", "--older-than", "7"]) == 0
+    assert "Removed 1 transcripts" in capsys.readouterr().out
+
+    assert main(["--cache-dir", str(cache_dir), "clear"]) == 0
+    assert "Removed 1 transcripts" in capsys.readouterr().out
+    assert cache.entries() == []
@@ -0,0 +1,16 @@
+import pytest
+from infrastructure.transcription_benchmark import word_error_rate
+
+def test_word_error_rate_ignores_case_and_punctuation():
+    assert word_error_rate("Hello, world!", "hello world") == 0.0
+
+def test_word_error_rate_counts_edits():
+    reference = "the quick brown fox jumps"
+    # One substitution, one deletion
+    assert word_error_rate(reference, "the quick red fox") == pytest.approx(2 / 5)
+    # Insertions can push WER above 1
+    assert word_error_rate("yes", "yes no maybe") == pytest.approx(2.0)
+
+def test_word_error_rate_empty_reference():
+    assert word_error_rate("", "") == 0.0
+    assert word_error_rate("", "noise") == 1.0
@@ -0,0 +1,48 @@
+import asyncio
+import pytest
+from infrastructure.translation_batcher import TranslationBatcher
+
+def test_pack_respects_char_budget():
+    texts = ["aaaa", "bbbb", "cccc", "dd"]
+    batches = TranslationBatcher.pack(texts, max_batch_chars=8, max_batch_items=10)
+    assert batches == [[0, 1], [2, 3]]
+
+def test_pack_respects_item_limit_and_oversized_text():
+    texts = ["x" * 20, "a", "b", "c"]
+    batches = TranslationBatcher.pack(texts, max_batch_chars=10, max_batch_items=2)
+    assert batches == [[0], [1, 2], [3]]
+
+@pytest.mark.asyncio
+async def test_translate_maps_results_back_in_order():
+    in_flight = 0
+    peak = 0
+
+    async def translate_batch(batch):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return [text.upper() for text in batch]
+
+    texts = [f"line {i}" for i in range(20)]
+    batcher = TranslationBatcher(translate_batch, max_batch_chars=14, max_concurrency=3)
+
+    results = await batcher.translate(texts)
+
+    assert results == [text.upper() for text in texts]
+    assert peak <= 3
+
+@pytest.mark.asyncio
+async def test_translate_keeps_originals_on_short_response():
+    async def translate_batch(batch):
+        return batch[:-1]
+
+    batcher = TranslationBatcher(translate_batch)
+    assert await batcher.translate(["one", "two"]) == ["one", "two"]
+
+def test_join_and_split_round_trip():
+    joined = TranslationBatcher.join(["a", "b\nc"])
+    assert joined == "a\nb c"
+    assert TranslationBatcher.split(" A \n B C\n", 2) == ["A", "B C"]
+    assert TranslationBatcher.split("A B C", 2) is None
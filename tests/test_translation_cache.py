@@ -0,0 +1,76 @@
+import pytest
+from domain.interfaces import SubtitleEntry
+from infrastructure.translation_cache import TranslationCache
+
+def test_key_ignores_whitespace_but_not_language_or_backend():
+    key = TranslationCache.make_key("Hello  world ", "en", "es", "google")
+    assert key == TranslationCache.make_key("Hello world", "en", "es", "google")
+    assert key != TranslationCache.make_key("Hello world", "en", "fr", "google")
+    assert key != TranslationCache.make_key("Hello world", "en", "es", "argos")
+
+def test_hits_misses_and_persistence(tmp_path):
+    db_path = tmp_path / "cache.sqlite3"
+    cache = TranslationCache(db_path)
+    cache.put_many({"a": "uno"})
+
+    assert cache.get_many(["a", "b"]) == {"a": "uno"}
+    assert cache.stats() == {"hits": 1, "misses": 1, "entries": 1}
+
+    reopened = TranslationCache(db_path)
+    assert reopened.get_many(["a"]) == {"a": "uno"}
+
+def test_lru_eviction_keeps_recently_used(tmp_path):
+    cache = TranslationCache(tmp_path / "cache.sqlite3", max_entries=2)
+    cache.put_many({"a": "1"})
+    cache.put_many({"b": "2"})
+    cache.get_many(["a"])
+    cache.put_many({"c": "3"})
+
+    assert set(cache.get_many(["a", "b", "c"])) == {"a", "c"}
+
+@pytest.mark.asyncio
+async def test_translate_entries_deduplicates_backend_calls(tmp_path):
+    cache = TranslationCache(tmp_path / "cache.sqlite3")
+    calls = []
+
+    async def translate(pending):
+        calls.append([entry.text for entry in pending])
+        return [SubtitleEntry(e.index, e.start_time, e.end_time, e.text.upper()) for e in pending]
+
+    subtitles = [
+        SubtitleEntry(1, "00:00:01,000", "00:00:02,000", "intro"),
+        SubtitleEntry(2, "00:00:02,000", "00:00:03,000", "intro"),
+        SubtitleEntry(3, "00:00:03,000", "00:00:04,000", "outro"),
+    ]
+
+    first = await cache.translate_entries(subtitles, "en", "es", "google", translate)
+    second = await cache.translate_entries(subtitles, "en", "es", "google", translate)
+
+    assert [s.text for s in first] == ["INTRO", "INTRO", "OUTRO"]
+    assert second == first
+    assert calls == [["intro", "outro"]]
+
+@pytest.mark.asyncio
+async def test_translate_entries_keeps_sqlite_off_the_event_loop(tmp_path):
+    import threading
+
+    threads = []
+
+    class RecordingCache(TranslationCache):
+        def get_many(self, keys):
+            threads.append(threading.get_ident())
+            return super().get_many(keys)
+
+        def put_many(self, items):
+            threads.append(threading.get_ident())
+            super().put_many(items)
+
+    async def translate(pending):
+        return [SubtitleEntry(e.index, e.start_time, e.end_time, e.text.upper()) for e in pending]
+
+    cache = RecordingCache(tmp_path / "cache.sqlite3")
+    subtitles = [SubtitleEntry(1, "00:00:01,000", "00:00:02,000", "intro")]
+    await cache.translate_entries(subtitles, "en", "es", "google", translate)
+
+    assert len(threads) == 2
+    assert threading.get_ident() not in threads
@@ -0,0 +1,37 @@
+import asyncio
+import threading
+import time
+import pytest
+from infrastructure.translation_executor import TranslationExecutor
+
+@pytest.mark.asyncio
+async def test_calls_run_on_a_bounded_dedicated_pool():
+    executor = TranslationExecutor(max_workers=2)
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def blocking(value, scale=1):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+        return threading.current_thread().name, value * scale
+
+    try:
+        results = await asyncio.gather(*(executor.run(blocking, i, scale=10) for i in range(6)))
+    finally:
+        executor.shutdown()
+
+    assert [value for _, value in results] == [i * 10 for i in range(6)]
+    assert all(name.startswith("translate") for name, _ in results)
+    assert peak == 2
+
+def test_configure_resizes_the_shared_pool():
+    first = TranslationExecutor.configure(3)
+    assert TranslationExecutor.configure(3) is first
+    second = TranslationExecutor.configure(5)
+    assert TranslationExecutor.shared() is second and second.max_workers == 5
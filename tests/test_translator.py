@@ -0,0 +1,163 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import Mock
+from domain.entities import SubtitleEntry
+from infrastructure.resilience import CircuitBreaker, RetryPolicy
+from infrastructure.translation_cache import TranslationCache
+from infrastructure.translator import GoogleTranslatorService
+from infrastructure.translator_registry import BackendSpec, TranslatorRegistry
+
+class FlakyClient:
+    """googletrans stand-in that fails every request while down"""
+
+    def __init__(self, down=True, merge_lines=False, fail_on=None):
+        self.down = down
+        self.merge_lines = merge_lines
+        # Requests containing this word always fail
+        self.fail_on = fail_on
+        self.requests = []
+
+    @property
+    def calls(self):
+        return len(self.requests)
+
+    def translate(self, text, dest, src):
+        self.requests.append(text)
+        if self.down or (self.fail_on and self.fail_on in text):
+            raise ConnectionError("429 Too Many Requests")
+        lines = [f"{dest}:{line}" for line in text.split("\n")]
+        # Some responses lose line breaks, e.g. when sentences get merged
+        return SimpleNamespace(text=" ".join(lines) if self.merge_lines else "\n".join(lines))
+
+def entries(*texts):
+    return [SubtitleEntry(i, "00:00:00,000", "00:00:01,000", text) for i, text in enumerate(texts, 1)]
+
+def make_service(tmp_path, client, fallback=None, **kwargs):
+    return GoogleTranslatorService(
+        cache=TranslationCache(tmp_path / "cache.sqlite3"),
+        fallback=fallback,
+        client=client,
+        **{
+            "retry": RetryPolicy(attempts=2, base_delay=0.001),
+            "breaker": CircuitBreaker(failure_threshold=10),
+            **kwargs
+        }
+    )
+
+@pytest.mark.asyncio
+async def test_unhealthy_google_fails_over_and_counts_segments(tmp_path):
+    async def fallback_translate(subtitles, target_language, source_language=None):
+        return [SubtitleEntry(s.index, s.start_time, s.end_time, f"argos:{s.text}") for s in subtitles]
+
+    fallback = Mock(translate=fallback_translate)
+    service = make_service(tmp_path, FlakyClient(), fallback=lambda: fallback)
+
+    result = await service.translate(entries("hello", "world", "hello"), "de")
+
+    assert [entry.text for entry in result] == ["argos:hello", "argos:world", "argos:hello"]
+    assert service.metrics.retries == 1
+    assert service.metrics.fallback_segments == 3
+
+@pytest.mark.asyncio
+async def test_failed_segments_are_not_cached(tmp_path):
+    client = FlakyClient()
+    service = make_service(tmp_path, client)
+
+    first = await service.translate(entries("hello"), "de")
+    assert first[0].text == "hello"
+    assert service.metrics.failed_segments == 1
+
+    client.down = False
+    second = await service.translate(entries("hello"), "de")
+    assert second[0].text == "de:hello"
+
+@pytest.mark.asyncio
+async def test_each_batch_is_one_request(tmp_path):
+    client = FlakyClient(down=False)
+    service = make_service(tmp_path, client)
+
+    result = await service.translate(entries("one", "two", "three"), "de")
+
+    assert [entry.text for entry in result] == ["de:one", "de:two", "de:three"]
+    assert client.requests == ["one\ntwo\nthree"]
+
+@pytest.mark.asyncio
+async def test_unsplittable_response_falls_back_per_chunk(tmp_path):
+    client = FlakyClient(down=False, merge_lines=True)
+    service = make_service(tmp_path, client)
+
+    result = await service.translate(entries("one", "two"), "de")
+
+    assert [entry.text for entry in result] == ["de:one", "de:two"]
+    assert client.requests == ["one\ntwo", "one", "two"]
+
+@pytest.mark.asyncio
+async def test_partly_failed_subtitle_fails_over_and_is_not_cached(tmp_path):
+    async def fallback_translate(subtitles, target_language, source_language=None):
+        return [SubtitleEntry(s.index, s.start_time, s.end_time, f"argos:{s.text}") for s in subtitles]
+
+    # One chunk per request, so only the "bad" half of the first subtitle fails
+    client = FlakyClient(down=False, fail_on="bad")
+    fallback = Mock(translate=fallback_translate)
+    service = make_service(tmp_path, client, fallback=lambda: fallback, chunk_size=12, max_batch_chars=10)
+
+    result = await service.translate(entries("good words bad words", "fine"), "de")
+
+    assert [entry.text for entry in result] == ["argos:good words bad words", "de:fine"]
+    assert service.metrics.fallback_segments == 1
+
+    client.fail_on = None
+    again = await service.translate(entries("good words bad words"), "de")
+    assert again[0].text == "de:good words de:bad words"
+
+@pytest.mark.asyncio
+async def test_auto_routes_back_to_google_after_reset_timeout(tmp_path):
+    import asyncio
+
+    client = FlakyClient()
+    google = make_service(tmp_path, client, breaker=CircuitBreaker(failure_threshold=1, reset_timeout=0.05))
+    argos = Mock(supports=Mock(return_value=True))
+    registry = TranslatorRegistry([
+        BackendSpec('GoogleTrans', lambda spec, registry: google, chars_per_second=5000.0),
+        BackendSpec('Argos Translate', lambda spec, registry: argos, chars_per_second=1500.0)
+    ])
+
+    await google.translate(entries("hello"), "de")
+    assert registry.route('en', 'de') == 'Argos Translate'
+
+    await asyncio.sleep(0.06)
+    assert registry.route('en', 'de') == 'GoogleTrans'
+
+    client.down = False
+    result = await google.translate(entries("hello"), "de")
+    assert result[0].text == "de:hello"
+    assert registry.route('en', 'de') == 'GoogleTrans'
+
+@pytest.mark.asyncio
+async def test_hung_requests_stay_on_googles_own_threads(tmp_path):
+    import asyncio
+    import threading
+    from infrastructure.translation_executor import TranslationExecutor
+
+    release = threading.Event()
+    started = []
+
+    class HangingClient:
+        def translate(self, text, dest, src):
+            started.append(text)
+            release.wait(5)
+            return SimpleNamespace(text=text)
+
+    service = make_service(
+        tmp_path, HangingClient(), timeout=0.05, max_concurrency=2,
+        retry=RetryPolicy(attempts=3, base_delay=0.001)
+    )
+    try:
+        result = await service.translate(entries("hello"), "de")
+        assert result[0].text == "hello"
+        # The third attempt was dropped while both threads were still stuck
+        assert len(started) == 2
+        assert await asyncio.wait_for(TranslationExecutor.shared().run(lambda: "free"), 1) == "free"
+    finally:
+        release.set()
+        service.executor.shutdown()
@@ -0,0 +1,53 @@
+import pytest
+from unittest.mock import Mock
+from infrastructure.translator_registry import BackendSpec, TranslatorRegistry
+
+def backend(name, speed, supported=True, **kwargs):
+    translator = Mock()
+    translator.supports.return_value = supported
+    factory = Mock(return_value=translator)
+    return BackendSpec(name, factory, chars_per_second=speed, **kwargs)
+
+def test_backends_are_built_once_on_first_use():
+    slow = backend('Slow', 10.0, aliases=('S',))
+    unused = BackendSpec('Unused', Mock(side_effect=AssertionError))
+    registry = TranslatorRegistry([slow, unused])
+
+    assert 'Slow' in registry and registry.loaded() == []
+    first = registry['Slow']
+    assert registry['S'] is first
+    assert slow.factory.call_count == 1
+    assert registry.loaded() == ['Slow']
+
+def test_assigned_instances_and_unknown_names():
+    registry = TranslatorRegistry.default()
+    fake = Mock()
+    registry['GoogleTrans'] = fake
+
+    assert registry['GoogleTrans'] is fake
+    assert 'Argos' in registry
+    with pytest.raises(KeyError):
+        registry['Missing']
+
+def test_shared_registry_refuses_overrides():
+    with pytest.raises(TypeError):
+        TranslatorRegistry.shared()['GoogleTrans'] = Mock()
+
+def test_router_picks_fastest_supporting_backend():
+    fast = backend('Fast', 100.0, supported=False)
+    medium = backend('Medium', 50.0)
+    slow = backend('Slow', 10.0)
+    registry = TranslatorRegistry([slow, fast, medium])
+
+    assert registry.route('en', 'fr') == 'Medium'
+    # The slowest backend is never constructed
+    assert slow.factory.call_count == 0
+
+    # Measured throughput overrides the declared estimate
+    registry.record('Slow', chars=10_000, seconds=1.0)
+    assert registry.route('en', 'fr') == 'Slow'
+
+def test_router_fails_when_nothing_supports_the_pair():
+    registry = TranslatorRegistry([backend('Only', 1.0, supported=False)])
+    with pytest.raises(LookupError):
+        registry.route('en', 'xx')
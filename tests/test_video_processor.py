@@ -0,0 +1,103 @@
+import asyncio
+import sys
+import pytest
+from domain.interfaces import MediaInfo, TimeRange
+from infrastructure.video_processor import MoviePyVideoProcessor
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="uses a shell script as the fake binary")
+
+def fake_ffmpeg(tmp_path, body):
+    binary = tmp_path / "ffmpeg"
+    binary.write_text("#!/bin/sh\n" + body)
+    binary.chmod(0o755)
+    return str(binary)
+
+@pytest.mark.asyncio
+async def test_extract_audio_reports_progress_from_ffmpeg(tmp_path):
+    video_path = tmp_path / "talk.mp4"
+    video_path.write_bytes(b"video")
+    processor = MoviePyVideoProcessor()
+    processor.ffmpeg_path = fake_ffmpeg(tmp_path, (
+        'for last; do :; done\n'
+        'echo "out_time_us=500000"\n'
+        'echo "harmless warning" >&2\n'
+        ': > "$last"\n'
+        'echo "out_time_us=1500000"\n'
+        'echo "progress=end"\n'
+    ))
+    positions = []
+
+    audio_path = await processor.extract_audio(video_path, progress_callback=positions.append)
+
+    assert audio_path.exists()
+    assert positions == [0.5, 1.5]
+
+@pytest.mark.asyncio
+async def test_extract_audio_kills_stalled_ffmpeg(tmp_path):
+    video_path = tmp_path / "talk.mp4"
+    video_path.write_bytes(b"video")
+    processor = MoviePyVideoProcessor(stall_timeout=0.2)
+    processor.ffmpeg_path = fake_ffmpeg(tmp_path, "exec sleep 30\n")
+
+    with pytest.raises(RuntimeError, match="no progress"):
+        await asyncio.wait_for(processor.extract_audio(video_path), 5)
+
+@pytest.mark.asyncio
+async def test_extractions_share_a_per_loop_limit(tmp_path, monkeypatch):
+    video_path = tmp_path / "talk.mp4"
+    video_path.write_bytes(b"video")
+    processor = MoviePyVideoProcessor(max_concurrent_extractions=2)
+    processor.ffmpeg_path = "ffmpeg"
+    running = 0
+    peak = 0
+
+    async def run_ffmpeg(ffmpeg_cmd, progress_callback):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.05)
+        open(ffmpeg_cmd[-1], 'wb').close()
+        running -= 1
+
+    monkeypatch.setattr(processor, "_run_ffmpeg", run_ffmpeg)
+    await asyncio.gather(*(processor.extract_audio(video_path) for _ in range(5)))
+
+    assert peak == 2
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("media, time_range, expected", [
+    # Already 16 kHz mono PCM: remux only
+    (MediaInfo(60.0, "pcm_s16le", 16000, 1, audio_stream_index=0, video_stream_index=1), None, ["-acodec", "copy"]),
+    # Anything else is decoded and resampled
+    (MediaInfo(60.0, "aac", 48000, 2, audio_stream_index=1, video_stream_index=0), None, ["-ar", "16000"]),
+    # A range seeks on the input before decoding
+    (MediaInfo(60.0, "aac", 48000, 2, audio_stream_index=1, video_stream_index=0), TimeRange(10.0, 25.0),
+     ["-ss", "10.000", "-t", "15.000", "-i"]),
+])
+async def test_extract_audio_picks_cheapest_command(tmp_path, monkeypatch, media, time_range, expected):
+    video_path = tmp_path / "talk.mp4"
+    video_path.write_bytes(b"video")
+    processor = MoviePyVideoProcessor()
+    processor.ffmpeg_path = "ffmpeg"
+    commands = []
+
+    async def run_ffmpeg(ffmpeg_cmd, progress_callback):
+        commands.append(ffmpeg_cmd)
+        open(ffmpeg_cmd[-1], 'wb').close()
+
+    monkeypatch.setattr(processor, "_run_ffmpeg", run_ffmpeg)
+    await processor.extract_audio(video_path, media=media, time_range=time_range)
+
+    command = commands[0]
+    start = command.index(expected[0])
+    assert command[start:start + len(expected)] == expected
+
+@pytest.mark.asyncio
+async def test_audio_only_input_skips_extraction(tmp_path):
+    audio_path = tmp_path / "podcast.mp3"
+    audio_path.write_bytes(b"audio")
+    processor = MoviePyVideoProcessor()
+    processor.ffmpeg_path = "ffmpeg"
+
+    media = MediaInfo(600.0, "mp3", 44100, 2, audio_stream_index=0)
+    assert await processor.extract_audio(audio_path, media=media) == audio_path